@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark for the Psycho-Noir Runner Logging System
+
+Runs the full aggregate -> classify -> learn -> report pipeline over
+synthetic CI logs of several sizes and error densities, timing every stage
+separately and recording its throughput and peak traced memory.
+
+Results are appended to a JSON history (same entry layout as the
+repository's benchmark_history.json: id, run_id, metrics, ts) so runs can
+be compared across revisions.
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+RUNNER_LOGGING_ROOT = Path(__file__).resolve().parent.parent
+for component in ("log-aggregator", "error-classifier", "intelligence-engine", "reporting"):
+    sys.path.insert(0, str(RUNNER_LOGGING_ROOT / component))
+
+from psycho_noir_aggregator import PsychoNoirLogAggregator
+from psycho_noir_classifier import PsychoNoirErrorClassifier
+from psycho_noir_intelligence import PsychoNoirIntelligenceEngine
+from psycho_noir_reports import PsychoNoirReportGenerator
+from benchmark_matcher import generate_synthetic_log
+
+DEFAULT_SIZES = [10_000, 100_000, 500_000]
+DEFAULT_DENSITIES = [0.01, 0.05, 0.2]
+DEFAULT_HISTORY = Path(__file__).resolve().parent / "benchmark_history.json"
+
+class PipelineRun:
+    """One pass of the pipeline over a log, with every stage kept as a callable."""
+
+    def __init__(self, log_content: str, workdir: Path):
+        self.log_content = log_content
+        self.workdir = workdir
+        self.session_id = "benchmark"
+        self.exported = None
+        self.classification = None
+        self.intelligence = None
+
+    def stages(self) -> List[Tuple[str, Callable[[], None]]]:
+        return [
+            ("aggregate", self.aggregate),
+            ("classify", self.classify),
+            ("learn", self.learn),
+            ("report", self.report),
+        ]
+
+    def aggregate(self):
+        aggregator = PsychoNoirLogAggregator(str(self.workdir / "logs"))
+        aggregator.create_session(self.session_id, "benchmark", {"synthetic": True})
+        aggregator.add_log_content(self.session_id, self.log_content, "synthetic")
+        aggregator.finalize_session(self.session_id)
+        self.exported = aggregator.export_for_classification(self.session_id)
+
+    def classify(self):
+        classifier = PsychoNoirErrorClassifier()
+        self.classification = classifier.classify_log_content(self.exported, {"session_type": "benchmark"})
+
+    def learn(self):
+        engine = PsychoNoirIntelligenceEngine(str(self.workdir / "intelligence"))
+        result = engine.process_classification_result(self.classification, {"session_type": "benchmark"})
+        self.intelligence = dict(result, intelligence_status=engine.get_intelligence_status())
+
+    def report(self):
+        # The report CLI is fed JSON, so hand it the serialized classification
+        classification_history = [json.loads(json.dumps(self.classification, default=lambda level: level.value))]
+        generator = PsychoNoirReportGenerator(str(self.workdir / "reports"))
+        generator.generate_comprehensive_report(self.intelligence, classification_history)
+
+def _run_pipeline(log_content: str, trace_memory: bool) -> Dict[str, Dict]:
+    """Run every stage in a fresh working directory; returns per-stage timings."""
+    workdir = Path(tempfile.mkdtemp(prefix="psycho-noir-bench-"))
+    results = {}
+
+    try:
+        run = PipelineRun(log_content, workdir)
+        for stage, execute in run.stages():
+            if trace_memory:
+                tracemalloc.start()
+
+            started = time.perf_counter()
+            execute()
+            seconds = time.perf_counter() - started
+
+            results[stage] = {"seconds": seconds}
+            if trace_memory:
+                results[stage]["memory_peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+                tracemalloc.stop()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results
+
+def benchmark_scenario(line_count: int, error_density: float, measure_memory: bool = True) -> Dict:
+    """Time each stage untraced, then (optionally) re-run it under tracemalloc for peak memory."""
+    log_content = generate_synthetic_log(line_count, error_density)
+    log_bytes = len(log_content.encode('utf-8'))
+
+    timings = _run_pipeline(log_content, trace_memory=False)
+    memory = _run_pipeline(log_content, trace_memory=True) if measure_memory else {}
+
+    metrics = {"lines": line_count, "error_density": error_density, "log_mb": round(log_bytes / (1024 * 1024), 2)}
+    for stage, timing in timings.items():
+        seconds = timing["seconds"]
+        metrics[f"{stage}_ms"] = round(seconds * 1000, 1)
+        metrics[f"{stage}_lines_per_s"] = round(line_count / max(seconds, 1e-9))
+        if stage in memory:
+            metrics[f"{stage}_memory_peak_mb"] = round(memory[stage]["memory_peak_mb"], 1)
+
+    total_seconds = sum(timing["seconds"] for timing in timings.values())
+    metrics["total_ms"] = round(total_seconds * 1000, 1)
+    metrics["total_mb_per_s"] = round(log_bytes / (1024 * 1024) / max(total_seconds, 1e-9), 2)
+    return metrics
+
+def _revision() -> str:
+    """Short git revision of the working tree, or "unknown" outside a checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RUNNER_LOGGING_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def load_history(history_path: Path) -> List[Dict]:
+    if not history_path.exists():
+        return []
+    with open(history_path, 'r') as f:
+        return json.load(f)
+
+def compare_with_previous(history: List[Dict], entry: Dict) -> Dict:
+    """Relative change of each stage timing against the last run of the same scenario."""
+    previous = next((old for old in reversed(history) if old["id"] == entry["id"]), None)
+    if previous is None:
+        return {}
+
+    return {
+        key: round((value - previous["metrics"][key]) / previous["metrics"][key], 3)
+        for key, value in entry["metrics"].items()
+        if key.endswith("_ms") and previous["metrics"].get(key)
+    }
+
+def main():
+    """Command-line interface for the pipeline benchmark."""
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print("Usage: python pipeline_benchmark.py [sizes] [densities] [history_file] [--no-memory]")
+        print("  sizes      comma-separated line counts (default 10000,100000,500000)")
+        print("  densities  comma-separated error densities (default 0.01,0.05,0.2)")
+        sys.exit(0)
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    measure_memory = "--no-memory" not in sys.argv
+    sizes = [int(size) for size in args[0].split(",")] if len(args) > 0 else DEFAULT_SIZES
+    densities = [float(density) for density in args[1].split(",")] if len(args) > 1 else DEFAULT_DENSITIES
+    history_path = Path(args[2]) if len(args) > 2 else DEFAULT_HISTORY
+
+    history = load_history(history_path)
+    revision = _revision()
+    run_started = int(time.time() * 1000)
+
+    for line_count in sizes:
+        for error_density in densities:
+            scenario_id = f"pipeline/lines={line_count}/density={error_density}"
+            metrics = benchmark_scenario(line_count, error_density, measure_memory)
+            entry = {
+                "id": scenario_id,
+                "run_id": f"{revision}-{run_started}-{scenario_id}",
+                "metrics": metrics,
+                "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+            }
+
+            print(json.dumps({
+                "id": scenario_id,
+                "metrics": metrics,
+                "change_vs_previous": compare_with_previous(history, entry)
+            }, indent=2))
+            history.append(entry)
+
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, 'w') as f:
+        json.dump(history, f, indent=2)
+    print(f"Benchmark history updated: {history_path}")
+
+if __name__ == "__main__":
+    main()
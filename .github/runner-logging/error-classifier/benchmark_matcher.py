@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Matcher Benchmark for the Psycho-Noir Error Classifier
+
+Compares the compiled single-pass SignatureMatcher against the original
+sequential per-signature re.search loop on a synthetic CI log, and verifies
+that both engines produce identical classification results.
+"""
+
+import json
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Tuple
+
+from psycho_noir_classifier import PsychoNoirErrorClassifier
+
+SYNTHETIC_LINES = [
+    "Step 4/12 : RUN npm ci --prefer-offline",
+    "added 1423 packages in 31s",
+    "Collecting requests>=2.31 (from -r requirements.txt (line 3))",
+    "INFO: compiling module psycho_noir_core",
+    "  PASSED tests/test_core.py::test_interaction",
+    "Downloading https://registry.npmjs.org/typescript/-/typescript-5.4.5.tgz",
+]
+
+SYNTHETIC_ERRORS = [
+    "npm ERR! code ENOENT",
+    "ModuleNotFoundError: No module named 'numpy'",
+    "FAILED tests/test_api.py::test_status - assertion failed: 200 != 500",
+    "ERROR: connection refused while contacting registry",
+    "Error: permission denied opening /var/run/docker.sock",
+    "warning: unexpected token in config",
+    "All 214 tests passed",
+    "Build successful in 42s",
+]
+
+def generate_synthetic_log(line_count: int, error_density: float = 0.02, seed: int = 1337) -> str:
+    """Generate a reproducible synthetic CI log with the given error density."""
+    rng = random.Random(seed)
+    lines = []
+    for index in range(line_count):
+        if rng.random() < error_density:
+            lines.append(rng.choice(SYNTHETIC_ERRORS))
+        else:
+            lines.append(f"[{index:08d}] {rng.choice(SYNTHETIC_LINES)}")
+    return "\n".join(lines)
+
+def _time_engine(engine: str, log_content: str) -> Tuple[float, Dict]:
+    """Classify the log with a fresh classifier using the given matcher engine."""
+    classifier = PsychoNoirErrorClassifier(matcher_engine=engine)
+    started = time.perf_counter()
+    result = classifier.classify_log_content(log_content)
+    return time.perf_counter() - started, result
+
+def _comparable(result: dict) -> dict:
+    """Strip non-deterministic fields so results from both engines can be compared."""
+    return {
+        "classification_level": result["classification_level"].value,
+        "matched_signatures": result["matched_signatures"],
+        "unclassified_anomalies": result["unclassified_anomalies"],
+    }
+
+def main():
+    """Command-line interface for the matcher benchmark."""
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    error_density = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+
+    log_content = generate_synthetic_log(line_count, error_density)
+
+    sequential_seconds, sequential_result = _time_engine("sequential", log_content)
+    compiled_seconds, compiled_result = _time_engine("compiled", log_content)
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "lines": line_count,
+        "error_density": error_density,
+        "sequential_seconds": round(sequential_seconds, 3),
+        "compiled_seconds": round(compiled_seconds, 3),
+        "speedup": round(sequential_seconds / max(compiled_seconds, 1e-9), 2),
+        "sequential_lines_per_second": round(line_count / max(sequential_seconds, 1e-9)),
+        "compiled_lines_per_second": round(line_count / max(compiled_seconds, 1e-9)),
+        "results_identical": _comparable(sequential_result) == _comparable(compiled_result),
+    }
+    print(json.dumps(report, indent=2))
+
+    if not report["results_identical"]:
+        print("Error: compiled matcher diverged from the sequential loop")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
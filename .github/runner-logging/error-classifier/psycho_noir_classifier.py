@@ -15,10 +15,13 @@ building patterns and responses that improve future runs.
 """
 
 import json
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Iterable, Iterator
 from enum import Enum
 
 class ClassificationLevel(Enum):
@@ -47,6 +50,56 @@ class ErrorSignature:
         # Increase learning weight based on frequency (psycho-noir: patterns strengthen)
         self.learning_weight = min(10.0, 1.0 + (self.occurrence_count * 0.1))
 
+class SignatureMatcher:
+    """
+    Single-pass matcher over an ordered list of ErrorSignatures.
+    
+    Every pattern is compiled once. Patterns made of plain literals joined by
+    ``.*`` (all of the built-in signatures) also get a literal prefilter: a
+    line is only handed to a signature's regex when each of its literals is a
+    substring of the casefolded line. Most CI output matches nothing, so the
+    typical line costs a handful of C-level substring checks instead of one
+    case-insensitive regex scan per signature. Signatures are still tried in
+    list order, so the first match wins exactly as in the sequential loop.
+    """
+    
+    def __init__(self, signatures: List[ErrorSignature]):
+        self.signatures = list(signatures)
+        self._checks = []
+        
+        for signature in self.signatures:
+            compiled = re.compile(signature.pattern, re.IGNORECASE)
+            literals = self._required_literals(signature.pattern) or ("",)
+            self._checks.append((signature, compiled, literals[0], literals[1:]))
+    
+    @staticmethod
+    def _required_literals(pattern: str) -> Optional[Tuple[str, ...]]:
+        """Return casefolded literals every match must contain, or None if unknown."""
+        segments = pattern.split(".*")
+        # Only plain ASCII literals: their casefolded form is exactly what
+        # re.IGNORECASE would accept, so the prefilter can never reject a match
+        if any(not segment or not segment.isascii()
+               or re.escape(segment).replace("\\ ", " ") != segment
+               for segment in segments):
+            return None
+        # Longest literal first: it is the most selective substring check
+        return tuple(sorted((segment.casefold() for segment in segments), key=len, reverse=True))
+    
+    def match(self, line: str) -> Optional[ErrorSignature]:
+        """Return the first signature (in list order) that matches the line."""
+        folded = line.casefold()
+        
+        for signature, compiled, anchor, literals in self._checks:
+            # The empty anchor of an unfiltered pattern is always "in" the line
+            if anchor not in folded:
+                continue
+            if literals and not all(literal in folded for literal in literals):
+                continue
+            if compiled.search(line):
+                return signature
+        
+        return None
+
 class PsychoNoirErrorClassifier:
     """
     Main error classification engine.
@@ -55,11 +108,17 @@ class PsychoNoirErrorClassifier:
     where each error becomes part of the system's evolving intelligence.
     """
     
-    def __init__(self):
+    def __init__(self, matcher_engine: str = "compiled"):
         self.error_signatures = self._initialize_error_signatures()
         self.classified_errors = []
         self.intelligence_data = {}
         
+        # "compiled" uses SignatureMatcher, "sequential" keeps the original
+        # per-signature re.search loop (reference path for benchmarks)
+        self.matcher_engine = matcher_engine
+        self._matcher = None
+        self._matcher_key = None
+        
     def _initialize_error_signatures(self) -> List[ErrorSignature]:
         """Initialize known error patterns with psycho-noir themed categorization."""
         return [
@@ -100,6 +159,74 @@ class PsychoNoirErrorClassifier:
         
         Returns a structured classification with bidirectional learning data.
         """
+        line_events = self._scan_lines(log_content.split('\n'))
+        return self._build_classification(line_events, context)
+    
+    def classify_log_file(self, log_file_path: str, context: Dict = None,
+                          workers: int = None, chunk_bytes: int = 8 * 1024 * 1024) -> Dict:
+        """
+        Classify a log file, scanning newline-aligned chunks across a process pool.
+        
+        The file is memory-mapped and split into chunks of roughly
+        ``chunk_bytes`` that always end on a newline. Each worker only scans
+        its chunk for matching/anomalous lines; the per-chunk results are then
+        replayed in file order, so occurrence counts, learning weights and the
+        result schema are exactly those of ``classify_log_content`` on the
+        whole file. Line endings are translated like a text-mode read
+        (``\\r\\n`` and bare ``\\r`` end a line).
+        """
+        workers = workers or os.cpu_count() or 1
+        
+        with open(log_file_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if workers <= 1 or file_size <= chunk_bytes:
+                log_content = _universal_newlines(f.read().decode('utf-8', errors='replace'))
+                return self.classify_log_content(log_content, context)
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                chunk_ranges = _newline_aligned_ranges(mapped, file_size, chunk_bytes)
+        
+        signature_specs = [(sig.pattern, sig.level.name, sig.category) 
+                           for sig in self.error_signatures]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results = executor.map(
+                _scan_log_chunk,
+                [log_file_path] * len(chunk_ranges),
+                [start for start, _ in chunk_ranges],
+                [end for _, end in chunk_ranges],
+                [signature_specs] * len(chunk_ranges),
+                [self.matcher_engine] * len(chunk_ranges)
+            )
+            line_events = [event for chunk_events in chunk_results for event in chunk_events]
+        
+        return self._build_classification(line_events, context)
+    
+    def _scan_lines(self, lines: Iterable[str]) -> Iterator[Tuple[Optional[int], str]]:
+        """
+        Yield (signature_index, line) for every matching line and
+        (None, line) for every unclassified anomaly; other lines are skipped.
+        """
+        match_line = self._get_line_matcher()
+        signature_index = {id(sig): index for index, sig in enumerate(self.error_signatures)}
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            
+            signature = match_line(line)
+            if signature is not None:
+                yield signature_index[id(signature)], line
+            
+            # Capture unclassified anomalies for learning
+            elif any(keyword in line.lower() for keyword in 
+                     ['error', 'fail', 'exception', 'warn', 'critical']):
+                yield None, line
+    
+    def _build_classification(self, line_events: Iterable[Tuple[Optional[int], str]],
+                              context: Dict = None) -> Dict:
+        """Fold scanned line events, in log order, into a classification result."""
         if context is None:
             context = {}
             
@@ -112,46 +239,34 @@ class PsychoNoirErrorClassifier:
             "context": context
         }
         
-        # Process each line for pattern matching
-        lines = log_content.split('\n')
         highest_severity = ClassificationLevel.GREEN
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            matched = False
-            for signature in self.error_signatures:
-                if re.search(signature.pattern, line, re.IGNORECASE):
-                    signature.update_occurrence()
-                    matched = True
-                    
-                    match_data = {
-                        "line": line,
-                        "pattern": signature.pattern,
-                        "category": signature.category,
-                        "level": signature.level.value,
-                        "learning_weight": signature.learning_weight,
-                        "occurrence_count": signature.occurrence_count
-                    }
-                    classification_result["matched_signatures"].append(match_data)
-                    
-                    # Update overall severity
-                    if signature.level.value == "ERROR" and highest_severity != ClassificationLevel.RED:
-                        highest_severity = ClassificationLevel.RED
-                    elif signature.level.value == "WARNING" and highest_severity == ClassificationLevel.GREEN:
-                        highest_severity = ClassificationLevel.YELLOW
-                    
-                    break
-            
-            # Capture unclassified anomalies for learning
-            if not matched and any(keyword in line.lower() for keyword in 
-                                 ['error', 'fail', 'exception', 'warn', 'critical']):
+        for index, line in line_events:
+            if index is None:
                 classification_result["unclassified_anomalies"].append({
                     "line": line,
                     "potential_new_signature": True
                 })
+                continue
+            
+            signature = self.error_signatures[index]
+            signature.update_occurrence()
+            
+            match_data = {
+                "line": line,
+                "pattern": signature.pattern,
+                "category": signature.category,
+                "level": signature.level.value,
+                "learning_weight": signature.learning_weight,
+                "occurrence_count": signature.occurrence_count
+            }
+            classification_result["matched_signatures"].append(match_data)
+            
+            # Update overall severity
+            if signature.level.value == "ERROR" and highest_severity != ClassificationLevel.RED:
+                highest_severity = ClassificationLevel.RED
+            elif signature.level.value == "WARNING" and highest_severity == ClassificationLevel.GREEN:
+                highest_severity = ClassificationLevel.YELLOW
         
         classification_result["classification_level"] = highest_severity
         
@@ -162,6 +277,26 @@ class PsychoNoirErrorClassifier:
         
         return classification_result
     
+    def _get_line_matcher(self):
+        """Return a callable mapping a line to its first matching signature (or None)."""
+        if self.matcher_engine == "sequential":
+            return self._match_line_sequential
+        
+        # Rebuild the compiled matcher whenever the signature list changes
+        matcher_key = tuple((id(sig), sig.pattern) for sig in self.error_signatures)
+        if self._matcher is None or matcher_key != self._matcher_key:
+            self._matcher = SignatureMatcher(self.error_signatures)
+            self._matcher_key = matcher_key
+        
+        return self._matcher.match
+    
+    def _match_line_sequential(self, line: str) -> Optional[ErrorSignature]:
+        """Original matcher: try each signature's pattern in order."""
+        for signature in self.error_signatures:
+            if re.search(signature.pattern, line, re.IGNORECASE):
+                return signature
+        return None
+    
     def _generate_intelligence_insights(self, classification_result: Dict) -> Dict:
         """Generate bidirectional intelligence insights from classification data."""
         insights = {
@@ -227,10 +362,42 @@ class PsychoNoirErrorClassifier:
             "intelligence_data": self.intelligence_data
         }
 
+def _universal_newlines(text: str) -> str:
+    """Translate \\r\\n and bare \\r to \\n, as reading the log in text mode would."""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+def _newline_aligned_ranges(mapped: mmap.mmap, file_size: int, 
+                            chunk_bytes: int) -> List[Tuple[int, int]]:
+    """Split a mapped file into (start, end) byte ranges that end on a newline."""
+    ranges = []
+    start = 0
+    while start < file_size:
+        end = mapped.find(b'\n', min(start + chunk_bytes, file_size))
+        end = file_size if end == -1 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+def _scan_log_chunk(log_file_path: str, start: int, end: int,
+                    signature_specs: List[Tuple[str, str, str]],
+                    matcher_engine: str) -> List[Tuple[Optional[int], str]]:
+    """Process-pool worker: scan one byte range of a log file for line events."""
+    classifier = PsychoNoirErrorClassifier(matcher_engine=matcher_engine)
+    classifier.error_signatures = [
+        ErrorSignature(pattern, ClassificationLevel[level], category)
+        for pattern, level, category in signature_specs
+    ]
+    
+    with open(log_file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            chunk = _universal_newlines(mapped[start:end].decode('utf-8', errors='replace'))
+    
+    return list(classifier._scan_lines(chunk.split('\n')))
+
 def main():
     """Command-line interface for error classification."""
     if len(sys.argv) < 2:
-        print("Usage: python error_classifier.py <log_file_path> [context_json]")
+        print("Usage: python error_classifier.py <log_file_path> [context_json] [workers]")
         sys.exit(1)
     
     log_file_path = sys.argv[1]
@@ -242,13 +409,17 @@ def main():
         except json.JSONDecodeError:
             print("Warning: Invalid context JSON provided")
     
+    workers = 1
+    if len(sys.argv) > 3:
+        try:
+            workers = int(sys.argv[3])
+        except ValueError:
+            print("Warning: Invalid worker count, classifying serially")
+    
     classifier = PsychoNoirErrorClassifier()
     
     try:
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-        
-        result = classifier.classify_log_content(log_content, context)
+        result = classifier.classify_log_file(log_file_path, context, workers=workers)
         print(json.dumps(result, indent=2))
         
     except FileNotFoundError:
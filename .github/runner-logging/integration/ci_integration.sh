@@ -17,6 +17,11 @@ STORAGE_PATH="${GITHUB_WORKSPACE:-/tmp}/psycho-noir-logs"
 INTELLIGENCE_PATH="${GITHUB_WORKSPACE:-/tmp}/psycho-noir-intelligence"
 REPORTS_PATH="${GITHUB_WORKSPACE:-/tmp}/psycho-noir-reports"
 
+# Live tail daemon: exit (and finalize) after this many seconds without new lines,
+# and how long tail-stop waits for it to finalize after SIGTERM
+TAIL_IDLE_TIMEOUT="${PSYCHO_NOIR_TAIL_IDLE_TIMEOUT:-900}"
+TAIL_STOP_TIMEOUT="${PSYCHO_NOIR_TAIL_STOP_TIMEOUT:-60}"
+
 # Create required directories
 mkdir -p "$STORAGE_PATH" "$INTELLIGENCE_PATH" "$REPORTS_PATH"
 
@@ -314,6 +319,33 @@ finalize_session() {
     log_intelligent "success" "Session finalized: $session_id"
 }
 
+# Stop a session's live tail daemon and wait until it has finalized the session
+stop_tail() {
+    local session_id="$1"
+    local pid_file="$STORAGE_PATH/live_${session_id}.pid"
+    
+    [[ -f "$pid_file" ]] || return 0
+    local pid
+    pid=$(cat "$pid_file")
+    
+    if kill -0 "$pid" 2>/dev/null; then
+        log_intelligent "info" "Stopping live tail for session: $session_id (pid $pid)"
+        kill -TERM "$pid" 2>/dev/null || true
+        
+        local waited=0
+        while kill -0 "$pid" 2>/dev/null; do
+            if (( waited >= TAIL_STOP_TIMEOUT * 10 )); then
+                log_intelligent "warning" "Live tail $pid did not exit within ${TAIL_STOP_TIMEOUT}s"
+                return 0
+            fi
+            sleep 0.1
+            waited=$((waited + 1))
+        done
+    fi
+    
+    rm -f "$pid_file"
+}
+
 # GitHub Actions integration functions
 setup_github_outputs() {
     local session_id="$1"
@@ -377,12 +409,38 @@ main() {
             capture_log "$session_id" "$log_source" "$log_content"
             ;;
             
+        "tail")
+            local session_id="$1"
+            shift
+            
+            # Follow growing runner logs in the background; RED classifications
+            # are appended to the alerts file as they are detected. The daemon
+            # finalizes the session on tail-stop/process or after going idle.
+            local alerts_file="$STORAGE_PATH/live_${session_id}.jsonl"
+            log_intelligent "info" "Tailing runner logs for session: $session_id"
+            nohup python3 "$LOGGING_ROOT/log-aggregator/psycho_noir_tail.py" \
+                "$session_id" "$@" --storage "$STORAGE_PATH" --finalize \
+                --idle-timeout "$TAIL_IDLE_TIMEOUT" \
+                >> "$alerts_file" 2>> "$STORAGE_PATH/live_${session_id}.log" &
+            echo $! > "$STORAGE_PATH/live_${session_id}.pid"
+            echo "$alerts_file"
+            ;;
+            
+        "tail-stop")
+            local session_id="$1"
+            
+            stop_tail "$session_id"
+            ;;
+            
         "process")
             local session_id="$1"
             local context="${2:-{}}"
             
             log_intelligent "info" "Processing complete intelligence pipeline for session: $session_id"
             
+            # Let a live tail flush and finalize what it followed first
+            stop_tail "$session_id"
+            
             # Step 1: Classify logs
             classification_file=$(classify_logs "$session_id" "$context")
             
@@ -438,6 +496,8 @@ main() {
             echo "Commands:"
             echo "  init <session_id> [runner_type] [context_json]"
             echo "  capture <session_id> <log_source> <log_content>"
+            echo "  tail <session_id> <log_file...>"
+            echo "  tail-stop <session_id>"
             echo "  process <session_id> [context_json]"
             echo "  status"
             echo "  test"
@@ -13,13 +13,17 @@ that emerges from the chaos of errors and builds order through learned patterns.
 import json
 import os
 import pickle
+import sys
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
-from collections import defaultdict, deque
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Any, Iterator
+from collections import Counter, defaultdict, deque
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, asdict
 import hashlib
+import heapq
+import uuid
 
 @dataclass
 class IntelligenceNode:
@@ -35,46 +39,132 @@ class IntelligenceNode:
     metadata: Dict
 
 class NeuralPattern:
-    """Represents a learned pattern in the system consciousness."""
+    """
+    Represents a learned pattern in the system consciousness.
+    
+    Numeric state (weight, last activation, accuracy, reinforcement count)
+    lives in a PatternTable row once the pattern is added to one, so the
+    engine can score every pattern with a single array operation. Temporal
+    decay is applied when the weight is read rather than by sweeping every
+    pattern on each processed log.
+    """
+    
+    STALE_AFTER_DAYS = 7
     
     def __init__(self, pattern_id: str, signature: str, initial_weight: float = 1.0):
         self.pattern_id = pattern_id
         self.signature = signature
-        self.weight = initial_weight
-        self.reinforcement_count = 0
         self.decay_factor = 0.95
-        self.last_activation = datetime.now()
-        self.prediction_accuracy = 0.5  # Start neutral
-        self.associated_outcomes = []
+        
+        # Standalone state until bound to a PatternTable row
+        self._table = None
+        self._row = None
+        self._state = {
+            "base_weight": initial_weight,
+            "last_activation": datetime.now().timestamp(),
+            "prediction_accuracy": 0.5,  # Start neutral
+            "reinforcement_count": 0
+        }
+        self._outcomes = []
+    
+    def _get(self, column: str):
+        if self._table is None:
+            return self._state[column]
+        return getattr(self._table, column)[self._row].item()
+    
+    def _set(self, column: str, value):
+        if self._table is None:
+            self._state[column] = value
+        else:
+            self._table.set_value(self._row, column, value)
+    
+    @property
+    def last_activation(self) -> datetime:
+        return datetime.fromtimestamp(self._get("last_activation"))
+    
+    @last_activation.setter
+    def last_activation(self, value: datetime):
+        self._set("last_activation", value.timestamp())
+    
+    @property
+    def prediction_accuracy(self) -> float:
+        return self._get("prediction_accuracy")
+    
+    @prediction_accuracy.setter
+    def prediction_accuracy(self, value: float):
+        self._set("prediction_accuracy", value)
+    
+    @property
+    def reinforcement_count(self) -> int:
+        return int(self._get("reinforcement_count"))
+    
+    @reinforcement_count.setter
+    def reinforcement_count(self, value: int):
+        self._set("reinforcement_count", value)
+    
+    @property
+    def weight(self) -> float:
+        """Current weight, decayed for every full day past the staleness window."""
+        return self._get("base_weight") * self.decay_factor ** self._stale_days()
+    
+    @weight.setter
+    def weight(self, value: float):
+        self._set("base_weight", value / self.decay_factor ** self._stale_days())
+    
+    @property
+    def associated_outcomes(self) -> List[Dict]:
+        if self._outcomes is None:
+            # Outcome history is decoded from storage on first access
+            self._outcomes = self._table.load_outcomes(self.pattern_id)
+        return self._outcomes
+    
+    @associated_outcomes.setter
+    def associated_outcomes(self, value: List[Dict]):
+        self._outcomes = value
+        self._outcomes_changed()
+    
+    def _outcomes_changed(self):
+        if self._table is not None:
+            self._table.mark_outcomes_dirty(self._row)
+    
+    def _stale_days(self) -> int:
+        days_since_activation = (datetime.now() - self.last_activation).days
+        return max(0, days_since_activation - self.STALE_AFTER_DAYS)
         
     def reinforce(self, outcome_success: bool, context_weight: float = 1.0):
         """Reinforce pattern based on outcome."""
+        # Settle any pending decay before the activation clock resets
+        current_weight = self.weight
         self.reinforcement_count += 1
         self.last_activation = datetime.now()
         
         # Update prediction accuracy based on outcome
         if outcome_success:
             self.prediction_accuracy = min(1.0, self.prediction_accuracy + (0.1 * context_weight))
-            self.weight *= 1.1  # Strengthen successful patterns
+            self.weight = current_weight * 1.1  # Strengthen successful patterns
         else:
             self.prediction_accuracy = max(0.0, self.prediction_accuracy - (0.05 * context_weight))
-            self.weight *= 0.95  # Slightly weaken failed predictions
+            self.weight = current_weight * 0.95  # Slightly weaken failed predictions
         
         self.associated_outcomes.append({
             "timestamp": self.last_activation.isoformat(),
             "success": outcome_success,
             "context_weight": context_weight
         })
+        self._outcomes_changed()
         
         # Keep only recent outcomes (memory management)
         if len(self.associated_outcomes) > 100:
             self.associated_outcomes = self.associated_outcomes[-50:]
     
-    def decay(self):
-        """Apply temporal decay to prevent stale patterns."""
-        time_since_activation = datetime.now() - self.last_activation
-        if time_since_activation > timedelta(days=7):
-            self.weight *= self.decay_factor
+    def decay(self) -> float:
+        """
+        Return the temporally decayed weight.
+        
+        Decay is a pure function of ``last_activation`` and is applied lazily
+        by the ``weight`` property, so there is nothing to sweep.
+        """
+        return self.weight
     
     def get_prediction_confidence(self) -> float:
         """Get current prediction confidence."""
@@ -83,6 +173,648 @@ class NeuralPattern:
         reinforcement_factor = min(1.0, self.reinforcement_count / 10)
         
         return self.prediction_accuracy * recency_factor * reinforcement_factor
+    
+    def to_dict(self) -> Dict:
+        """Convert pattern to dictionary for persistence."""
+        return {
+            "pattern_id": self.pattern_id,
+            "signature": self.signature,
+            "weight": self._get("base_weight"),  # Weight as of last activation
+            "reinforcement_count": self.reinforcement_count,
+            "prediction_accuracy": self.prediction_accuracy,
+            "last_activation": self.last_activation.isoformat(),
+            "associated_outcomes": self.associated_outcomes[-20:]  # Keep recent
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "NeuralPattern":
+        """Restore a pattern from its persisted dictionary."""
+        pattern = cls(data["pattern_id"], data["signature"])
+        pattern._state = {
+            "base_weight": data["weight"],
+            "last_activation": datetime.fromisoformat(data["last_activation"]).timestamp(),
+            "prediction_accuracy": data["prediction_accuracy"],
+            "reinforcement_count": data["reinforcement_count"]
+        }
+        pattern.associated_outcomes = data.get("associated_outcomes", [])
+        return pattern
+
+class PatternTable(Mapping):
+    """
+    Columnar, NumPy-backed table of NeuralPattern state.
+    
+    Behaves like the ``pattern_id -> NeuralPattern`` dict the engine used
+    before, but keeps weight, last activation, accuracy and reinforcement
+    count in parallel arrays. Confidence and decay for all patterns are
+    computed in one vectorized pass, and NeuralPattern objects are only
+    materialized for the rows a classification actually touches.
+    
+    With a journal attached, rows are hydrated the first time the table is
+    used (counting and membership tests only consult the journal index):
+    the columns come from a NumPy checkpoint next to the journal, and only
+    ``pattern`` records appended after it are decoded. Outcome histories
+    stay on disk until a pattern is materialized, and only rows and
+    histories written since the last save are persisted.
+    """
+    
+    COLUMNS = ("base_weight", "last_activation", "prediction_accuracy", "reinforcement_count")
+    CHECKPOINT_MIN_ROWS = 256  # Journaled rows before the checkpoint is rewritten
+    
+    def __init__(self, journal: "IntelligenceJournal" = None, capacity: int = 1024):
+        self.journal = journal
+        self._size = 0
+        self.base_weight = np.zeros(capacity)
+        self.last_activation = np.zeros(capacity)
+        self.prediction_accuracy = np.zeros(capacity)
+        self.reinforcement_count = np.zeros(capacity, dtype=np.int64)
+        
+        self.pattern_ids = []
+        self.signatures = []
+        self._row_of = {}
+        self._patterns = {}  # row -> materialized NeuralPattern
+        self._dirty_rows = set()
+        self._dirty_outcomes = set()  # rows whose outcome history changed
+        self._substring_rows = {}  # substring -> [matching rows, rows scanned]
+        self._hydrated = journal is None
+        
+        self.checkpoint_path = journal.journal_path.with_suffix(".patterns.npz") if journal else None
+        self._checkpoint_id = None  # journal id the checkpoint on disk belongs to
+        self._rows_since_checkpoint = 0
+    
+    def _hydrate(self):
+        """Load every pattern's numeric state (once, on first use)."""
+        if self._hydrated:
+            return
+        self._hydrated = True
+        
+        since = self._load_checkpoint()
+        for pattern_id, data in self.journal.iter_records("pattern", since=since):
+            values = (
+                data["weight"],
+                datetime.fromisoformat(data["last_activation"]).timestamp(),
+                data["prediction_accuracy"],
+                data["reinforcement_count"]
+            )
+            row = self._row_of.get(pattern_id)
+            if row is None:
+                row = self._append_row(pattern_id, data["signature"], values)
+            else:
+                for column, value in zip(self.COLUMNS, values):
+                    getattr(self, column)[row] = value
+            self._dirty_rows.discard(row)
+            self._rows_since_checkpoint += 1
+    
+    def _load_checkpoint(self) -> int:
+        """Load the column checkpoint; returns the journal offset it covers (0 if unusable)."""
+        if not self.checkpoint_path.exists():
+            return 0
+        
+        try:
+            with np.load(self.checkpoint_path) as checkpoint:
+                journal_id, offset = str(checkpoint["journal_id"]), int(checkpoint["journal_offset"])
+                # Compaction moves every record, and a truncated journal may have lost covered ones
+                if journal_id != self.journal.journal_id or offset > self.journal.size:
+                    return 0
+                
+                pattern_ids = checkpoint["pattern_ids"].tolist()
+                self._reserve(len(pattern_ids))
+                for column in self.COLUMNS:
+                    getattr(self, column)[:len(pattern_ids)] = checkpoint[column]
+                self.signatures = checkpoint["signatures"].tolist()
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable pattern checkpoint: {e}", file=sys.stderr)
+            return 0
+        
+        self.pattern_ids = pattern_ids
+        self._row_of = {pattern_id: row for row, pattern_id in enumerate(pattern_ids)}
+        self._size = len(pattern_ids)
+        self._checkpoint_id = journal_id
+        return offset
+    
+    def checkpoint_if_due(self):
+        """
+        Snapshot the columns once enough rows were journaled since the last
+        snapshot (or the journal was compacted), so rewriting it is amortized
+        over the saves in between. Only called right after a save.
+        """
+        if self.journal is None or not self._hydrated or self._dirty_rows:
+            return
+        if (self._checkpoint_id == self.journal.journal_id and 
+                self._rows_since_checkpoint < max(self.CHECKPOINT_MIN_ROWS, self._size // 4)):
+            return
+        
+        journal_id = self.journal.ensure_journal_id()
+        temporary_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(temporary_path, 'wb') as f:
+            np.savez(f, journal_id=np.array(journal_id), journal_offset=np.array(self.journal.size),
+                     pattern_ids=np.array(self.pattern_ids, dtype=str),
+                     signatures=np.array(self.signatures, dtype=str),
+                     **{column: getattr(self, column)[:self._size] for column in self.COLUMNS})
+        os.replace(temporary_path, self.checkpoint_path)
+        self._checkpoint_id = journal_id
+        self._rows_since_checkpoint = 0
+    
+    def _reserve(self, rows: int):
+        """Grow the column arrays (by doubling) to hold at least ``rows`` rows."""
+        capacity = len(self.base_weight)
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        for column in self.COLUMNS:
+            array = getattr(self, column)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            setattr(self, column, grown)
+    
+    def _append_row(self, pattern_id: str, signature: str, values: Tuple) -> int:
+        self._reserve(self._size + 1)
+        
+        row = self._size
+        for column, value in zip(self.COLUMNS, values):
+            getattr(self, column)[row] = value
+        
+        self.pattern_ids.append(pattern_id)
+        self.signatures.append(signature)
+        self._row_of[pattern_id] = row
+        self._dirty_rows.add(row)
+        self._size += 1
+        return row
+    
+    def set_value(self, row: int, column: str, value):
+        """Write one cell and remember the row needs persisting."""
+        getattr(self, column)[row] = value
+        self._dirty_rows.add(row)
+    
+    def mark_outcomes_dirty(self, row: int):
+        """Remember a materialized pattern's outcome history needs persisting."""
+        self._dirty_outcomes.add(row)
+    
+    def __setitem__(self, pattern_id: str, pattern: NeuralPattern):
+        self._hydrate()
+        values = tuple(pattern._get(column) for column in self.COLUMNS)
+        if pattern_id in self._row_of:
+            row = self._row_of[pattern_id]
+            for column, value in zip(self.COLUMNS, values):
+                self.set_value(row, column, value)
+        else:
+            row = self._append_row(pattern_id, pattern.signature, values)
+        
+        pattern._table, pattern._row = self, row
+        self._patterns[row] = pattern
+        if pattern._outcomes:
+            self._dirty_outcomes.add(row)
+    
+    def __getitem__(self, pattern_id: str) -> NeuralPattern:
+        self._hydrate()
+        return self.pattern_at(self._row_of[pattern_id])
+    
+    def __contains__(self, pattern_id) -> bool:
+        if not self._hydrated:
+            return pattern_id in self.journal.keys("pattern")
+        return pattern_id in self._row_of
+    
+    def __iter__(self):
+        self._hydrate()
+        return iter(self.pattern_ids)
+    
+    def __len__(self) -> int:
+        if not self._hydrated:
+            return len(self.journal.keys("pattern"))
+        return self._size
+    
+    def pattern_at(self, row: int) -> NeuralPattern:
+        """Materialize (once) the NeuralPattern view of a row."""
+        self._hydrate()
+        pattern = self._patterns.get(row)
+        if pattern is None:
+            pattern = NeuralPattern(self.pattern_ids[row], self.signatures[row])
+            pattern._table, pattern._row = self, row
+            pattern._outcomes = None  # Decoded lazily
+            self._patterns[row] = pattern
+        return pattern
+    
+    def load_outcomes(self, pattern_id: str) -> List[Dict]:
+        """Decode a pattern's outcome history from the journal."""
+        if self.journal is None:
+            return []
+        
+        outcomes = self.journal.load("outcomes", pattern_id)
+        if outcomes is None:
+            # Records written before outcomes were split out of the pattern record
+            outcomes = (self.journal.load("pattern", pattern_id) or {}).get("associated_outcomes", [])
+        return outcomes
+    
+    def _age_days(self, now: float = None) -> np.ndarray:
+        self._hydrate()
+        now = datetime.now().timestamp() if now is None else now
+        return np.floor((now - self.last_activation[:self._size]) / 86400.0)
+    
+    def prediction_confidences(self, now: float = None) -> np.ndarray:
+        """Vectorized NeuralPattern.get_prediction_confidence for every row."""
+        recency_factor = np.maximum(0.1, 1.0 - self._age_days(now) / 30)
+        reinforcement_factor = np.minimum(1.0, self.reinforcement_count[:self._size] / 10)
+        return self.prediction_accuracy[:self._size] * recency_factor * reinforcement_factor
+    
+    def effective_weights(self, now: float = None) -> np.ndarray:
+        """Vectorized NeuralPattern.weight (with lazy decay) for every row."""
+        stale_days = np.maximum(0, self._age_days(now) - NeuralPattern.STALE_AFTER_DAYS)
+        return self.base_weight[:self._size] * 0.95 ** stale_days
+    
+    def activated_within(self, days: int, now: float = None) -> int:
+        """Number of patterns activated within the last ``days`` days."""
+        return int(np.count_nonzero(self._age_days(now) <= days))
+    
+    def rows_matching(self, substring: str) -> List[int]:
+        """Rows whose signature contains ``substring``; only new rows are rescanned."""
+        self._hydrate()
+        rows, scanned = self._substring_rows.setdefault(substring, [[], 0])
+        for row in range(scanned, self._size):
+            if substring in self.signatures[row]:
+                rows.append(row)
+        self._substring_rows[substring][1] = self._size
+        return rows
+    
+    def changed_records(self) -> List[Tuple[str, str, Optional[Dict]]]:
+        """Journal records for rows and outcome histories changed since the last save."""
+        records = []
+        if not self._hydrated:
+            return records
+        for row in sorted(self._dirty_rows):
+            records.append(("pattern", self.pattern_ids[row], {
+                "pattern_id": self.pattern_ids[row],
+                "signature": self.signatures[row],
+                "weight": self.base_weight[row].item(),
+                "reinforcement_count": int(self.reinforcement_count[row]),
+                "prediction_accuracy": self.prediction_accuracy[row].item(),
+                "last_activation": datetime.fromtimestamp(self.last_activation[row]).isoformat()
+            }))
+        
+        for row in sorted(self._dirty_outcomes):
+            records.append(("outcomes", self.pattern_ids[row], self._patterns[row]._outcomes[-20:]))
+        
+        return records
+    
+    def mark_saved(self, records: List[Tuple[str, str, Optional[Dict]]]):
+        """Clear dirty state for records that were just persisted."""
+        for kind, key, data in records:
+            if kind == "pattern":
+                self._dirty_rows.discard(self._row_of[key])
+                self._rows_since_checkpoint += 1
+            elif kind == "outcomes":
+                self._dirty_outcomes.discard(self._row_of[key])
+
+class IntelligenceJournal:
+    """
+    Append-only journal of intelligence state records.
+    
+    Each line is ``kind<TAB>key<TAB>json``; a later line for the same
+    (kind, key) supersedes earlier ones and a ``null`` payload deletes the
+    record. Opening the journal only indexes byte offsets (no JSON parsing),
+    records are decoded on demand, and saves append just the records that
+    changed. Once superseded bytes outweigh live ones the journal is
+    compacted into a fresh file holding only the latest records. A torn
+    last record (a save killed mid-append) is cut off when the journal is
+    opened.
+    
+    The ``journal id`` record identifies the current byte layout; compaction
+    writes a new one, so snapshots that point at byte offsets (the pattern
+    checkpoint) can tell whether they still apply.
+    """
+    
+    def __init__(self, journal_path: Path, compact_min_bytes: int = 4 * 1024 * 1024):
+        self.journal_path = Path(journal_path)
+        self.compact_min_bytes = compact_min_bytes
+        self._offsets = defaultdict(dict)  # kind -> {key: (offset, length) of latest record}
+        self._journal_bytes = 0
+        self._live_bytes = 0
+        self._scan()
+    
+    def _scan(self):
+        """Index the latest record offset for every (kind, key) in the journal."""
+        self._offsets = defaultdict(dict)
+        self._journal_bytes = 0
+        self._live_bytes = 0
+        self._journal_id = None
+        if not self.journal_path.exists():
+            return
+        
+        damage = None
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("unterminated record")
+                    kind, key, payload = line.split(b'\t', 2)
+                    kind, key = kind.decode(), json.loads(key)
+                except ValueError as e:
+                    damage = e
+                    break
+                self._index_record(kind, key, payload.strip() == b'null', self._journal_bytes, len(line))
+                self._journal_bytes += len(line)
+        
+        if damage is not None:
+            # A save interrupted mid-append leaves a torn tail; keep everything before it
+            print(f"Warning: Truncating damaged intelligence journal at byte {self._journal_bytes} "
+                  f"({damage})", file=sys.stderr)
+            os.truncate(self.journal_path, self._journal_bytes)
+    
+    def _index_record(self, kind: str, key: str, deleted: bool, offset: int, length: int):
+        """Point (kind, key) at the record just read or written."""
+        previous = self._offsets[kind].pop(key, None)
+        if previous is not None:
+            self._live_bytes -= previous[1]
+        if not deleted:
+            self._offsets[kind][key] = (offset, length)
+            self._live_bytes += length
+    
+    def exists(self) -> bool:
+        """Whether the journal file has been created."""
+        return self.journal_path.exists()
+    
+    @property
+    def size(self) -> int:
+        """Bytes of valid records in the journal."""
+        return self._journal_bytes
+    
+    @property
+    def journal_id(self) -> Optional[str]:
+        """Id of the current byte layout, or None if none was assigned yet."""
+        if self._journal_id is None:
+            record = self.load("journal", "id")
+            self._journal_id = record["id"] if record else None
+        return self._journal_id
+    
+    def ensure_journal_id(self) -> str:
+        """Return the journal id, appending one if the journal has none."""
+        if self.journal_id is None:
+            self.append([("journal", "id", {"id": uuid.uuid4().hex})])
+        return self.journal_id
+    
+    def keys(self, kind: str) -> Dict[str, int]:
+        """Live keys (mapped to offsets) for a record kind."""
+        return self._offsets[kind]
+    
+    def load(self, kind: str, key: str) -> Optional[Dict]:
+        """Decode the latest record for (kind, key), or None if absent."""
+        location = self._offsets[kind].get(key)
+        if location is None:
+            return None
+        
+        with open(self.journal_path, 'rb') as f:
+            f.seek(location[0])
+            return json.loads(f.readline().split(b'\t', 2)[2])
+    
+    def iter_records(self, kind: str, since: int = 0) -> Iterator[Tuple[str, Dict]]:
+        """Decode every live record of a kind (at or after byte ``since``) in one sequential read."""
+        locations = sorted(((key, location) for key, location in self._offsets[kind].items() 
+                            if location[0] >= since), key=lambda item: item[1][0])
+        if not locations:
+            return
+        
+        with open(self.journal_path, 'rb') as f:
+            for key, (offset, length) in locations:
+                f.seek(offset)
+                yield key, json.loads(f.read(length).split(b'\t', 2)[2])
+    
+    def append(self, records: List[Tuple[str, str, Optional[Dict]]]):
+        """Append (kind, key, data) records; data of None deletes the record."""
+        if not records:
+            return
+        
+        with open(self.journal_path, 'ab') as f:
+            for kind, key, data in records:
+                line = f"{kind}\t{json.dumps(key)}\t{json.dumps(data)}\n".encode()
+                f.write(line)
+                self._index_record(kind, key, data is None, self._journal_bytes, len(line))
+                self._journal_bytes += len(line)
+        
+        if self._journal_bytes > max(self.compact_min_bytes, 2 * self._live_bytes):
+            self.compact()
+    
+    def compact(self):
+        """Rewrite the journal keeping only the latest live record per key."""
+        compacted_path = self.journal_path.with_suffix(".compacting")
+        
+        with open(self.journal_path, 'rb') as source, open(compacted_path, 'wb') as target:
+            target.write(f"journal\t{json.dumps('id')}\t{json.dumps({'id': uuid.uuid4().hex})}\n".encode())
+            for kind, keys in self._offsets.items():
+                if kind == "journal":
+                    continue
+                for offset, length in keys.values():
+                    source.seek(offset)
+                    target.write(source.read(length))
+        
+        os.replace(compacted_path, self.journal_path)
+        self._scan()
+
+class LazyRecordMap(MutableMapping):
+    """
+    Dict-like view over one kind of journaled record.
+    
+    Values are decoded from the journal the first time they are accessed and
+    then kept in memory. Only keys assigned or deleted since the last save
+    are persisted, so a value mutated in place must be stored back
+    (``records[key] = value``); untouched records cost nothing on save.
+    """
+    
+    def __init__(self, journal: IntelligenceJournal, kind: str, decode, encode):
+        self.journal = journal
+        self.kind = kind
+        self._decode = decode
+        self._encode = encode
+        self._loaded = {}
+        self._dirty = set()
+        self._deleted = set()
+    
+    def __getitem__(self, key):
+        if key in self._loaded:
+            return self._loaded[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        
+        data = self.journal.load(self.kind, key)
+        if data is None:
+            raise KeyError(key)
+        
+        value = self._decode(data)
+        self._loaded[key] = value
+        return value
+    
+    def __setitem__(self, key, value):
+        self._loaded[key] = value
+        self._dirty.add(key)
+        self._deleted.discard(key)
+    
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._loaded.pop(key, None)
+        self._dirty.discard(key)
+        self._deleted.add(key)
+    
+    def __contains__(self, key) -> bool:
+        if key in self._loaded:
+            return True
+        return key not in self._deleted and key in self.journal.keys(self.kind)
+    
+    def __iter__(self):
+        yield from list(self._loaded)
+        for key in list(self.journal.keys(self.kind)):
+            if key not in self._loaded and key not in self._deleted:
+                yield key
+    
+    def __len__(self) -> int:
+        journal_keys = self.journal.keys(self.kind)
+        unsaved = sum(1 for key in self._loaded if key not in journal_keys)
+        deleted = sum(1 for key in self._deleted if key in journal_keys)
+        return len(journal_keys) + unsaved - deleted
+    
+    def changed_records(self) -> List[Tuple[str, str, Optional[Dict]]]:
+        """Records assigned or deleted since the last save, as (kind, key, data)."""
+        records = [(self.kind, key, self._encode(self._loaded[key])) for key in sorted(self._dirty)]
+        records.extend((self.kind, key, None) for key in sorted(self._deleted) 
+                       if key in self.journal.keys(self.kind))
+        return records
+    
+    def mark_saved(self, records: List[Tuple[str, str, Optional[Dict]]]):
+        """Clear dirty state for records that were just persisted."""
+        for kind, key, data in records:
+            if kind != self.kind:
+                continue
+            if data is None:
+                self._deleted.discard(key)
+            else:
+                self._dirty.discard(key)
+
+class CausalIndex:
+    """
+    Sparse co-occurrence and transition counts between patterns and outcomes.
+    
+    ``effect_counts[cause][outcome]`` counts how often a pattern category was
+    seen in a run with a given classification outcome, and
+    ``transition_counts[cause][follower]`` how often a category showed up in
+    the next run of the same sequence type. Each observed event is a handful
+    of counter increments, and "most likely effects of X" only looks at X's
+    own (small) row, so neither depends on how much history was recorded.
+    """
+    
+    SUCCESS_OUTCOME = "SUCCESS"
+    
+    def __init__(self):
+        self.effect_counts = defaultdict(Counter)  # cause -> outcome -> count
+        self.transition_counts = defaultdict(Counter)  # cause -> next-run cause -> count
+        self.totals = Counter()  # cause -> observations
+        self.last_causes = {}  # sequence_type -> causes seen in the previous run
+        self._dirty_causes = set()
+        self._dirty_sequences = set()
+    
+    def observe(self, causes: List[str], outcome: str, sequence_type: str = "default"):
+        """Record one classified run: every cause occurrence co-occurs with the outcome."""
+        for cause in causes:
+            self.effect_counts[cause][outcome] += 1
+            self.totals[cause] += 1
+            self._dirty_causes.add(cause)
+        
+        current = sorted(set(causes))
+        for previous in self.last_causes.get(sequence_type, []):
+            for cause in current:
+                self.transition_counts[previous][cause] += 1
+            self._dirty_causes.add(previous)
+        
+        self.last_causes[sequence_type] = current
+        self._dirty_sequences.add(sequence_type)
+    
+    def top_effects(self, cause: str, k: int = 3) -> List[Tuple[str, float]]:
+        """The k most likely outcomes of ``cause`` as (outcome, probability)."""
+        total = self.totals.get(cause, 0)
+        if not total:
+            return []
+        return [(outcome, count / total) for outcome, count in 
+                heapq.nlargest(k, self.effect_counts[cause].items(), key=lambda item: item[1])]
+    
+    def likely_followers(self, cause: str, k: int = 3) -> List[Tuple[str, int]]:
+        """The k categories most often seen in the run following one with ``cause``."""
+        row = self.transition_counts.get(cause)
+        if not row:
+            return []
+        return heapq.nlargest(k, row.items(), key=lambda item: item[1])
+    
+    def outcome_distribution(self, cause: str) -> Dict[str, float]:
+        """P(outcome | cause) over every outcome observed with ``cause``."""
+        total = self.totals.get(cause, 0)
+        if not total:
+            return {}
+        return {outcome: count / total for outcome, count in self.effect_counts[cause].items()}
+    
+    def success_rate(self, cause: str) -> float:
+        total = self.totals.get(cause, 0)
+        return self.effect_counts[cause][self.SUCCESS_OUTCOME] / total if total else 0.0
+    
+    def __len__(self) -> int:
+        return len(self.totals)
+    
+    def __iter__(self):
+        return iter(self.totals)
+    
+    def __contains__(self, cause) -> bool:
+        return cause in self.totals
+    
+    def cause_record(self, cause: str) -> Dict:
+        return {
+            "total": self.totals.get(cause, 0),
+            "effects": dict(self.effect_counts.get(cause, {})),
+            "followers": dict(self.transition_counts.get(cause, {}))
+        }
+    
+    def load_cause(self, cause: str, data):
+        """Load one cause's counts; the legacy raw effect list is folded into counts."""
+        if isinstance(data, list):
+            effects = Counter(effect["effect"] for effect in data)
+            data = {"total": sum(effects.values()), "effects": effects, "followers": {}}
+        
+        if data["total"]:
+            self.totals[cause] = data["total"]
+        if data["effects"]:
+            self.effect_counts[cause] = Counter(data["effects"])
+        if data["followers"]:
+            self.transition_counts[cause] = Counter(data["followers"])
+    
+    def to_dict(self) -> Dict:
+        causes = set(self.totals) | set(self.transition_counts)
+        return {
+            "causes": {cause: self.cause_record(cause) for cause in causes},
+            "last_causes": dict(self.last_causes)
+        }
+    
+    @classmethod
+    def from_dict(cls, data) -> "CausalIndex":
+        """
+        Build from ``to_dict`` output or the legacy ``cause -> [effects]`` mapping.
+        
+        Everything loaded is marked dirty, so the next journal save writes the
+        whole index (e.g. when migrating a snapshot to the journal).
+        """
+        index = cls()
+        if "causes" not in data or "last_causes" not in data:
+            data = {"causes": data, "last_causes": {}}
+        for cause, record in data["causes"].items():
+            index.load_cause(cause, record)
+        index.last_causes = dict(data["last_causes"])
+        index._dirty_causes.update(set(index.totals) | set(index.transition_counts))
+        index._dirty_sequences.update(index.last_causes)
+        return index
+    
+    def changed_records(self) -> List[Tuple[str, str, Optional[Dict]]]:
+        """Journal records for causes and sequences updated since the last save."""
+        records = [("causal", cause, self.cause_record(cause)) for cause in sorted(self._dirty_causes)]
+        records += [("causal_sequence", seq_type, {"last_causes": self.last_causes[seq_type]})
+                    for seq_type in sorted(self._dirty_sequences)]
+        return records
+    
+    def mark_saved(self):
+        self._dirty_causes.clear()
+        self._dirty_sequences.clear()
 
 class PsychoNoirIntelligenceEngine:
     """
@@ -99,14 +831,36 @@ class PsychoNoirIntelligenceEngine:
     5. Evolution Layer - Self-modifies based on meta-learning
     """
     
-    def __init__(self, storage_path: str = None):
+    PERSISTED_SEQUENCE_EVENTS = 100  # Most recent temporal events kept per sequence type
+    RECENT_NODE_MAX_OCCURRENCES = 5  # Nodes seen at most this often count as recently discovered
+    
+    def __init__(self, storage_path: str = None, state_backend: str = "journal"):
         self.storage_path = Path(storage_path or "/tmp/psycho-noir-intelligence")
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
+        # "journal" appends only changed records and loads patterns lazily,
+        # "json" rewrites the full intelligence_state.json on every save
+        self.state_backend = state_backend
+        self.journal = None
+        self._sequence_event_counts = Counter()  # sequence_type -> events recorded so far
+        self._saved_sequence_counts = Counter()  # sequence_type -> events already journaled
+        self._legacy_sequence_keys = set()  # whole-list "sequence" records to drop on next save
+        
+        # Running meta-learning aggregates, updated as nodes change
+        self.recent_node_count = 0  # nodes with occurrence_count <= RECENT_NODE_MAX_OCCURRENCES
+        self._node_stats_dirty = False
+        
         # Core intelligence structures
-        self.neural_patterns = {}  # pattern_id -> NeuralPattern
-        self.intelligence_nodes = {}  # node_id -> IntelligenceNode
-        self.causal_relationships = defaultdict(list)  # cause -> [effects]
+        if state_backend == "journal":
+            self.journal = IntelligenceJournal(self.storage_path / "intelligence_journal.jsonl")
+            self.neural_patterns = PatternTable(self.journal)  # pattern_id -> NeuralPattern
+            self.intelligence_nodes = LazyRecordMap(  # node_id -> IntelligenceNode
+                self.journal, "node", lambda data: IntelligenceNode(**data), asdict
+            )
+        else:
+            self.neural_patterns = PatternTable()  # pattern_id -> NeuralPattern
+            self.intelligence_nodes = {}  # node_id -> IntelligenceNode
+        self.causal_relationships = CausalIndex()  # cause -> outcome / next-run counts
         self.temporal_sequences = defaultdict(deque)  # sequence_type -> deque of events
         
         # Intelligence metrics
@@ -197,17 +951,25 @@ class PsychoNoirIntelligenceEngine:
                 
                 self.intelligence_nodes[node_id] = node
                 new_nodes.append(node)
+                self.recent_node_count += 1
+                self._node_stats_dirty = True
             else:
                 # Update existing node
                 node = self.intelligence_nodes[node_id]
                 node.occurrence_count += 1
                 node.temporal_weight = min(10.0, node.temporal_weight * 1.1)
+                if node.occurrence_count == self.RECENT_NODE_MAX_OCCURRENCES + 1:
+                    self.recent_node_count -= 1
+                    self._node_stats_dirty = True
                 
                 # Update success correlation based on overall classification level
                 if classification_data["classification_level"].value == "GREEN":
                     node.success_correlation = min(1.0, node.success_correlation + 0.1)
                 elif classification_data["classification_level"].value == "RED":
                     node.success_correlation = max(0.0, node.success_correlation - 0.2)
+                
+                # Store back so the journaled map persists the change
+                self.intelligence_nodes[node_id] = node
         
         return new_nodes
     
@@ -243,10 +1005,8 @@ class PsychoNoirIntelligenceEngine:
                 self.neural_patterns[pattern_id] = pattern
                 patterns_updated += 1
         
-        # Apply temporal decay to all patterns
-        for pattern in self.neural_patterns.values():
-            pattern.decay()
-        
+        # Temporal decay is applied lazily when a pattern's weight is read,
+        # so only the patterns touched above are visited
         return patterns_updated
     
     def _analyze_causal_relationships(self, classification_data: Dict, context: Dict) -> Dict:
@@ -262,42 +1022,38 @@ class PsychoNoirIntelligenceEngine:
                           classification_data.get("matched_signatures", [])]
         outcome = classification_data["classification_level"].value
         
-        # Update causal relationships
-        for pattern in current_patterns:
+        # Update causal relationships (a few counter increments per event)
+        for pattern in set(current_patterns):
             if pattern not in self.causal_relationships:
-                self.causal_relationships[pattern] = []
-            
-            # Add outcome to this pattern's effects
-            self.causal_relationships[pattern].append({
-                "effect": outcome,
-                "timestamp": datetime.now().isoformat(),
-                "context": context.get("session_type", "unknown"),
-                "confidence": 0.5  # Start with neutral confidence
-            })
-            
-            # Keep only recent relationships (last 100)
-            if len(self.causal_relationships[pattern]) > 100:
-                self.causal_relationships[pattern] = self.causal_relationships[pattern][-50:]
+                causal_insights["new_relationships"].append(pattern)
+            else:
+                causal_insights["strengthened_relationships"].append(pattern)
+        
+        self.causal_relationships.observe(current_patterns, outcome, 
+                                          context.get("session_type", "default"))
         
         # Analyze correlations
-        for pattern, effects in self.causal_relationships.items():
-            if len(effects) >= self.pattern_threshold:
+        for pattern in self.causal_relationships:
+            sample_size = self.causal_relationships.totals[pattern]
+            if sample_size >= self.pattern_threshold:
                 # Calculate correlation strength
-                success_rate = sum(1 for e in effects if e["effect"] == "GREEN") / len(effects)
+                success_rate = self.causal_relationships.success_rate(pattern)
                 
                 if success_rate > 0.8:
                     causal_insights["correlation_discoveries"].append({
                         "pattern": pattern,
                         "correlation": "STRONG_SUCCESS",
                         "success_rate": success_rate,
-                        "sample_size": len(effects)
+                        "sample_size": sample_size
                     })
                 elif success_rate < 0.2:
                     causal_insights["correlation_discoveries"].append({
                         "pattern": pattern,
                         "correlation": "STRONG_FAILURE",
                         "success_rate": success_rate,
-                        "sample_size": len(effects)
+                        "sample_size": sample_size,
+                        "likely_followers": [follower for follower, _ in 
+                                             self.causal_relationships.likely_followers(pattern)]
                     })
         
         return causal_insights
@@ -322,24 +1078,20 @@ class PsychoNoirIntelligenceEngine:
         # Calculate outcome probabilities based on learned patterns
         total_confidence = 0.0
         outcome_scores = {"GREEN": 0.0, "YELLOW": 0.0, "RED": 0.0}
+        outcome_labels = {"SUCCESS": "GREEN", "WARNING": "YELLOW", "ERROR": "RED"}
+        confidences = self.neural_patterns.prediction_confidences()
         
         for pattern_category in current_patterns:
-            # Find matching neural patterns
-            matching_patterns = [p for p in self.neural_patterns.values() 
-                               if pattern_category in p.signature]
+            # Outcome distribution comes straight from the causal counts,
+            # weighted by the confidence of the matching neural patterns
+            distribution = self.causal_relationships.outcome_distribution(pattern_category)
             
-            for pattern in matching_patterns:
-                confidence = pattern.get_prediction_confidence()
+            for row in self.neural_patterns.rows_matching(pattern_category):
+                confidence = confidences[row].item()
                 total_confidence += confidence
                 
-                # Analyze associated outcomes
-                if pattern.associated_outcomes:
-                    recent_outcomes = pattern.associated_outcomes[-20:]  # Last 20 outcomes
-                    for outcome in recent_outcomes:
-                        if outcome["success"]:
-                            outcome_scores["GREEN"] += confidence
-                        else:
-                            outcome_scores["RED"] += confidence
+                for outcome, probability in distribution.items():
+                    outcome_scores[outcome_labels.get(outcome, "RED")] += confidence * probability
         
         # Normalize probabilities
         if total_confidence > 0:
@@ -362,23 +1114,24 @@ class PsychoNoirIntelligenceEngine:
             predictions["risk_assessment"]["details"] = "Patterns suggest stability"
         
         # Generate optimization opportunities
-        high_confidence_patterns = [p for p in self.neural_patterns.values() 
-                                  if p.get_prediction_confidence() > self.confidence_threshold]
+        high_confidence_rows = np.flatnonzero(confidences > self.confidence_threshold)
         
-        for pattern in high_confidence_patterns:
-            if pattern.prediction_accuracy > 0.8:
+        for row in high_confidence_rows:
+            signature = self.neural_patterns.signatures[row]
+            accuracy = self.neural_patterns.prediction_accuracy[row].item()
+            if accuracy > 0.8:
                 predictions["optimization_opportunities"].append({
                     "type": "LEVERAGE_SUCCESS_PATTERN",
-                    "pattern": pattern.signature,
-                    "confidence": pattern.prediction_accuracy,
-                    "suggestion": f"Pattern '{pattern.signature}' shows high success rate"
+                    "pattern": signature,
+                    "confidence": accuracy,
+                    "suggestion": f"Pattern '{signature}' shows high success rate"
                 })
-            elif pattern.prediction_accuracy < 0.2:
+            elif accuracy < 0.2:
                 predictions["optimization_opportunities"].append({
                     "type": "MITIGATE_FAILURE_PATTERN", 
-                    "pattern": pattern.signature,
-                    "confidence": 1.0 - pattern.prediction_accuracy,
-                    "suggestion": f"Pattern '{pattern.signature}' often leads to failures"
+                    "pattern": signature,
+                    "confidence": 1.0 - accuracy,
+                    "suggestion": f"Pattern '{signature}' often leads to failures"
                 })
         
         return predictions
@@ -465,6 +1218,7 @@ class PsychoNoirIntelligenceEngine:
         }
         
         self.temporal_sequences[sequence_type].append(event)
+        self._sequence_event_counts[sequence_type] += 1
         
         # Keep sequences manageable (last 1000 events per type)
         if len(self.temporal_sequences[sequence_type]) > 1000:
@@ -482,15 +1236,12 @@ class PsychoNoirIntelligenceEngine:
         }
         
         # Calculate learning velocity (how fast new patterns are being discovered)
-        recent_patterns = [p for p in self.neural_patterns.values() 
-                          if (datetime.now() - p.last_activation).days <= 7]
-        meta_insights["learning_velocity"] = len(recent_patterns) / max(len(self.neural_patterns), 1)
+        recent_patterns = self.neural_patterns.activated_within(7)
+        meta_insights["learning_velocity"] = recent_patterns / max(len(self.neural_patterns), 1)
         
-        # Calculate pattern discovery rate
+        # Calculate pattern discovery rate (share of recently discovered nodes)
         if len(self.intelligence_nodes) > 0:
-            recent_nodes = sum(1 for node in self.intelligence_nodes.values() 
-                             if node.occurrence_count <= 5)  # Recently discovered patterns
-            meta_insights["pattern_discovery_rate"] = recent_nodes / len(self.intelligence_nodes)
+            meta_insights["pattern_discovery_rate"] = self.recent_node_count / len(self.intelligence_nodes)
         
         # Analyze prediction accuracy trend
         if len(self.prediction_history) > 10:
@@ -506,8 +1257,7 @@ class PsychoNoirIntelligenceEngine:
                 meta_insights["prediction_accuracy_trend"] = "DECLINING"
         
         # Assess overall intelligence health
-        active_patterns = sum(1 for p in self.neural_patterns.values() 
-                            if p.get_prediction_confidence() > 0.3)
+        active_patterns = int(np.count_nonzero(self.neural_patterns.prediction_confidences() > 0.3))
         pattern_ratio = active_patterns / max(len(self.neural_patterns), 1)
         
         if pattern_ratio > 0.7:
@@ -523,14 +1273,13 @@ class PsychoNoirIntelligenceEngine:
     
     def _calculate_intelligence_growth(self) -> Dict:
         """Calculate metrics showing intelligence growth over time."""
+        confidences = self.neural_patterns.prediction_confidences()
         return {
             "total_patterns": len(self.neural_patterns),
-            "active_patterns": sum(1 for p in self.neural_patterns.values() 
-                                 if p.get_prediction_confidence() > 0.3),
+            "active_patterns": int(np.count_nonzero(confidences > 0.3)),
             "intelligence_nodes": len(self.intelligence_nodes),
             "causal_relationships": len(self.causal_relationships),
-            "average_pattern_confidence": sum(p.get_prediction_confidence() 
-                                            for p in self.neural_patterns.values()) / 
+            "average_pattern_confidence": confidences.sum().item() / 
                                            max(len(self.neural_patterns), 1)
         }
     
@@ -540,29 +1289,15 @@ class PsychoNoirIntelligenceEngine:
     
     def _save_intelligence(self):
         """Persist intelligence state to storage."""
+        if self.journal is not None:
+            self._save_intelligence_journal()
+            return
+        
         try:
             intelligence_state = {
-                "neural_patterns": {pid: {
-                    "pattern_id": p.pattern_id,
-                    "signature": p.signature,
-                    "weight": p.weight,
-                    "reinforcement_count": p.reinforcement_count,
-                    "prediction_accuracy": p.prediction_accuracy,
-                    "last_activation": p.last_activation.isoformat(),
-                    "associated_outcomes": p.associated_outcomes[-20:]  # Keep recent
-                } for pid, p in self.neural_patterns.items()},
-                "intelligence_nodes": {nid: {
-                    "node_id": n.node_id,
-                    "pattern_signature": n.pattern_signature,
-                    "classification_level": n.classification_level,
-                    "occurrence_count": n.occurrence_count,
-                    "success_correlation": n.success_correlation,
-                    "temporal_weight": n.temporal_weight,
-                    "learning_strength": n.learning_strength,
-                    "connected_nodes": n.connected_nodes,
-                    "metadata": n.metadata
-                } for nid, n in self.intelligence_nodes.items()},
-                "causal_relationships": dict(self.causal_relationships),
+                "neural_patterns": {pid: p.to_dict() for pid, p in self.neural_patterns.items()},
+                "intelligence_nodes": {nid: asdict(n) for nid, n in self.intelligence_nodes.items()},
+                "causal_relationships": self.causal_relationships.to_dict(),
                 "temporal_sequences": {k: list(v)[-100:] for k, v in self.temporal_sequences.items()},
                 "metadata": {
                     "last_save": datetime.now().isoformat(),
@@ -576,44 +1311,70 @@ class PsychoNoirIntelligenceEngine:
         except Exception as e:
             print(f"Warning: Failed to save intelligence state: {e}")
     
+    def _save_intelligence_journal(self):
+        """Append only the patterns, nodes and sequences that changed since the last save."""
+        try:
+            records = self.neural_patterns.changed_records() + self.intelligence_nodes.changed_records()
+            
+            records += self.causal_relationships.changed_records()
+            
+            records += self._new_sequence_event_records()
+            records += [("sequence", seq_type, None) for seq_type in sorted(self._legacy_sequence_keys)]
+            if self._node_stats_dirty:
+                records.append(("metadata", "node_stats", {"recent_node_count": self.recent_node_count}))
+            
+            if records:
+                records.append(("metadata", "engine", {
+                    "last_save": datetime.now().isoformat(),
+                    "intelligence_version": "1.1"
+                }))
+                self.journal.append(records)
+                self.neural_patterns.mark_saved(records)
+                self.intelligence_nodes.mark_saved(records)
+                self.causal_relationships.mark_saved()
+                self._saved_sequence_counts = self._sequence_event_counts.copy()
+                self._legacy_sequence_keys.clear()
+                self._node_stats_dirty = False
+                self.neural_patterns.checkpoint_if_due()
+                
+        except Exception as e:
+            print(f"Warning: Failed to save intelligence state: {e}")
+    
+    def _new_sequence_event_records(self) -> List[Tuple[str, str, Optional[Dict]]]:
+        """One record per temporal event recorded since the last save.
+        
+        Events go into ``PERSISTED_SEQUENCE_EVENTS`` ring slots per sequence
+        type, so a new event supersedes the one that fell out of the window
+        and compaction keeps the journal bounded.
+        """
+        records = []
+        for seq_type, events in self.temporal_sequences.items():
+            count = self._sequence_event_counts[seq_type]
+            new_events = min(count - self._saved_sequence_counts[seq_type],
+                             self.PERSISTED_SEQUENCE_EVENTS, len(events))
+            first = count - new_events
+            for offset in range(new_events):
+                n = first + offset
+                records.append(("sequence_event", f"{seq_type}#{n % self.PERSISTED_SEQUENCE_EVENTS}", {
+                    "sequence_type": seq_type,
+                    "n": n,
+                    "event": events[len(events) - new_events + offset]
+                }))
+        return records
+    
     def _load_intelligence(self):
         """Load existing intelligence state from storage."""
+        if self.journal is not None:
+            self._load_intelligence_journal()
+            return
+        
         try:
             state_file = self.storage_path / "intelligence_state.json"
             if state_file.exists():
                 with open(state_file, 'r') as f:
                     state = json.load(f)
                 
-                # Restore neural patterns
-                for pid, data in state.get("neural_patterns", {}).items():
-                    pattern = NeuralPattern(data["pattern_id"], data["signature"])
-                    pattern.weight = data["weight"]
-                    pattern.reinforcement_count = data["reinforcement_count"]
-                    pattern.prediction_accuracy = data["prediction_accuracy"]
-                    pattern.last_activation = datetime.fromisoformat(data["last_activation"])
-                    pattern.associated_outcomes = data["associated_outcomes"]
-                    self.neural_patterns[pid] = pattern
-                
-                # Restore intelligence nodes
-                for nid, data in state.get("intelligence_nodes", {}).items():
-                    node = IntelligenceNode(
-                        node_id=data["node_id"],
-                        pattern_signature=data["pattern_signature"],
-                        classification_level=data["classification_level"],
-                        occurrence_count=data["occurrence_count"],
-                        success_correlation=data["success_correlation"],
-                        temporal_weight=data["temporal_weight"],
-                        learning_strength=data["learning_strength"],
-                        connected_nodes=data["connected_nodes"],
-                        metadata=data["metadata"]
-                    )
-                    self.intelligence_nodes[nid] = node
-                
-                # Restore other state
-                self.causal_relationships = defaultdict(list, state.get("causal_relationships", {}))
-                
-                for seq_type, events in state.get("temporal_sequences", {}).items():
-                    self.temporal_sequences[seq_type] = deque(events, maxlen=1000)
+                self._restore_state(state)
                 
                 print(f"Loaded intelligence state: {len(self.neural_patterns)} patterns, "
                       f"{len(self.intelligence_nodes)} nodes")
@@ -621,28 +1382,98 @@ class PsychoNoirIntelligenceEngine:
         except Exception as e:
             print(f"Warning: Failed to load intelligence state: {e}")
     
+    def _load_intelligence_journal(self):
+        """Index the journal; patterns and nodes are decoded on first access."""
+        try:
+            legacy_state_file = self.storage_path / "intelligence_state.json"
+            if not self.journal.exists() and legacy_state_file.exists():
+                # One-time migration from the full-snapshot format
+                with open(legacy_state_file, 'r') as f:
+                    self._restore_state(json.load(f))
+                self._save_intelligence_journal()
+            
+            for cause, data in self.journal.iter_records("causal"):
+                self.causal_relationships.load_cause(cause, data)
+            for seq_type, data in self.journal.iter_records("causal_sequence"):
+                self.causal_relationships.last_causes[seq_type] = data["last_causes"]
+            
+            numbered_events = defaultdict(list)
+            for _, data in self.journal.iter_records("sequence_event"):
+                numbered_events[data["sequence_type"]].append((data["n"], data["event"]))
+            for seq_type, numbered in numbered_events.items():
+                numbered.sort(key=lambda item: item[0])
+                self.temporal_sequences[seq_type] = deque((event for _, event in numbered), maxlen=1000)
+                self._sequence_event_counts[seq_type] = numbered[-1][0] + 1
+                self._saved_sequence_counts[seq_type] = numbered[-1][0] + 1
+            
+            node_stats = self.journal.load("metadata", "node_stats")
+            if node_stats is not None:
+                self.recent_node_count = node_stats["recent_node_count"]
+            elif self.journal.keys("node"):
+                # Journals written before the aggregate was kept: count once and persist it
+                self.recent_node_count = sum(
+                    1 for _, data in self.journal.iter_records("node") 
+                    if data["occurrence_count"] <= self.RECENT_NODE_MAX_OCCURRENCES
+                )
+                self._node_stats_dirty = True
+            
+            # Journals written before per-event records hold each sequence as one list
+            for seq_type in list(self.journal.keys("sequence")):
+                if seq_type not in numbered_events:
+                    events = self.journal.load("sequence", seq_type)
+                    self.temporal_sequences[seq_type] = deque(events, maxlen=1000)
+                    self._sequence_event_counts[seq_type] = len(events)
+                self._legacy_sequence_keys.add(seq_type)
+            
+            if self.journal.exists():
+                print(f"Loaded intelligence journal: {len(self.neural_patterns)} patterns, "
+                      f"{len(self.intelligence_nodes)} nodes (decoded on demand)")
+                
+        except Exception as e:
+            print(f"Warning: Failed to load intelligence state: {e}")
+    
+    def _restore_state(self, state: Dict):
+        """Restore patterns, nodes, causal relationships and sequences from a full snapshot."""
+        # Restore neural patterns
+        for pid, data in state.get("neural_patterns", {}).items():
+            self.neural_patterns[pid] = NeuralPattern.from_dict(data)
+        
+        # Restore intelligence nodes
+        for nid, data in state.get("intelligence_nodes", {}).items():
+            self.intelligence_nodes[nid] = IntelligenceNode(**data)
+            if data["occurrence_count"] <= self.RECENT_NODE_MAX_OCCURRENCES:
+                self.recent_node_count += 1
+        self._node_stats_dirty = True
+        
+        # Restore other state
+        self.causal_relationships = CausalIndex.from_dict(state.get("causal_relationships", {}))
+        
+        for seq_type, events in state.get("temporal_sequences", {}).items():
+            self.temporal_sequences[seq_type] = deque(events, maxlen=1000)
+            self._sequence_event_counts[seq_type] = len(events)
+    
     def get_intelligence_status(self) -> Dict:
         """Get current intelligence engine status."""
+        confidences = self.neural_patterns.prediction_confidences()
+        top_rows = np.argsort(-confidences, kind="stable")[:5]
+        
         return {
             "timestamp": datetime.now().isoformat(),
             "neural_patterns": len(self.neural_patterns),
-            "active_patterns": sum(1 for p in self.neural_patterns.values() 
-                                 if p.get_prediction_confidence() > 0.3),
+            "active_patterns": int(np.count_nonzero(confidences > 0.3)),
             "intelligence_nodes": len(self.intelligence_nodes),
             "causal_relationships": len(self.causal_relationships),
             "temporal_sequences": {k: len(v) for k, v in self.temporal_sequences.items()},
-            "average_confidence": sum(p.get_prediction_confidence() 
-                                    for p in self.neural_patterns.values()) / 
+            "average_confidence": confidences.sum().item() / 
                                  max(len(self.neural_patterns), 1),
             "top_patterns": [
                 {
-                    "signature": p.signature,
-                    "confidence": p.get_prediction_confidence(),
-                    "accuracy": p.prediction_accuracy,
-                    "reinforcements": p.reinforcement_count
+                    "signature": self.neural_patterns.signatures[row],
+                    "confidence": confidences[row].item(),
+                    "accuracy": self.neural_patterns.prediction_accuracy[row].item(),
+                    "reinforcements": int(self.neural_patterns.reinforcement_count[row])
                 }
-                for p in sorted(self.neural_patterns.values(), 
-                               key=lambda x: x.get_prediction_confidence(), reverse=True)[:5]
+                for row in top_rows
             ]
         }
 
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Restart round-trip checks for the intelligence engine's persisted state.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "error-classifier"))
+
+from collections import Counter
+
+from psycho_noir_intelligence import IntelligenceJournal, PsychoNoirIntelligenceEngine
+from psycho_noir_classifier import ClassificationLevel, PsychoNoirErrorClassifier
+
+LOG = "ModuleNotFoundError: x\nAssertionError: y\nERROR: boom\n"
+
+def _causal_state(engine):
+    causal = engine.causal_relationships
+    return {cause: causal.cause_record(cause) for cause in causal}, dict(causal.last_causes)
+
+def _learn(engine, runs=3):
+    classification = PsychoNoirErrorClassifier().classify_log_content(LOG)
+    for _ in range(runs):
+        engine.process_classification_result(classification, {"session_type": "ci"})
+
+def test_journal_restart_round_trip(tmp_path):
+    engine = PsychoNoirIntelligenceEngine(str(tmp_path))
+    _learn(engine)
+    expected = _causal_state(engine)
+    assert expected[0]
+
+    for _ in range(2):
+        engine = PsychoNoirIntelligenceEngine(str(tmp_path))
+        assert _causal_state(engine) == expected
+
+def test_legacy_snapshot_migration_survives_restarts(tmp_path):
+    engine = PsychoNoirIntelligenceEngine(str(tmp_path), state_backend="json")
+    _learn(engine)
+    expected = _causal_state(engine)
+    patterns = len(engine.neural_patterns)
+    assert expected[0]
+
+    # First start migrates intelligence_state.json, later ones read the journal only
+    for _ in range(3):
+        engine = PsychoNoirIntelligenceEngine(str(tmp_path))
+        assert _causal_state(engine) == expected
+        assert len(engine.neural_patterns) == patterns
+
+def _classification(matches, anomalies, level=ClassificationLevel.RED):
+    return {
+        "classification_level": level,
+        "matched_signatures": [{"pattern": pattern, "category": category, "level": "ERROR"}
+                               for pattern, category in matches],
+        "unclassified_anomalies": [{"line": line} for line in anomalies]
+    }
+
+def _count_journal_io(monkeypatch):
+    """Count decoded records and appended records per kind."""
+    decoded, appended = Counter(), Counter()
+    load, iter_records, append = (IntelligenceJournal.load, IntelligenceJournal.iter_records, 
+                                  IntelligenceJournal.append)
+    
+    def counting_load(self, kind, key):
+        decoded[kind] += 1
+        return load(self, kind, key)
+    
+    def counting_iter_records(self, kind, *args, **kwargs):
+        for item in iter_records(self, kind, *args, **kwargs):
+            decoded[kind] += 1
+            yield item
+    
+    def counting_append(self, records):
+        appended.update(kind for kind, _, _ in records)
+        return append(self, records)
+    
+    monkeypatch.setattr(IntelligenceJournal, "load", counting_load)
+    monkeypatch.setattr(IntelligenceJournal, "iter_records", counting_iter_records)
+    monkeypatch.setattr(IntelligenceJournal, "append", counting_append)
+    return decoded, appended
+
+def test_event_after_restart_touches_constant_state(tmp_path, monkeypatch):
+    engine = PsychoNoirIntelligenceEngine(str(tmp_path))
+    engine.process_classification_result(_classification(
+        [(f"failure {i}", f"CATEGORY_{i % 4}") for i in range(3000)],
+        [f"anomaly {i}" for i in range(3000)]
+    ))
+    assert len(engine.intelligence_nodes) == 3000
+    assert len(engine.neural_patterns) > 3000
+    
+    decoded, appended = _count_journal_io(monkeypatch)
+    engine = PsychoNoirIntelligenceEngine(str(tmp_path))
+    result = engine.process_classification_result(_classification(
+        [("failure 1", "CATEGORY_1"), ("failure 2", "CATEGORY_2")], ["anomaly 1", "new anomaly"]
+    ))
+    
+    assert decoded["node"] + decoded["pattern"] + decoded["outcomes"] <= 10
+    assert sum(appended.values()) <= 20
+    assert result["intelligence_growth"]["intelligence_nodes"] == 3000
+    assert result["intelligence_growth"]["total_patterns"] == len(engine.neural_patterns)
+    assert result["meta_learning_insights"]["pattern_discovery_rate"] == 1.0
+    
+    # The checkpoint plus journal tail restores exactly what was saved
+    saved = {pattern_id: engine.neural_patterns[pattern_id].to_dict() for pattern_id in engine.neural_patterns}
+    engine = PsychoNoirIntelligenceEngine(str(tmp_path))
+    assert {pattern_id: engine.neural_patterns[pattern_id].to_dict() 
+            for pattern_id in engine.neural_patterns} == saved
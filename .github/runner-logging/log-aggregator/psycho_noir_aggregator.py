@@ -15,11 +15,15 @@ import os
 import re
 import sys
 import hashlib
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
 import gzip
 import base64
+import heapq
+import sqlite3
+import zlib
 
 class LogFragment:
     """Represents a single log fragment in the consciousness stream."""
@@ -33,6 +37,14 @@ class LogFragment:
         self.fragment_id = self._generate_fragment_id()
         self.processed = False
         
+        # Set once the content has been written to a ChunkStore; the fragment
+        # then serializes as chunk references instead of inline content
+        self.chunk_refs = None
+        
+        # Position within the owning session, shared by in-memory and spilled
+        # fragments so both can be replayed in arrival order
+        self.seq = None
+    
     def _generate_fragment_id(self) -> str:
         """Generate unique fragment identifier for tracking."""
         content_hash = hashlib.sha256(
@@ -42,7 +54,7 @@ class LogFragment:
     
     def to_dict(self) -> Dict:
         """Convert fragment to dictionary for serialization."""
-        return {
+        fragment_data = {
             "fragment_id": self.fragment_id,
             "content": self.content,
             "source": self.source,
@@ -50,10 +62,161 @@ class LogFragment:
             "metadata": self.metadata,
             "processed": self.processed
         }
+        if self.chunk_refs is not None:
+            del fragment_data["content"]
+            fragment_data["chunk_refs"] = self.chunk_refs
+        if self.seq is not None:
+            fragment_data["seq"] = self.seq
+        return fragment_data
+
+class ChunkStore:
+    """
+    Content-addressed, gzip-compressed store for log content.
+    
+    Fragment content is cut into line-aligned chunks at content-defined
+    boundaries (a line whose CRC falls on the boundary mask), so a repeated
+    block such as a dependency install produces the same chunks no matter
+    what precedes it. Each chunk is keyed by the sha256 of its text and
+    stored once; fragments keep only the list of chunk ids.
+    """
+    
+    MIN_CHUNK_BYTES = 512
+    MAX_CHUNK_BYTES = 64 * 1024
+    BOUNDARY_MASK = 0x1f  # ~1 boundary every 32 lines
+    KNOWN_CHUNK_CACHE_SIZE = 4096
+    
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS chunks (
+                    chunk_id TEXT PRIMARY KEY,
+                    raw_size INTEGER NOT NULL,
+                    data BLOB NOT NULL
+                )
+            """)
+        
+        # Recently stored chunk ids (LRU), so repeats skip compression; a chunk
+        # that fell out of the cache is recompressed and ignored on insert
+        self._known = OrderedDict()
+    
+    @classmethod
+    def split(cls, content: str) -> List[str]:
+        """Split content into line-aligned chunks that concatenate back to it."""
+        chunks = []
+        buffer = []
+        buffer_bytes = 0
+        
+        for line in content.splitlines(keepends=True):
+            encoded = line.encode('utf-8', errors='surrogatepass')
+            buffer.append(line)
+            buffer_bytes += len(encoded)
+            
+            if buffer_bytes >= cls.MAX_CHUNK_BYTES or (
+                    buffer_bytes >= cls.MIN_CHUNK_BYTES and
+                    zlib.crc32(encoded) & cls.BOUNDARY_MASK == 0):
+                chunks.append("".join(buffer))
+                buffer = []
+                buffer_bytes = 0
+        
+        if buffer:
+            chunks.append("".join(buffer))
+        return chunks
+    
+    @staticmethod
+    def chunk_id(chunk: str) -> str:
+        """Content address of a chunk."""
+        return hashlib.sha256(chunk.encode('utf-8', errors='surrogatepass')).hexdigest()
+    
+    def put(self, content: str) -> List[str]:
+        """Store content and return the ids of the chunks it is made of."""
+        chunk_ids = []
+        new_rows = {}
+        
+        for chunk in self.split(content):
+            chunk_id = self.chunk_id(chunk)
+            chunk_ids.append(chunk_id)
+            if chunk_id in self._known:
+                self._known.move_to_end(chunk_id)
+            elif chunk_id not in new_rows:
+                encoded = chunk.encode('utf-8', errors='surrogatepass')
+                new_rows[chunk_id] = (chunk_id, len(encoded), gzip.compress(encoded, compresslevel=6))
+        
+        if new_rows:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO chunks VALUES (?, ?, ?)", new_rows.values()
+                )
+            for chunk_id in new_rows:
+                self._known[chunk_id] = True
+            while len(self._known) > self.KNOWN_CHUNK_CACHE_SIZE:
+                self._known.popitem(last=False)
+        
+        return chunk_ids
+    
+    def get(self, chunk_ids: List[str]) -> str:
+        """Reassemble content from its chunk ids."""
+        unique_ids = list(dict.fromkeys(chunk_ids))
+        chunks = {}
+        
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(unique_ids), 500):
+            batch = unique_ids[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            for chunk_id, data in self.conn.execute(
+                    f"SELECT chunk_id, data FROM chunks WHERE chunk_id IN ({placeholders})", batch):
+                chunks[chunk_id] = gzip.decompress(data).decode('utf-8', errors='surrogatepass')
+        
+        missing = [chunk_id for chunk_id in unique_ids if chunk_id not in chunks]
+        if missing:
+            raise KeyError(f"Missing log chunks: {', '.join(missing[:3])}")
+        
+        return "".join(chunks[chunk_id] for chunk_id in chunk_ids)
+    
+    @staticmethod
+    def resolve(chunk_store: Optional["ChunkStore"], fragment_data: Dict) -> str:
+        """Return a serialized fragment's content, inline or from its chunk references."""
+        if "content" in fragment_data:
+            return fragment_data["content"]
+        if chunk_store is None:
+            raise KeyError(f"Fragment {fragment_data.get('fragment_id')} needs a chunk store")
+        return chunk_store.get(fragment_data["chunk_refs"])
+    
+    def stats(self) -> Dict:
+        """Chunk count plus raw vs. stored (compressed) bytes."""
+        count, raw_bytes, stored_bytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM chunks"
+        ).fetchone()
+        return {"chunks": count, "raw_bytes": raw_bytes, "stored_bytes": stored_bytes}
+    
+    def close(self):
+        """Close the underlying database connection."""
+        self.conn.close()
+
+def iter_segment(segment_path, chunk_store: Optional[ChunkStore]) -> Iterator[Tuple[float, str]]:
+    """Yield (seq, content) for each fragment spilled to a gzip segment."""
+    if not segment_path or not Path(segment_path).exists():
+        return
+    with gzip.open(segment_path, 'rt', encoding='utf-8') as segment:
+        for record in segment:
+            fragment_data = json.loads(record)
+            # Segments written before fragments carried a seq follow the in-memory fragments
+            yield fragment_data.get("seq", float("inf")), ChunkStore.resolve(chunk_store, fragment_data)
+
+def merge_by_seq(fragments: Iterable[Tuple[float, str]], segment_path,
+                 chunk_store: Optional[ChunkStore]) -> Iterator[Tuple[float, str]]:
+    """Interleave seq-ordered (seq, content) fragments with a session's spilled segment."""
+    return heapq.merge(fragments, iter_segment(segment_path, chunk_store), key=lambda item: item[0])
 
 class RunnerSession:
     """Represents a complete CI/CD runner session with all associated logs."""
     
+    MAX_SPILLED_SIGNATURES = 1000  # Distinct signatures kept from spilled fragments
+    
     def __init__(self, session_id: str, runner_type: str, context: Dict = None):
         self.session_id = session_id
         self.runner_type = runner_type
@@ -64,9 +227,83 @@ class RunnerSession:
         self.status = "RUNNING"
         self.intelligence_summary = {}
         
+        # Streaming mode: fragments spilled to a compressed on-disk segment
+        # only leave their running counters behind in memory
+        self.segment_path = None
+        self.spilled_fragment_count = 0
+        self._spilled_error_lines = 0
+        self._spilled_total_lines = 0
+        self._spilled_signatures = set()
+        
+        # Resolves fragments stored as chunk references
+        self.chunk_store = None
+        
+        self._next_seq = 0
+        
+    def _assign_seq(self, fragment: LogFragment):
+        fragment.seq = self._next_seq
+        self._next_seq += 1
+        
     def add_fragment(self, fragment: LogFragment):
         """Add a log fragment to this session."""
+        self._assign_seq(fragment)
         self.fragments.append(fragment)
+    
+    def spill_fragment(self, fragment: LogFragment, segment):
+        """Fold a fragment into the running counters and write it to the segment."""
+        error_lines, total_lines = self._count_error_lines(fragment.content)
+        self._spilled_error_lines += error_lines
+        self._spilled_total_lines += total_lines
+        for signature in self._fragment_signatures(fragment.content):
+            if len(self._spilled_signatures) >= self.MAX_SPILLED_SIGNATURES:
+                break
+            self._spilled_signatures.add(signature)
+        self.spilled_fragment_count += 1
+        
+        self._assign_seq(fragment)
+        segment.write(json.dumps(fragment.to_dict()) + "\n")
+    
+    def streaming_state(self) -> Dict:
+        """Running counters of a streamed session, for resuming it in another process."""
+        segment_bytes = 0
+        if self.segment_path and Path(self.segment_path).exists():
+            segment_bytes = os.path.getsize(self.segment_path)
+        return {
+            "start_time": self.start_time.isoformat(),
+            "next_seq": self._next_seq,
+            "segment_path": str(self.segment_path) if self.segment_path else None,
+            "segment_bytes": segment_bytes,
+            "spilled_fragment_count": self.spilled_fragment_count,
+            "spilled_error_lines": self._spilled_error_lines,
+            "spilled_total_lines": self._spilled_total_lines,
+            "spilled_signatures": sorted(self._spilled_signatures)
+        }
+    
+    def restore_streaming_state(self, state: Dict):
+        """
+        Resume a streamed session from ``streaming_state`` output.
+        
+        Segment bytes written after that state was taken belong to fragments
+        whose lines will be ingested again, so the segment is cut back to the
+        recorded size (every append ends on a gzip member boundary).
+        """
+        self.start_time = datetime.fromisoformat(state["start_time"])
+        self._next_seq = state["next_seq"]
+        self.segment_path = Path(state["segment_path"]) if state["segment_path"] else None
+        self.spilled_fragment_count = state["spilled_fragment_count"]
+        self._spilled_error_lines = state["spilled_error_lines"]
+        self._spilled_total_lines = state["spilled_total_lines"]
+        self._spilled_signatures = set(state["spilled_signatures"])
+        
+        if self.segment_path and self.segment_path.exists():
+            if os.path.getsize(self.segment_path) > state["segment_bytes"]:
+                os.truncate(self.segment_path, state["segment_bytes"])
+    
+    def iter_fragment_contents(self) -> Iterator[str]:
+        """Yield the content of every fragment in arrival order, reading spilled ones back from disk."""
+        in_memory = ((fragment.seq, fragment.content) for fragment in self.fragments)
+        for _, content in merge_by_seq(in_memory, self.segment_path, self.chunk_store):
+            yield content
         
     def finalize_session(self, status: str = "COMPLETED"):
         """Mark session as complete and generate intelligence summary."""
@@ -78,43 +315,59 @@ class RunnerSession:
         """Generate intelligence summary for bidirectional learning."""
         self.intelligence_summary = {
             "session_duration": (self.end_time - self.start_time).total_seconds(),
-            "fragment_count": len(self.fragments),
+            "fragment_count": len(self.fragments) + self.spilled_fragment_count,
             "error_density": self._calculate_error_density(),
-            "pattern_signatures": self._extract_pattern_signatures(),
-            "learning_value": self._assess_learning_value()
+            "pattern_signatures": self._extract_pattern_signatures()
         }
+        # Learning value is derived from the fields above
+        self.intelligence_summary["learning_value"] = self._assess_learning_value()
     
     def _calculate_error_density(self) -> float:
         """Calculate error density for the session."""
-        if not self.fragments:
+        if not self.fragments and not self._spilled_total_lines:
             return 0.0
         
-        error_indicators = ['error', 'fail', 'exception', 'critical', 'fatal']
-        error_lines = 0
-        total_lines = 0
+        error_lines = self._spilled_error_lines
+        total_lines = self._spilled_total_lines
         
         for fragment in self.fragments:
-            lines = fragment.content.split('\n')
-            total_lines += len(lines)
-            for line in lines:
-                if any(indicator in line.lower() for indicator in error_indicators):
-                    error_lines += 1
+            fragment_errors, fragment_lines = self._count_error_lines(fragment.content)
+            error_lines += fragment_errors
+            total_lines += fragment_lines
         
         return error_lines / max(total_lines, 1)
     
     def _extract_pattern_signatures(self) -> List[str]:
         """Extract unique pattern signatures for intelligence building."""
-        signatures = set()
+        signatures = set(self._spilled_signatures)
         
         for fragment in self.fragments:
-            # Extract error patterns, build patterns, timing patterns
-            patterns = re.findall(r'(ERROR:|WARN:|INFO:|Build|Test|Deploy)[^\\n]*', 
-                                fragment.content, re.IGNORECASE)
-            for pattern in patterns[:10]:  # Limit to prevent explosion
-                signatures.add(pattern[:100])  # Truncate long patterns
+            signatures.update(self._fragment_signatures(fragment.content))
         
         return list(signatures)
     
+    @staticmethod
+    def _count_error_lines(content: str) -> Tuple[int, int]:
+        """Count (error_lines, total_lines) in a fragment's content."""
+        error_indicators = ['error', 'fail', 'exception', 'critical', 'fatal']
+        error_lines = 0
+        
+        lines = content.split('\n')
+        for line in lines:
+            if any(indicator in line.lower() for indicator in error_indicators):
+                error_lines += 1
+        
+        return error_lines, len(lines)
+    
+    @staticmethod
+    def _fragment_signatures(content: str) -> List[str]:
+        """Extract the pattern signatures contributed by a single fragment."""
+        # Extract error patterns, build patterns, timing patterns
+        patterns = re.findall(r'(ERROR:|WARN:|INFO:|Build|Test|Deploy)[^\\n]*', 
+                            content, re.IGNORECASE)
+        # Limit to prevent explosion, truncate long patterns
+        return [pattern[:100] for pattern in patterns[:10]]
+    
     def _assess_learning_value(self) -> float:
         """Assess the learning value of this session for bidirectional intelligence."""
         value = 0.0
@@ -141,11 +394,213 @@ class RunnerSession:
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "status": self.status,
-            "fragment_count": len(self.fragments),
+            "fragment_count": len(self.fragments) + self.spilled_fragment_count,
             "intelligence_summary": self.intelligence_summary,
-            "fragments": [fragment.to_dict() for fragment in self.fragments]
+            "fragments": [fragment.to_dict() for fragment in self.fragments],
+            "fragment_segment": str(self.segment_path) if self.segment_path else None
         }
 
+class SessionStore:
+    """
+    Append-only SQLite store for finalized runner sessions.
+    
+    Sessions, their fragments and their pattern signatures live in indexed
+    tables (WAL journal), so later CI jobs can query recent sessions by runner
+    type, status or time without loading every session into memory.
+    """
+    
+    def __init__(self, db_path: Path, chunk_store: ChunkStore = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.chunk_store = chunk_store
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self._init_database()
+    
+    def _init_database(self):
+        """Initialize the session store schema."""
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    runner_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    context TEXT NOT NULL,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT,
+                    fragment_count INTEGER NOT NULL,
+                    error_density REAL,
+                    learning_value REAL,
+                    intelligence_summary TEXT NOT NULL,
+                    fragment_segment TEXT
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS fragments (
+                    session_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    fragment_id TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    metadata TEXT NOT NULL,
+                    chunk_refs TEXT,
+                    PRIMARY KEY (session_id, seq)
+                )
+            """)
+            
+            # Stores created before content deduplication lack chunk_refs
+            fragment_columns = {row[1] for row in self.conn.execute("PRAGMA table_info(fragments)")}
+            if "chunk_refs" not in fragment_columns:
+                self.conn.execute("ALTER TABLE fragments ADD COLUMN chunk_refs TEXT")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS signatures (
+                    session_id TEXT NOT NULL,
+                    signature TEXT NOT NULL,
+                    PRIMARY KEY (session_id, signature)
+                )
+            """)
+            
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_runner_status_time
+                ON sessions(runner_type, status, end_time)
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_status_time
+                ON sessions(status, end_time)
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_end_time
+                ON sessions(end_time)
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_signatures_signature
+                ON signatures(signature)
+            """)
+    
+    def save_sessions(self, sessions: List[RunnerSession]):
+        """Persist a batch of finalized sessions in a single transaction."""
+        session_rows = []
+        fragment_rows = []
+        signature_rows = []
+        
+        for session in sessions:
+            summary = session.intelligence_summary
+            session_rows.append((
+                session.session_id,
+                session.runner_type,
+                session.status,
+                json.dumps(session.context),
+                session.start_time.isoformat(),
+                session.end_time.isoformat() if session.end_time else None,
+                len(session.fragments) + session.spilled_fragment_count,
+                summary.get("error_density"),
+                summary.get("learning_value"),
+                json.dumps(summary),
+                str(session.segment_path) if session.segment_path else None
+            ))
+            # Deduplicated fragments keep only their chunk references
+            fragment_rows.extend(
+                (session.session_id, fragment.seq, fragment.fragment_id, fragment.source,
+                 fragment.timestamp, fragment.content if fragment.chunk_refs is None else "",
+                 json.dumps(fragment.metadata),
+                 json.dumps(fragment.chunk_refs) if fragment.chunk_refs is not None else None)
+                for fragment in session.fragments
+            )
+            signature_rows.extend(
+                (session.session_id, signature)
+                for signature in summary.get("pattern_signatures", [])
+            )
+        
+        with self.conn:
+            # A re-saved session may have fewer fragments than its previous save
+            self.conn.executemany(
+                "DELETE FROM fragments WHERE session_id = ?",
+                [(row[0],) for row in session_rows]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                session_rows
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO fragments "
+                "(session_id, seq, fragment_id, source, timestamp, content, metadata, chunk_refs) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                fragment_rows
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO signatures VALUES (?, ?)",
+                signature_rows
+            )
+    
+    def query_sessions(self, runner_type: str = None, status: str = None,
+                       since: str = None, limit: int = 10) -> List[Dict]:
+        """Return the most recent session summaries matching the filters."""
+        query = "SELECT * FROM sessions WHERE 1=1"
+        params = []
+        
+        if runner_type:
+            query += " AND runner_type = ?"
+            params.append(runner_type)
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        if since:
+            query += " AND end_time >= ?"
+            params.append(since)
+        
+        query += " ORDER BY end_time DESC LIMIT ?"
+        params.append(limit)
+        
+        return [self._row_to_summary(row) for row in self.conn.execute(query, params)]
+    
+    def get_session(self, session_id: str) -> Optional[Dict]:
+        """Return the stored summary for a single session."""
+        row = self.conn.execute(
+            "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return self._row_to_summary(row) if row else None
+    
+    def count_sessions(self) -> int:
+        """Return the number of persisted sessions."""
+        return self.conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    
+    def iter_fragment_contents(self, session_id: str) -> Iterator[str]:
+        """Yield a stored session's fragment contents in arrival order without loading them all."""
+        row = self.conn.execute(
+            "SELECT fragment_segment FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        cursor = self.conn.execute(
+            "SELECT seq, content, chunk_refs FROM fragments WHERE session_id = ? ORDER BY seq", (session_id,)
+        )
+        stored = (
+            (seq, content if chunk_refs is None
+             else ChunkStore.resolve(self.chunk_store, {"chunk_refs": json.loads(chunk_refs)}))
+            for seq, content, chunk_refs in cursor
+        )
+        for _, content in merge_by_seq(stored, row[0] if row else None, self.chunk_store):
+            yield content
+    
+    def _row_to_summary(self, row: sqlite3.Row) -> Dict:
+        """Convert a sessions row to a session summary dictionary."""
+        return {
+            "session_id": row["session_id"],
+            "runner_type": row["runner_type"],
+            "status": row["status"],
+            "context": json.loads(row["context"]),
+            "start_time": row["start_time"],
+            "end_time": row["end_time"],
+            "fragment_count": row["fragment_count"],
+            "intelligence_summary": json.loads(row["intelligence_summary"])
+        }
+    
+    def close(self):
+        """Close the underlying database connection."""
+        self.conn.close()
+
 class PsychoNoirLogAggregator:
     """
     Main log aggregation engine implementing the "Kausalitets-Arkitekt" pattern.
@@ -154,10 +609,23 @@ class PsychoNoirLogAggregator:
     fabric for bidirectional learning and system improvement.
     """
     
-    def __init__(self, storage_path: str = None):
+    def __init__(self, storage_path: str = None, persistence: str = "sqlite",
+                 deduplicate: bool = True):
         self.storage_path = Path(storage_path or "/tmp/psycho-noir-logs")
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
+        # Fragment content is written once per unique chunk to the chunk
+        # store; with deduplicate=False it is kept inline (chunks written by
+        # earlier runs can still be read back)
+        self.deduplicate = deduplicate
+        self.chunks = ChunkStore(self.storage_path / "chunks.db")
+        
+        # "sqlite" persists to an indexed session store shared across CI jobs,
+        # "json" keeps the legacy one-file-per-session layout
+        self.persistence = persistence
+        self.store = (SessionStore(self.storage_path / "sessions.db", self.chunks)
+                      if persistence == "sqlite" else None)
+        
         self.active_sessions = {}
         self.completed_sessions = []
         self.intelligence_patterns = {}
@@ -174,6 +642,7 @@ class PsychoNoirLogAggregator:
                       context: Dict = None) -> RunnerSession:
         """Create a new runner session for log aggregation."""
         session = RunnerSession(session_id, runner_type, context)
+        session.chunk_store = self.chunks
         self.active_sessions[session_id] = session
         return session
     
@@ -193,6 +662,57 @@ class PsychoNoirLogAggregator:
         
         return True
     
+    def stream_log_content(self, session_id: str, lines: Iterable[str], source: str,
+                           metadata: Dict = None, chunk_lines: int = 5000) -> int:
+        """
+        Ingest log lines from an iterator or file handle with bounded memory.
+        
+        Lines are grouped into fragments of ``chunk_lines`` lines; each fragment
+        is folded into the session's running error-density counters and
+        signature set (the first ``RunnerSession.MAX_SPILLED_SIGNATURES``
+        distinct signatures), then spilled to a gzip-compressed segment next to the
+        session file instead of being held in ``session.fragments``.
+        
+        Returns the number of lines ingested.
+        """
+        if session_id not in self.active_sessions:
+            # Auto-create session if it doesn't exist
+            self.create_session(session_id, "auto-detected", {"auto_created": True})
+        
+        session = self.active_sessions[session_id]
+        if session.segment_path is None:
+            session.segment_path = self.storage_path / f"session_{session_id}.segment.jsonl.gz"
+        
+        line_count = 0
+        buffer = []
+        
+        with gzip.open(session.segment_path, 'at', encoding='utf-8') as segment:
+            for line in lines:
+                buffer.append(line.rstrip('\n'))
+                line_count += 1
+                
+                if len(buffer) >= chunk_lines:
+                    self._spill_chunk(session, buffer, source, metadata, segment)
+                    buffer = []
+            
+            if buffer:
+                self._spill_chunk(session, buffer, source, metadata, segment)
+        
+        return line_count
+    
+    def _spill_chunk(self, session: RunnerSession, buffer: List[str], source: str,
+                     metadata: Optional[Dict], segment):
+        """Turn a buffered chunk of lines into a fragment and spill it to disk."""
+        fragment = LogFragment("\n".join(buffer), source, metadata=dict(metadata or {}))
+        self._process_fragment_intelligence(fragment, session)
+        self._store_fragment_chunks(fragment)
+        session.spill_fragment(fragment, segment)
+    
+    def _store_fragment_chunks(self, fragment: LogFragment):
+        """Move a fragment's content into the chunk store, keeping only references."""
+        if self.deduplicate and fragment.chunk_refs is None:
+            fragment.chunk_refs = self.chunks.put(fragment.content)
+    
     def finalize_session(self, session_id: str, status: str = "COMPLETED") -> Optional[RunnerSession]:
         """Finalize a session and move it to completed sessions."""
         if session_id not in self.active_sessions:
@@ -259,6 +779,20 @@ class PsychoNoirLogAggregator:
     
     def _persist_session(self, session: RunnerSession):
         """Persist session data to storage."""
+        try:
+            for fragment in session.fragments:
+                self._store_fragment_chunks(fragment)
+        except sqlite3.Error as e:
+            # Fragments without chunk references are simply persisted inline
+            print(f"Warning: Failed to deduplicate session {session.session_id}: {e}")
+        
+        if self.store is not None:
+            try:
+                self.store.save_sessions([session])
+            except sqlite3.Error as e:
+                print(f"Warning: Failed to persist session {session.session_id}: {e}")
+            return
+        
         session_file = self.storage_path / f"session_{session.session_id}.json"
         
         try:
@@ -273,19 +807,52 @@ class PsychoNoirLogAggregator:
             "timestamp": datetime.now().isoformat(),
             "active_sessions": len(self.active_sessions),
             "completed_sessions": len(self.completed_sessions),
+            "persisted_sessions": self.store.count_sessions() if self.store else None,
+            "chunk_store": self.chunks.stats(),
             "global_patterns": self.global_patterns,
-            "session_summaries": [
-                {
-                    "session_id": session.session_id,
-                    "runner_type": session.runner_type,
-                    "status": session.status,
-                    "intelligence_summary": session.intelligence_summary
-                }
-                for session in self.completed_sessions[-10:]  # Last 10 sessions
-            ],
+            "session_summaries": self._recent_session_summaries(10),
             "bidirectional_insights": self._generate_bidirectional_insights()
         }
     
+    def _recent_session_summaries(self, limit: int) -> List[Dict]:
+        """Summaries of the most recent sessions, newest last."""
+        if self.store is not None:
+            return [
+                {
+                    "session_id": summary["session_id"],
+                    "runner_type": summary["runner_type"],
+                    "status": summary["status"],
+                    "intelligence_summary": summary["intelligence_summary"]
+                }
+                for summary in reversed(self.store.query_sessions(limit=limit))
+            ]
+        
+        return [
+            {
+                "session_id": session.session_id,
+                "runner_type": session.runner_type,
+                "status": session.status,
+                "intelligence_summary": session.intelligence_summary
+            }
+            for session in self.completed_sessions[-limit:]
+        ]
+    
+    def find_sessions(self, runner_type: str = None, status: str = None,
+                      since: str = None, limit: int = 10) -> List[Dict]:
+        """Query persisted session summaries, e.g. the last N failed sessions for a runner."""
+        if self.store is None:
+            matches = [
+                session.to_dict() for session in reversed(self.completed_sessions)
+                if (not runner_type or session.runner_type == runner_type)
+                and (not status or session.status == status)
+                and (not since or session.end_time.isoformat() >= since)
+            ]
+            for match in matches:
+                match.pop("fragments")
+            return matches[:limit]
+        
+        return self.store.query_sessions(runner_type, status, since, limit)
+    
     def _generate_bidirectional_insights(self) -> Dict:
         """Generate insights that can improve future runs."""
         insights = {
@@ -340,29 +907,41 @@ class PsychoNoirLogAggregator:
             else:
                 session = next((s for s in self.completed_sessions 
                               if s.session_id == session_id), None)
-            if not session:
-                return ""
+            if session:
+                return "\n".join(session.iter_fragment_contents())
             
-            return "\n".join(fragment.content for fragment in session.fragments)
+            # Fall back to sessions persisted by earlier runs
+            if self.store is not None and self.store.get_session(session_id):
+                return "\n".join(self.store.iter_fragment_contents(session_id))
+            return ""
         else:
             # Export all recent session data
             all_content = []
-            for session in self.completed_sessions[-5:]:  # Last 5 sessions
-                all_content.append(f"=== SESSION {session.session_id} ===")
-                for fragment in session.fragments:
-                    all_content.append(fragment.content)
-                all_content.append("=== END SESSION ===")
+            if self.store is not None:
+                for summary in reversed(self.store.query_sessions(limit=5)):  # Last 5 sessions
+                    all_content.append(f"=== SESSION {summary['session_id']} ===")
+                    all_content.extend(self.store.iter_fragment_contents(summary["session_id"]))
+                    all_content.append("=== END SESSION ===")
+            else:
+                for session in self.completed_sessions[-5:]:  # Last 5 sessions
+                    all_content.append(f"=== SESSION {session.session_id} ===")
+                    all_content.extend(session.iter_fragment_contents())
+                    all_content.append("=== END SESSION ===")
             
             return "\n".join(all_content)
 
 def main():
     """Command-line interface for log aggregation."""
-    if len(sys.argv) < 3:
+    session_free_commands = ("report", "export", "recent")
+    if len(sys.argv) < 2 or (sys.argv[1] not in session_free_commands and len(sys.argv) < 3):
         print("Usage: python log_aggregator.py <command> <session_id> [args...]")
         print("Commands:")
         print("  create <session_id> <runner_type> [context_json]")
         print("  add <session_id> <log_file> <source>")
+        print("  stream <session_id> <log_file|-> <source>")
         print("  finalize <session_id> [status]")
+        print("  export [session_id]")
+        print("  recent [runner_type] [status] [limit]")
         print("  report")
         sys.exit(1)
     
@@ -398,6 +977,24 @@ def main():
             print(f"Error: Log file '{log_file}' not found")
             sys.exit(1)
             
+    elif command == "stream":
+        session_id = sys.argv[2]
+        log_file = sys.argv[3] if len(sys.argv) > 3 else "-"
+        source = sys.argv[4] if len(sys.argv) > 4 else "unknown"
+        
+        try:
+            if log_file == "-":
+                line_count = aggregator.stream_log_content(session_id, sys.stdin, source)
+            else:
+                with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                    line_count = aggregator.stream_log_content(session_id, f, source)
+            
+            print(f"Streamed {line_count} lines into session: {session_id}")
+            
+        except FileNotFoundError:
+            print(f"Error: Log file '{log_file}' not found")
+            sys.exit(1)
+            
     elif command == "finalize":
         session_id = sys.argv[2]
         status = sys.argv[3] if len(sys.argv) > 3 else "COMPLETED"
@@ -409,6 +1006,18 @@ def main():
         else:
             print(f"Session not found: {session_id}")
             
+    elif command == "export":
+        session_id = sys.argv[2] if len(sys.argv) > 2 else None
+        print(aggregator.export_for_classification(session_id))
+        
+    elif command == "recent":
+        runner_type = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] != "-" else None
+        status = sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != "-" else None
+        limit = int(sys.argv[4]) if len(sys.argv) > 4 else 10
+        
+        sessions = aggregator.find_sessions(runner_type, status, limit=limit)
+        print(json.dumps(sessions, indent=2))
+        
     elif command == "report":
         report = aggregator.get_intelligence_report()
         print(json.dumps(report, indent=2))
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Live Tail Daemon for the Psycho-Noir Log Aggregator
+
+Follows growing runner log files (or a pipe) while the job is still running
+and feeds every new line through the aggregator and the error classifier as
+it arrives. RED classifications are emitted as JSON lines on stdout within a
+poll interval of the line being written, so a failing job can be flagged
+mid-run instead of after the post-processing step.
+
+Per-file read offsets are checkpointed next to the session segment together
+with the session's running counters, so a restarted daemon resumes where it
+stopped instead of re-ingesting the log or starting a fresh session.
+"""
+
+import json
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "error-classifier"))
+
+from psycho_noir_aggregator import PsychoNoirLogAggregator
+from psycho_noir_classifier import PsychoNoirErrorClassifier, ClassificationLevel
+
+class TailOffsets:
+    """
+    Restart-safe read offsets for the files followed by one session.
+    
+    Offsets are keyed by absolute path and remember the file's inode, so a
+    rotated or truncated log is re-read from the start instead of resuming
+    at a stale position. The same checkpoint carries the tail's counters and
+    the aggregator session's streaming state, which match the offsets.
+    """
+    
+    def __init__(self, offsets_path: Path):
+        self.offsets_path = Path(offsets_path)
+        self.files = {}
+        self.red_count = 0
+        self.lines_processed = 0
+        self.classification_level = None
+        self.session_state = None
+        
+        if self.offsets_path.exists():
+            try:
+                with open(self.offsets_path, 'r') as f:
+                    state = json.load(f)
+                self.files = state.get("files", {})
+                self.red_count = state.get("red_count", 0)
+                self.lines_processed = state.get("lines_processed", 0)
+                self.classification_level = state.get("classification_level")
+                self.session_state = state.get("session")
+            except (json.JSONDecodeError, OSError):
+                print(f"Warning: Ignoring unreadable tail offsets '{self.offsets_path}'", file=sys.stderr)
+    
+    def position(self, path: str, stat: os.stat_result) -> int:
+        """Return the offset to resume reading ``path`` from."""
+        entry = self.files.get(path)
+        if not entry or entry["inode"] != stat.st_ino or entry["offset"] > stat.st_size:
+            return 0
+        return entry["offset"]
+    
+    def advance(self, path: str, inode: int, offset: int):
+        """Record that ``path`` has been consumed up to ``offset``."""
+        self.files[path] = {"inode": inode, "offset": offset}
+    
+    def save(self):
+        """Atomically checkpoint the offsets to disk."""
+        temp_path = self.offsets_path.with_suffix(".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump({
+                "files": self.files,
+                "red_count": self.red_count,
+                "lines_processed": self.lines_processed,
+                "classification_level": self.classification_level,
+                "session": self.session_state,
+                "updated_at": datetime.now().isoformat()
+            }, f)
+        os.replace(temp_path, self.offsets_path)
+
+class FollowedFile:
+    """A log file followed by polling for growth from a saved offset."""
+    
+    def __init__(self, path: str, offsets: TailOffsets):
+        self.path = str(Path(path).resolve())
+        self.source = Path(path).name
+        self.offsets = offsets
+        self.handle = None
+        self.inode = None
+        self.offset = 0
+        self.partial = b""
+    
+    def _open(self) -> bool:
+        """(Re)open the file, resuming from the checkpointed offset."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        
+        if self.handle is not None:
+            self.handle.close()
+        
+        self.handle = open(self.path, 'rb')
+        self.inode = stat.st_ino
+        self.offset = self.offsets.position(self.path, stat)
+        self.partial = b""
+        self.handle.seek(self.offset)
+        return True
+    
+    def read_lines(self) -> List[str]:
+        """Return the complete lines appended since the last call."""
+        if self.handle is None and not self._open():
+            return []
+        
+        data = self.handle.read()
+        if not data:
+            # Reopen on rotation (new inode) or truncation (file shrank) once
+            # the old handle has been drained
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return []
+            if stat.st_ino == self.inode and stat.st_size >= self.offset + len(self.partial):
+                return []
+            if not self._open():
+                return []
+            data = self.handle.read()
+        
+        data = self.partial + data
+        complete, newline, self.partial = data.rpartition(b"\n")
+        if not newline:
+            return []
+        
+        # Only complete lines count as consumed; a trailing partial line is
+        # re-read after a restart
+        self.offset += len(complete) + 1
+        return complete.decode('utf-8', errors='replace').split("\n")
+    
+    def checkpoint(self):
+        """Record the consumed offset for this file."""
+        self.offsets.advance(self.path, self.inode, self.offset)
+    
+    def close(self):
+        if self.handle is not None:
+            self.handle.close()
+
+class FollowedPipe:
+    """A pipe (e.g. stdin) drained by a reader thread so polling never blocks."""
+    
+    def __init__(self, stream: TextIO, source: str = "stdin"):
+        self.source = source
+        self.lines = queue.Queue()
+        self.closed = threading.Event()
+        self.reader = threading.Thread(target=self._read, args=(stream,), daemon=True)
+        self.reader.start()
+    
+    def _read(self, stream: TextIO):
+        for line in stream:
+            self.lines.put(line.rstrip('\n'))
+        self.closed.set()
+    
+    def read_lines(self) -> List[str]:
+        """Return every line received since the last call."""
+        lines = []
+        while True:
+            try:
+                lines.append(self.lines.get_nowait())
+            except queue.Empty:
+                return lines
+    
+    @property
+    def exhausted(self) -> bool:
+        return self.closed.is_set() and self.lines.empty()
+    
+    def checkpoint(self):
+        """Pipes cannot be rewound, so there is no offset to record."""
+    
+    def close(self):
+        pass
+
+class PsychoNoirLogTail:
+    """
+    Long-running tail mode for the aggregator and classifier.
+    
+    Every poll interval the followed sources are drained of complete lines;
+    new lines are classified immediately (RED matches are emitted as soon as
+    they are seen), then streamed into the aggregator session and the read
+    offsets are checkpointed. A tail started on an existing checkpoint
+    continues the same session (sequence numbers, counters, signatures).
+    """
+    
+    def __init__(self, session_id: str, storage_path: str = None, runner_type: str = "live-tail",
+                 context: Dict = None, poll_interval: float = 0.25, output: TextIO = None):
+        self.session_id = session_id
+        self.poll_interval = poll_interval
+        self.output = output or sys.stdout
+        
+        self.aggregator = PsychoNoirLogAggregator(storage_path)
+        self.classifier = PsychoNoirErrorClassifier()
+        self.session = self.aggregator.create_session(session_id, runner_type, 
+                                                      context or {"live_tail": True})
+        
+        self.offsets = TailOffsets(self.aggregator.storage_path / f"session_{session_id}.tail.json")
+        if self.offsets.session_state:
+            self.session.restore_streaming_state(self.offsets.session_state)
+        
+        self.sources = []
+        if self.offsets.classification_level:
+            self.highest_level = ClassificationLevel(self.offsets.classification_level)
+        else:
+            self.highest_level = ClassificationLevel.RED if self.offsets.red_count else ClassificationLevel.GREEN
+        self.lines_processed = self.offsets.lines_processed
+        self._stop = threading.Event()
+    
+    def follow_file(self, path: str):
+        """Follow a (possibly not yet existing) log file."""
+        self.sources.append(FollowedFile(path, self.offsets))
+    
+    def follow_pipe(self, stream: TextIO, source: str = "stdin"):
+        """Follow a pipe until it is closed."""
+        self.sources.append(FollowedPipe(stream, source))
+    
+    def stop(self, *_):
+        """Request the run loop to exit after the current poll."""
+        self._stop.set()
+    
+    def poll_once(self) -> int:
+        """Process all lines that arrived since the last poll; returns the line count."""
+        processed = 0
+        
+        for source in self.sources:
+            lines = source.read_lines()
+            if not lines:
+                continue
+            
+            self._classify_lines(lines, source.source)
+            self.aggregator.stream_log_content(self.session_id, lines, source.source,
+                                               metadata={"live_tail": True})
+            source.checkpoint()
+            processed += len(lines)
+        
+        if processed:
+            self.lines_processed += processed
+            self.offsets.lines_processed = self.lines_processed
+            self.offsets.classification_level = self.highest_level.value
+            self.offsets.session_state = self.session.streaming_state()
+            self.offsets.save()
+        
+        return processed
+    
+    def _classify_lines(self, lines: List[str], source: str):
+        """Classify a batch of new lines and emit every RED match."""
+        result = self.classifier.classify_log_content("\n".join(lines), {"source": source})
+        
+        for match in result["matched_signatures"]:
+            if match["level"] != ClassificationLevel.RED.value:
+                continue
+            
+            self.offsets.red_count += 1
+            self._emit({
+                "event": "RED",
+                "session_id": self.session_id,
+                "source": source,
+                "category": match["category"],
+                "pattern": match["pattern"],
+                "line": match["line"],
+                "occurrence_count": match["occurrence_count"],
+                "detected_at": datetime.now().isoformat()
+            })
+        
+        level = result["classification_level"]
+        if level == ClassificationLevel.RED or (level == ClassificationLevel.YELLOW and
+                                                self.highest_level == ClassificationLevel.GREEN):
+            self.highest_level = level
+    
+    def _emit(self, event: Dict):
+        self.output.write(json.dumps(event) + "\n")
+        self.output.flush()
+    
+    def run(self, idle_timeout: float = None):
+        """
+        Poll the sources until stopped, every pipe is closed, or no new line
+        has arrived for ``idle_timeout`` seconds.
+        """
+        last_activity = time.monotonic()
+        
+        while not self._stop.is_set():
+            if self.poll_once():
+                last_activity = time.monotonic()
+            elif idle_timeout is not None and time.monotonic() - last_activity >= idle_timeout:
+                break
+            
+            pipes = [source for source in self.sources if isinstance(source, FollowedPipe)]
+            if pipes and len(pipes) == len(self.sources) and all(pipe.exhausted for pipe in pipes):
+                break
+            
+            self._stop.wait(self.poll_interval)
+        
+        # Drain whatever arrived between the last poll and the stop request
+        self.poll_once()
+    
+    def finalize(self, status: str = None):
+        """Finalize the aggregator session; RED sessions are marked FAILED."""
+        if status is None:
+            status = "FAILED" if self.highest_level == ClassificationLevel.RED else "COMPLETED"
+        
+        for source in self.sources:
+            source.close()
+        return self.aggregator.finalize_session(self.session_id, status)
+    
+    def summary(self) -> Dict:
+        return {
+            "event": "SUMMARY",
+            "session_id": self.session_id,
+            "lines_processed": self.lines_processed,
+            "red_count": self.offsets.red_count,
+            "classification_level": self.highest_level.value
+        }
+
+def main():
+    """Command-line interface for the live tail daemon."""
+    if len(sys.argv) < 3:
+        print("Usage: python psycho_noir_tail.py <session_id> <log_file|-> [log_file...] [options]")
+        print("Options:")
+        print("  --storage <path>        aggregator storage path")
+        print("  --interval <seconds>    poll interval (default 0.25)")
+        print("  --idle-timeout <secs>   exit after this long without new lines")
+        print("  --finalize              finalize the session on exit (FAILED if RED seen)")
+        sys.exit(1)
+    
+    session_id = sys.argv[1]
+    paths = []
+    storage_path = os.environ.get("PSYCHO_NOIR_STORAGE")
+    poll_interval = 0.25
+    idle_timeout = None
+    finalize = False
+    
+    args = iter(sys.argv[2:])
+    for arg in args:
+        if arg == "--storage":
+            storage_path = next(args, storage_path)
+        elif arg == "--interval":
+            poll_interval = float(next(args, poll_interval))
+        elif arg == "--idle-timeout":
+            idle_timeout = float(next(args, 0))
+        elif arg == "--finalize":
+            finalize = True
+        else:
+            paths.append(arg)
+    
+    # stdout carries only the JSON-lines alert stream; warnings printed by the
+    # aggregator (e.g. on finalize) go to stderr instead
+    alerts = sys.stdout
+    sys.stdout = sys.stderr
+    
+    tail = PsychoNoirLogTail(session_id, storage_path, poll_interval=poll_interval, output=alerts)
+    for path in paths:
+        if path == "-":
+            tail.follow_pipe(sys.stdin)
+        else:
+            tail.follow_file(path)
+    
+    signal.signal(signal.SIGTERM, tail.stop)
+    signal.signal(signal.SIGINT, tail.stop)
+    
+    tail.run(idle_timeout)
+    
+    if finalize:
+        tail.finalize()
+    tail._emit(tail.summary())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Restart checks for the live tail daemon: a tail stopped and restarted
+mid-file must finalize the same session as one uninterrupted run.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from psycho_noir_tail import PsychoNoirLogTail
+
+FIRST_HALF = [f"Build step {i}" for i in range(40)] + ["ERROR: ModuleNotFoundError: No module named 'x'"]
+SECOND_HALF = ["WARN: retrying download"] + [f"Test case {i} ok" for i in range(40)] + ["ERROR: boom"]
+
+def _append(log_path, lines):
+    with open(log_path, 'a') as f:
+        f.write("\n".join(lines) + "\n")
+
+def _tail(storage, log_path):
+    tail = PsychoNoirLogTail("job", str(storage), output=io.StringIO())
+    tail.follow_file(str(log_path))
+    return tail
+
+def _finalized(tail):
+    session = tail.finalize()
+    summary = dict(session.intelligence_summary)
+    summary.pop("session_duration")
+    summary["pattern_signatures"] = sorted(summary["pattern_signatures"])
+    contents = list(tail.aggregator.store.iter_fragment_contents("job"))
+    return summary, contents, tail.summary()
+
+def _uninterrupted(tmp_path):
+    log_path = tmp_path / "single.log"
+    tail = _tail(tmp_path / "single", log_path)
+    _append(log_path, FIRST_HALF)
+    tail.poll_once()
+    _append(log_path, SECOND_HALF)
+    tail.poll_once()
+    return _finalized(tail)
+
+def test_restart_mid_file_matches_uninterrupted_run(tmp_path):
+    log_path = tmp_path / "restarted.log"
+    tail = _tail(tmp_path / "restarted", log_path)
+    _append(log_path, FIRST_HALF)
+    tail.poll_once()
+    
+    _append(log_path, SECOND_HALF)
+    tail = _tail(tmp_path / "restarted", log_path)
+    tail.poll_once()
+    
+    assert _finalized(tail) == _uninterrupted(tmp_path)
+
+def test_restart_after_unsaved_spill_matches_uninterrupted_run(tmp_path):
+    log_path = tmp_path / "restarted.log"
+    tail = _tail(tmp_path / "restarted", log_path)
+    _append(log_path, FIRST_HALF)
+    tail.poll_once()
+    
+    # Killed after spilling the second half but before checkpointing its offsets
+    _append(log_path, SECOND_HALF)
+    tail.aggregator.stream_log_content("job", SECOND_HALF, log_path.name)
+    tail = _tail(tmp_path / "restarted", log_path)
+    tail.poll_once()
+    
+    assert _finalized(tail) == _uninterrupted(tmp_path)
@@ -8,14 +8,325 @@ reports and pushes to the necropolis branch for persistent knowledge storage.
 """
 
 import argparse
+import io
 import json
 import os
-import shutil
 import zipfile
-from collections import defaultdict, Counter
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path, PurePosixPath
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+OUTCOME_FILES = ("outcome.ndjson", "outcome.json")
+PSYCHO_NOIR_KEYWORDS = ['KAUSALITETS_ARKITEKTEN', 'SYNTETISKE_SYNAPSER', 'RUSTBELT_IMPROVISATION']
+
+class TopKSketch:
+    """
+    Space-Saving heavy-hitter sketch with per-key examples.
+    
+    Exact while the number of distinct keys stays within ``capacity`` (or
+    when ``capacity`` is None); beyond that the least frequent key is evicted
+    and each count may overestimate by at most its recorded ``error``.
+    Sketches merge associatively, so per-run and per-day sketches can be
+    combined in any grouping.
+    """
+    
+    def __init__(self, capacity: Optional[int] = None, examples: int = 3):
+        self.capacity = capacity
+        self.examples = examples
+        # key -> {'count', 'error', 'examples'}, in first-seen order
+        self.entries = {}
+        # Keys dropped so far (here or in merged sketches); counts are exact while 0
+        self.evicted = 0
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    @property
+    def full(self) -> bool:
+        return self.capacity is not None and len(self.entries) >= self.capacity
+    
+    @property
+    def approximate(self) -> bool:
+        return self.evicted > 0
+    
+    def min_count(self) -> int:
+        return min(entry['count'] for entry in self.entries.values()) if self.entries else 0
+    
+    def add(self, key: str, example: Any = None, count: int = 1):
+        """Count ``key``, evicting the least frequent key if the sketch is full."""
+        entry = self.entries.get(key)
+        if entry is None:
+            floor = 0
+            if self.full:
+                evicted = min(self.entries, key=lambda k: self.entries[k]['count'])
+                floor = self.entries.pop(evicted)['count']
+                self.evicted += 1
+            entry = self.entries[key] = {'count': floor, 'error': floor, 'examples': []}
+        
+        entry['count'] += count
+        if example is not None and len(entry['examples']) < self.examples:
+            entry['examples'].append(example)
+    
+    def merge(self, other: 'TopKSketch') -> 'TopKSketch':
+        """Merge ``other`` into this sketch (keys missing on one side count as its minimum)."""
+        own_floor = self.min_count() if self.approximate else 0
+        other_floor = other.min_count() if other.approximate else 0
+        
+        merged = {}
+        for key in list(self.entries) + [key for key in other.entries if key not in self.entries]:
+            own = self.entries.get(key)
+            theirs = other.entries.get(key)
+            merged[key] = {
+                'count': (own['count'] if own else own_floor) + (theirs['count'] if theirs else other_floor),
+                'error': (own['error'] if own else own_floor) + (theirs['error'] if theirs else other_floor),
+                'examples': ((own['examples'] if own else []) + 
+                             (theirs['examples'] if theirs else []))[:self.examples]
+            }
+        
+        self.evicted += other.evicted
+        if self.capacity is not None and len(merged) > self.capacity:
+            keep = {key for key, _ in sorted(merged.items(), key=lambda x: x[1]['count'], 
+                                             reverse=True)[:self.capacity]}
+            self.evicted += len(merged) - len(keep)
+            merged = {key: entry for key, entry in merged.items() if key in keep}
+        
+        self.entries = merged
+        return self
+    
+    def top(self, limit: int = 10) -> List[Tuple[str, Dict]]:
+        """Most frequent keys; ties keep first-seen order."""
+        return sorted(self.entries.items(), key=lambda x: x[1]['count'], reverse=True)[:limit]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'capacity': self.capacity, 'entries': self.entries, 'evicted': self.evicted}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], capacity: Optional[int] = None, 
+                  examples: int = 3) -> 'TopKSketch':
+        sketch = cls(data.get('capacity') if capacity is None else capacity, examples)
+        sketch.entries = data.get('entries', {})
+        # State saved before evictions were tracked: a full sketch may have evicted
+        sketch.evicted = data.get('evicted', int(sketch.full))
+        if sketch.capacity is not None and len(sketch.entries) > sketch.capacity:
+            sketch.merge(cls(examples=examples))
+        return sketch
+
+class TaxonomyAccumulator:
+    """
+    Incremental, mergeable state behind the taxonomy report.
+    
+    Outcomes are folded in one at a time, so the aggregator never has to hold
+    the whole matrix in memory; only counters, fingerprint counts and the few
+    examples that end up in the report are kept. Accumulators persist via
+    to_dict/from_dict and merge associatively, which is what the rolling
+    knowledge base is built from.
+    """
+    
+    EXAMPLES = 3
+    STATE_VERSION = 1
+    
+    def __init__(self, fingerprint_capacity: Optional[int] = None):
+        self.runs = 0
+        self.total_outcomes = 0
+        self.total_failures = 0
+        self.total_successes = 0
+        self.error_types = Counter()
+        self.category_stats = defaultdict(lambda: {'total': 0, 'failures': 0, 'success_rate': 0})
+        self.variant_stats = defaultdict(lambda: {'total': 0, 'failures': 0})
+        self.fingerprint_groups = TopKSketch(fingerprint_capacity, self.EXAMPLES)
+        self.psycho_noir_patterns = {}
+        self.psycho_noir_failures = 0
+    
+    def add(self, outcome: Dict[str, Any]):
+        """Fold a single outcome into the running totals."""
+        self.total_outcomes += 1
+        is_failure = outcome.get('outcome') == 'FAILURE'
+        if outcome.get('outcome') == 'SUCCESS':
+            self.total_successes += 1
+        
+        category = self.category_stats[outcome.get('category', 'unknown')]
+        category['total'] += 1
+        variant = self.variant_stats[outcome.get('variant', 'unknown')]
+        variant['total'] += 1
+        
+        if not is_failure:
+            return
+        
+        self.total_failures += 1
+        category['failures'] += 1
+        variant['failures'] += 1
+        
+        error_type = outcome.get('error_type', 'UNKNOWN')
+        self.error_types[error_type] += 1
+        
+        # Fingerprint analysis for similar failures
+        self.fingerprint_groups.add(outcome.get('fingerprint', 'NO_FINGERPRINT'), outcome['name'])
+        
+        # Psycho-Noir specific analysis
+        error_type = outcome.get('error_type', '')
+        for keyword in PSYCHO_NOIR_KEYWORDS:
+            if keyword in error_type:
+                pattern = self.psycho_noir_patterns.setdefault(keyword, {'count': 0, 'examples': []})
+                pattern['count'] += 1
+                if len(pattern['examples']) < self.EXAMPLES:
+                    pattern['examples'].append(outcome['fingerprint'])
+        if any(kw in error_type for kw in ['KAUSALITETS', 'SYNTETISKE', 'RUSTBELT']):
+            self.psycho_noir_failures += 1
+    
+    def top_fingerprints(self, limit: int = 10) -> List[Tuple[str, Dict]]:
+        """Most frequent fingerprints; ties keep first-seen order."""
+        return self.fingerprint_groups.top(limit)
+    
+    def merge(self, other: 'TaxonomyAccumulator') -> 'TaxonomyAccumulator':
+        """Fold another accumulator (a run, a day, ...) into this one."""
+        self.runs += other.runs
+        self.total_outcomes += other.total_outcomes
+        self.total_failures += other.total_failures
+        self.total_successes += other.total_successes
+        self.error_types.update(other.error_types)
+        self.psycho_noir_failures += other.psycho_noir_failures
+        
+        for own_stats, other_stats in ((self.category_stats, other.category_stats), 
+                                       (self.variant_stats, other.variant_stats)):
+            for key, stats in other_stats.items():
+                own_stats[key]['total'] += stats['total']
+                own_stats[key]['failures'] += stats['failures']
+        
+        self.fingerprint_groups.merge(other.fingerprint_groups)
+        
+        for keyword, pattern in other.psycho_noir_patterns.items():
+            own = self.psycho_noir_patterns.setdefault(keyword, {'count': 0, 'examples': []})
+            own['count'] += pattern['count']
+            own['examples'] = (own['examples'] + pattern['examples'])[:self.EXAMPLES]
+        
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': self.STATE_VERSION,
+            'runs': self.runs,
+            'total_outcomes': self.total_outcomes,
+            'total_failures': self.total_failures,
+            'total_successes': self.total_successes,
+            'error_types': dict(self.error_types),
+            'category_stats': {key: {'total': stats['total'], 'failures': stats['failures']} 
+                               for key, stats in self.category_stats.items()},
+            'variant_stats': dict(self.variant_stats),
+            'fingerprints': self.fingerprint_groups.to_dict(),
+            'psycho_noir_patterns': self.psycho_noir_patterns,
+            'psycho_noir_failures': self.psycho_noir_failures
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], 
+                  fingerprint_capacity: Optional[int] = None) -> 'TaxonomyAccumulator':
+        accumulator = cls(fingerprint_capacity)
+        accumulator.runs = data.get('runs', 0)
+        accumulator.total_outcomes = data.get('total_outcomes', 0)
+        accumulator.total_failures = data.get('total_failures', 0)
+        accumulator.total_successes = data.get('total_successes', 0)
+        accumulator.error_types = Counter(data.get('error_types', {}))
+        for key, stats in data.get('category_stats', {}).items():
+            accumulator.category_stats[key].update(stats)
+        for key, stats in data.get('variant_stats', {}).items():
+            accumulator.variant_stats[key].update(stats)
+        accumulator.fingerprint_groups = TopKSketch.from_dict(
+            data.get('fingerprints', {}), fingerprint_capacity, cls.EXAMPLES
+        )
+        accumulator.psycho_noir_patterns = data.get('psycho_noir_patterns', {})
+        accumulator.psycho_noir_failures = data.get('psycho_noir_failures', 0)
+        return accumulator
+    
+    def finalize_category_stats(self) -> Dict[str, Dict]:
+        """Calculate success rates from the accumulated counts."""
+        for category, stats in self.category_stats.items():
+            if stats['total'] > 0:
+                stats['success_rate'] = round((stats['total'] - stats['failures']) / stats['total'] * 100, 2)
+        return self.category_stats
+
+class NecropolisKnowledgeBase:
+    """
+    Persistent, mergeable taxonomy state for the Necropolis store.
+    
+    Each run's accumulator is merged into an all-time state and into the
+    state of its UTC day (``state/all_time.json``, ``state/daily/<date>.json``).
+    Rolling reports are rebuilt from those summaries alone, so old run
+    directories are never re-read. State is loaded from ``source_dir`` (e.g.
+    the knowledge base checked out from the necropolis branch) and written to
+    ``target_dir``.
+    """
+    
+    FINGERPRINT_CAPACITY = 1000
+    
+    def __init__(self, target_dir: Path, source_dir: Optional[Path] = None, 
+                 fingerprint_capacity: int = FINGERPRINT_CAPACITY):
+        self.target_dir = Path(target_dir) / "state"
+        self.source_dir = Path(source_dir) / "state" if source_dir else self.target_dir
+        self.fingerprint_capacity = fingerprint_capacity
+    
+    def _load(self, relative: str) -> TaxonomyAccumulator:
+        """Load a saved state, preferring one already written to the target."""
+        for base in (self.target_dir, self.source_dir):
+            path = base / relative
+            if path.exists():
+                try:
+                    with open(path, 'r') as f:
+                        data = json.load(f)
+                    return TaxonomyAccumulator.from_dict(data, self.fingerprint_capacity)
+                except (json.JSONDecodeError, OSError) as e:
+                    print(f"⚠️ Ignoring unreadable knowledge base state {path}: {e}")
+        return TaxonomyAccumulator(self.fingerprint_capacity)
+    
+    def _save(self, relative: str, accumulator: TaxonomyAccumulator, **extra):
+        path = self.target_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(dict(accumulator.to_dict(), **extra), f)
+        os.replace(temp_path, path)
+    
+    def _recorded_runs(self) -> List[str]:
+        """Run ids already merged into the all-time state."""
+        for base in (self.target_dir, self.source_dir):
+            path = base / "all_time.json"
+            if path.exists():
+                try:
+                    with open(path, 'r') as f:
+                        return json.load(f).get('recorded_runs', [])
+                except (json.JSONDecodeError, OSError):
+                    return []
+        return []
+    
+    def record_run(self, accumulator: TaxonomyAccumulator, run_id: str, timestamp: datetime) -> bool:
+        """Merge one run into the all-time and daily state; re-recording a run id is a no-op."""
+        recorded_runs = self._recorded_runs()
+        if run_id != 'unknown':
+            if run_id in recorded_runs:
+                print(f"ℹ️ Run {run_id} already recorded in the knowledge base")
+                return False
+            recorded_runs.append(run_id)
+        
+        run = TaxonomyAccumulator(self.fingerprint_capacity).merge(accumulator)
+        run.runs = 1
+        
+        daily = f"daily/{timestamp.strftime('%Y-%m-%d')}.json"
+        self._save(daily, self._load(daily).merge(run), updated_at=timestamp.isoformat())
+        self._save("all_time.json", self.all_time().merge(run), 
+                   recorded_runs=recorded_runs, updated_at=timestamp.isoformat())
+        return True
+    
+    def all_time(self) -> TaxonomyAccumulator:
+        return self._load("all_time.json")
+    
+    def window(self, days: int, until: datetime) -> TaxonomyAccumulator:
+        """Merge the daily states of the ``days`` days ending with ``until``."""
+        merged = TaxonomyAccumulator(self.fingerprint_capacity)
+        for offset in range(days - 1, -1, -1):
+            day = (until - timedelta(days=offset)).strftime('%Y-%m-%d')
+            merged.merge(self._load(f"daily/{day}.json"))
+        return merged
 
 class NecropolisAggregator:
     """
@@ -58,88 +369,101 @@ class NecropolisAggregator:
         """Extract outcome data from artifact."""
         outcomes = []
         
-        if artifact_path.suffix == ".zip":
-            # Extract zip and look for outcome files
-            with zipfile.ZipFile(artifact_path, 'r') as zf:
-                extract_dir = self.artifacts_dir / f"extracted_{artifact_path.stem}"
-                extract_dir.mkdir(exist_ok=True)
-                zf.extractall(extract_dir)
-                
-                # Find outcome files in extracted content
-                for outcome_file in extract_dir.rglob("outcome.json"):
-                    try:
-                        with open(outcome_file, 'r') as f:
-                            outcomes.append(json.load(f))
-                    except (json.JSONDecodeError, FileNotFoundError) as e:
-                        print(f"⚠️ Failed to read {outcome_file}: {e}")
-                
-                # Clean up extracted files
-                shutil.rmtree(extract_dir, ignore_errors=True)
-        
-        elif artifact_path.name == "outcome.json":
-            try:
-                with open(artifact_path, 'r') as f:
-                    outcomes.append(json.load(f))
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                print(f"⚠️ Failed to read {artifact_path}: {e}")
+        try:
+            if artifact_path.suffix == ".zip":
+                # Read outcome files straight out of the archive, nothing is extracted
+                with zipfile.ZipFile(artifact_path, 'r') as zf:
+                    for member in self._select_outcome_members(zf.namelist()):
+                        with zf.open(member) as f:
+                            outcomes.extend(self._read_outcomes(f, f"{artifact_path.name}:{member}", member))
+            
+            elif artifact_path.name in OUTCOME_FILES:
+                # A loose outcome.json is only the pretty copy of a sibling outcome.ndjson
+                if artifact_path.name == "outcome.json" and artifact_path.with_name("outcome.ndjson").exists():
+                    return outcomes
+                with open(artifact_path, 'rb') as f:
+                    outcomes.extend(self._read_outcomes(f, str(artifact_path), artifact_path.name))
+        
+        except (zipfile.BadZipFile, OSError, UnicodeDecodeError) as e:
+            print(f"⚠️ Failed to read {artifact_path}: {e}")
         
         return outcomes
 
-    def aggregate_outcomes(self, all_outcomes: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Aggregate all outcomes into comprehensive taxonomy report."""
-        
-        # Basic statistics
-        total_outcomes = len(all_outcomes)
-        failures = [o for o in all_outcomes if o.get('outcome') == 'FAILURE']
-        successes = [o for o in all_outcomes if o.get('outcome') == 'SUCCESS']
-        
-        # Error type classification
-        error_types = Counter(o.get('error_type', 'UNKNOWN') for o in failures)
-        
-        # Category breakdown
-        category_stats = defaultdict(lambda: {'total': 0, 'failures': 0, 'success_rate': 0})
-        for outcome in all_outcomes:
-            category = outcome.get('category', 'unknown')
-            category_stats[category]['total'] += 1
-            if outcome.get('outcome') == 'FAILURE':
-                category_stats[category]['failures'] += 1
-        
-        # Calculate success rates
-        for category, stats in category_stats.items():
-            if stats['total'] > 0:
-                stats['success_rate'] = round((stats['total'] - stats['failures']) / stats['total'] * 100, 2)
+    @staticmethod
+    def _select_outcome_members(names: List[str]) -> List[str]:
+        """Pick one outcome file per archive directory, preferring outcome.ndjson."""
+        selected = {}
+        for name in names:
+            path = PurePosixPath(name)
+            if path.name not in OUTCOME_FILES:
+                continue
+            current = selected.get(path.parent)
+            if current is None or path.name == OUTCOME_FILES[0]:
+                selected[path.parent] = name
+        return sorted(selected.values())
+
+    @staticmethod
+    def _read_outcomes(stream, label: str, name: str) -> Iterator[Dict[str, Any]]:
+        """Parse an outcome file stream: one record per line for .ndjson, one document otherwise."""
+        text = io.TextIOWrapper(stream, encoding='utf-8')
         
-        # Fingerprint analysis for similar failures
-        fingerprint_groups = defaultdict(list)
-        for outcome in failures:
-            fingerprint = outcome.get('fingerprint', 'NO_FINGERPRINT')
-            fingerprint_groups[fingerprint].append(outcome)
-        
-        # Sort by frequency
-        top_fingerprints = sorted(
-            fingerprint_groups.items(),
-            key=lambda x: len(x[1]),
-            reverse=True
-        )[:10]
-        
-        # Variant analysis
-        variant_stats = defaultdict(lambda: {'total': 0, 'failures': 0})
-        for outcome in all_outcomes:
-            variant = outcome.get('variant', 'unknown')
-            variant_stats[variant]['total'] += 1
-            if outcome.get('outcome') == 'FAILURE':
-                variant_stats[variant]['failures'] += 1
+        if not name.endswith(".ndjson"):
+            try:
+                yield json.load(text)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                print(f"⚠️ Failed to read {label}: {e}")
+            return
         
-        # Psycho-Noir specific analysis
-        psycho_noir_patterns = {}
-        pn_keywords = ['KAUSALITETS_ARKITEKTEN', 'SYNTETISKE_SYNAPSER', 'RUSTBELT_IMPROVISATION']
-        for keyword in pn_keywords:
-            matching_failures = [o for o in failures if keyword in o.get('error_type', '')]
-            if matching_failures:
-                psycho_noir_patterns[keyword] = {
-                    'count': len(matching_failures),
-                    'examples': [o['fingerprint'] for o in matching_failures[:3]]
-                }
+        for line_number, line in enumerate(text, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"⚠️ Failed to read {label} line {line_number}: {e}")
+
+    def iter_artifact_outcomes(self, artifacts: List[Path], 
+                               workers: Optional[int] = None) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+        """
+        Read artifacts concurrently, yielding their outcomes in artifact order.
+        
+        Zip inflation and file reads release the GIL, so a thread pool keeps
+        many artifacts in flight; the ordered yield keeps reports (and the
+        individual outcome file numbering) deterministic. At most two
+        artifacts per worker are read ahead of the consumer, so memory stays
+        bounded however many artifacts there are.
+        """
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for artifact in artifacts:
+                pending.append((artifact, executor.submit(self.extract_artifact_data, artifact)))
+                if len(pending) >= 2 * workers:
+                    artifact, future = pending.popleft()
+                    yield artifact, future.result()
+            
+            while pending:
+                artifact, future = pending.popleft()
+                yield artifact, future.result()
+
+    def aggregate_outcomes(self, all_outcomes) -> Dict[str, Any]:
+        """
+        Aggregate all outcomes into comprehensive taxonomy report.
+        
+        Accepts any iterable of outcomes (consumed once), or an already
+        filled TaxonomyAccumulator.
+        """
+        if isinstance(all_outcomes, TaxonomyAccumulator):
+            accumulator = all_outcomes
+        else:
+            accumulator = TaxonomyAccumulator()
+            for outcome in all_outcomes:
+                accumulator.add(outcome)
+        
+        total_outcomes = accumulator.total_outcomes
+        error_types = accumulator.error_types
+        category_stats = accumulator.finalize_category_stats()
         
         # Build comprehensive report
         report = {
@@ -152,32 +476,35 @@ class NecropolisAggregator:
             },
             'summary': {
                 'total_outcomes': total_outcomes,
-                'total_failures': len(failures),
-                'total_successes': len(successes),
-                'overall_success_rate': round(len(successes) / total_outcomes * 100, 2) if total_outcomes > 0 else 0,
+                'total_failures': accumulator.total_failures,
+                'total_successes': accumulator.total_successes,
+                'overall_success_rate': round(accumulator.total_successes / total_outcomes * 100, 2) if total_outcomes > 0 else 0,
                 'unique_error_types': len(error_types),
-                'unique_fingerprints': len(fingerprint_groups)
+                'unique_fingerprints': len(accumulator.fingerprint_groups)
             },
             'error_taxonomy': {
                 'error_types': dict(error_types),
                 'top_fingerprints': [
                     {
                         'fingerprint': fp[:200] + '...' if len(fp) > 200 else fp,
-                        'count': len(outcomes),
-                        'examples': [o['name'] for o in outcomes[:3]]
+                        'count': group['count'],
+                        'examples': group['examples']
                     }
-                    for fp, outcomes in top_fingerprints
+                    for fp, group in accumulator.top_fingerprints()
                 ],
-                'psycho_noir_signatures': psycho_noir_patterns
+                'psycho_noir_signatures': {
+                    keyword: accumulator.psycho_noir_patterns[keyword]
+                    for keyword in PSYCHO_NOIR_KEYWORDS if keyword in accumulator.psycho_noir_patterns
+                }
             },
             'category_analysis': dict(category_stats),
-            'variant_analysis': dict(variant_stats),
-            'recommendations': self._generate_recommendations(failures, error_types, category_stats)
+            'variant_analysis': dict(accumulator.variant_stats),
+            'recommendations': self._generate_recommendations(accumulator.psycho_noir_failures, error_types, category_stats)
         }
         
         return report
 
-    def _generate_recommendations(self, failures: List[Dict], error_types: Counter, 
+    def _generate_recommendations(self, psycho_noir_failures: int, error_types: Counter, 
                                 category_stats: Dict) -> List[str]:
         """Generate actionable recommendations based on failure patterns."""
         recommendations = []
@@ -198,7 +525,6 @@ class NecropolisAggregator:
                 recommendations.append(f"📊 Category '{category}' has low success rate ({stats['success_rate']}%) - needs attention")
         
         # Psycho-Noir specific recommendations
-        psycho_noir_failures = [f for f in failures if any(kw in f.get('error_type', '') for kw in ['KAUSALITETS', 'SYNTETISKE', 'RUSTBELT'])]
         if psycho_noir_failures:
             recommendations.append("🎭 Psycho-Noir digital manifestations detected - Den Usynlige Hånd influence growing")
             recommendations.append("🔮 Consider implementing chaos engineering practices to strengthen system resilience")
@@ -211,11 +537,42 @@ class NecropolisAggregator:
     def save_individual_outcomes(self, all_outcomes: List[Dict[str, Any]]):
         """Save individual outcome files to knowledge base."""
         for i, outcome in enumerate(all_outcomes):
-            filename = f"{outcome.get('name', 'unknown').replace(' ', '_').replace('/', '_')}_{i}.json"
-            filepath = self.runs_dir / filename
-            
-            with open(filepath, 'w') as f:
-                json.dump(outcome, f, indent=2)
+            self.save_individual_outcome(outcome, i)
+
+    def save_individual_outcome(self, outcome: Dict[str, Any], index: int):
+        """Save one outcome file to the current run (``index`` keeps names unique)."""
+        filename = f"{outcome.get('name', 'unknown').replace(' ', '_').replace('/', '_')}_{index}.json"
+        filepath = self.runs_dir / filename
+        
+        with open(filepath, 'w') as f:
+            json.dump(outcome, f, indent=2)
+
+    def update_knowledge_base(self, accumulator: TaxonomyAccumulator, 
+                              previous_dir: Optional[str] = None, 
+                              windows: Tuple[int, ...] = (7, 30)) -> Dict[str, Dict[str, Any]]:
+        """
+        Merge this run into the persistent knowledge base state and write the
+        rolling all-time and windowed taxonomy reports next to the latest one.
+        """
+        knowledge_base = NecropolisKnowledgeBase(self.knowledge_base_dir, previous_dir)
+        knowledge_base.record_run(accumulator, self.run_id, self.timestamp)
+        
+        scopes = [("all_time", knowledge_base.all_time())]
+        scopes += [(f"window_{days}d", knowledge_base.window(days, self.timestamp)) for days in windows]
+        
+        reports = {}
+        for scope, state in scopes:
+            report = self.aggregate_outcomes(state)
+            report['metadata'].update({
+                'scope': scope,
+                'runs_merged': state.runs,
+                'fingerprints_approximate': state.fingerprint_groups.approximate
+            })
+            with open(self.knowledge_base_dir / f"{scope}_taxonomy_report.json", 'w') as f:
+                json.dump(report, f, indent=2)
+            reports[scope] = report
+        
+        return reports
 
     def save_taxonomy_report(self, report: Dict[str, Any]):
         """Save the comprehensive taxonomy report."""
@@ -279,6 +636,10 @@ def main():
                        help='Directory containing necromancer artifacts')
     parser.add_argument('--output-dir', required=True,
                        help='Output directory for aggregated reports')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Artifacts read concurrently (default: thread pool default)')
+    parser.add_argument('--previous-knowledge-base', default=None,
+                       help='Existing knowledge-base directory whose state this run is merged into')
     
     args = parser.parse_args()
     
@@ -317,21 +678,22 @@ def main():
         aggregator.save_taxonomy_report(empty_report)
         return
     
-    # Extract all outcome data
-    all_outcomes = []
-    for artifact in artifacts:
-        outcomes = aggregator.extract_artifact_data(artifact)
-        all_outcomes.extend(outcomes)
+    # Extract outcome data concurrently, folding and saving each outcome as it arrives
+    accumulator = TaxonomyAccumulator()
+    for artifact, outcomes in aggregator.iter_artifact_outcomes(artifacts, args.workers):
+        for outcome in outcomes:
+            aggregator.save_individual_outcome(outcome, accumulator.total_outcomes)
+            accumulator.add(outcome)
         print(f"📦 Extracted {len(outcomes)} outcomes from {artifact.name}")
     
-    print(f"📊 Total outcomes collected: {len(all_outcomes)}")
+    print(f"📊 Total outcomes collected: {accumulator.total_outcomes}")
     
     # Aggregate outcomes
-    report = aggregator.aggregate_outcomes(all_outcomes)
+    report = aggregator.aggregate_outcomes(accumulator)
     
     # Save results
-    aggregator.save_individual_outcomes(all_outcomes)
     aggregator.save_taxonomy_report(report)
+    rolling_reports = aggregator.update_knowledge_base(accumulator, args.previous_knowledge_base)
     
     print("✅ NECROPOLIS AGGREGATION COMPLETE")
     print(f"📋 Report saved to: {aggregator.runs_dir}")
@@ -342,6 +704,9 @@ def main():
     print(f"   Outcomes processed: {report['summary']['total_outcomes']}")
     print(f"   Success rate: {report['summary']['overall_success_rate']}%")
     print(f"   Unique error types: {report['summary']['unique_error_types']}")
+    all_time = rolling_reports['all_time']
+    print(f"   All-time: {all_time['summary']['total_outcomes']} outcomes over "
+          f"{all_time['metadata']['runs_merged']} runs ({all_time['summary']['overall_success_rate']}% success)")
     
     if report['error_taxonomy']['psycho_noir_signatures']:
         print(f"\n🎭 PSYCHO-NOIR ACTIVITY DETECTED:")
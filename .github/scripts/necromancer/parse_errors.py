@@ -9,13 +9,203 @@ patterns while providing standardized error taxonomy.
 """
 
 import argparse
+import io
 import json
+import mmap
 import os
 import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from collections import Counter, defaultdict
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+class SinglePassPatternEngine:
+    """
+    Precompiled, single-pass matcher for ordered error categories.
+    
+    Every pattern is compiled once per process. The log is walked once in
+    newline-aligned blocks: each block is lowercased and searched for one
+    literal anchor per pattern (plain substring search), and only the lines
+    containing a pattern's anchor are verified against that pattern. The
+    result is the byte offset of the first hit of every category, so
+    callers can apply their own priority order afterwards.
+    
+    Anchors are the rarest literal segment of each pattern, measured on a
+    sample from the start of the log. The categories' patterns must not
+    span lines (no DOTALL, no newlines), which holds for the Necromancer
+    taxonomy.
+    """
+    
+    BLOCK_BYTES = 8 * 1024 * 1024
+    SAMPLE_BYTES = 1024 * 1024
+    
+    _LITERAL_SEGMENT = re.compile(r'(?:[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9])+')
+    
+    def __init__(self, categories: List[Tuple[str, List[str]]], block_bytes: int = None):
+        self.categories = [name for name, _ in categories]
+        self.block_bytes = block_bytes or self.BLOCK_BYTES
+        
+        # (category index, compiled pattern, literal segments or None) per pattern
+        self._patterns = []
+        for index, (_, patterns) in enumerate(categories):
+            for pattern in patterns:
+                pattern = pattern[4:] if pattern.startswith('(?i)') else pattern
+                self._patterns.append((
+                    index,
+                    re.compile(pattern.encode('utf-8'), re.IGNORECASE),
+                    self._literal_segments(pattern)
+                ))
+    
+    @classmethod
+    def _literal_segments(cls, pattern: str) -> Optional[List[bytes]]:
+        """Literal segments of an ``a.*b.*c`` style pattern, ASCII-lowercased."""
+        segments = [segment for segment in pattern.split('.*') if segment]
+        if not segments or not all(cls._LITERAL_SEGMENT.fullmatch(segment) for segment in segments):
+            # Anything but plain literals joined by .* is matched directly
+            # against each block instead
+            return None
+        # bytes.lower() only folds ASCII, exactly like the lowered blocks
+        return [re.sub(r'\\(.)', r'\1', segment).encode('utf-8').lower() for segment in segments]
+    
+    def _choose_anchors(self, sample: bytes) -> Dict[Optional[bytes], List[int]]:
+        """
+        Pick each pattern's least frequent literal in the sample and group the
+        patterns by anchor. Ties go to literals shared by more patterns (then
+        longer ones), so fewer distinct anchors have to be searched.
+        """
+        sharing = Counter(literal for _, _, literals in self._patterns 
+                          for literal in set(literals or ()))
+        counts = {literal: sample.count(literal) for literal in sharing}
+        
+        anchor_patterns = defaultdict(list)
+        for pattern_index, (_, _, literals) in enumerate(self._patterns):
+            anchor = None
+            if literals is not None:
+                anchor = min(literals, key=lambda literal: 
+                             (counts[literal], -sharing[literal], -len(literal)))
+            anchor_patterns[anchor].append(pattern_index)
+        return anchor_patterns
+    
+    def scan(self, content: Union[str, bytes]) -> Dict[str, int]:
+        """Return {category: byte offset of its first hit} for a str or bytes log."""
+        if isinstance(content, str):
+            return self._scan_blocks(self._str_blocks(content))
+        return self._scan_blocks(self._bytes_blocks(content))
+    
+    def scan_file(self, log_file_path: str) -> Dict[str, int]:
+        """Scan a log file through a read-only memory map; offsets are file offsets."""
+        with open(log_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self._scan_blocks(self._bytes_blocks(mapped))
+    
+    def _bytes_blocks(self, content) -> Iterator[Tuple[int, bytes]]:
+        """Yield (offset, block) with every block ending on a newline (or EOF)."""
+        start = 0
+        size = len(content)
+        while start < size:
+            end = min(start + self.block_bytes, size)
+            if end < size:
+                newline = content.find(b'\n', end)
+                end = size if newline == -1 else newline + 1
+            yield start, content[start:end]
+            start = end
+    
+    def _str_blocks(self, content: str) -> Iterator[Tuple[int, bytes]]:
+        """Encode a str log block by block, tracking UTF-8 byte offsets."""
+        start = 0
+        offset = 0
+        size = len(content)
+        while start < size:
+            end = min(start + self.block_bytes, size)
+            if end < size:
+                newline = content.find('\n', end)
+                end = size if newline == -1 else newline + 1
+            block = content[start:end].encode('utf-8', errors='surrogatepass')
+            yield offset, block
+            offset += len(block)
+            start = end
+    
+    def _scan_blocks(self, blocks: Iterator[Tuple[int, bytes]]) -> Dict[str, int]:
+        hits = {}
+        remaining = set(range(len(self.categories)))
+        anchor_patterns = None
+        
+        for block_offset, block in blocks:
+            if not remaining:
+                break
+            
+            lowered = block.lower()
+            if anchor_patterns is None:
+                anchor_patterns = self._choose_anchors(lowered[:self.SAMPLE_BYTES])
+            
+            # line start -> (line end, indexes of patterns to verify on that line)
+            candidates = {}
+            for anchor, pattern_indexes in anchor_patterns.items():
+                pattern_indexes = [pattern_index for pattern_index in pattern_indexes 
+                                   if self._patterns[pattern_index][0] in remaining]
+                if not pattern_indexes:
+                    continue
+                
+                if anchor is None:
+                    # Unanchored patterns: locate each one's first match directly
+                    for pattern_index in pattern_indexes:
+                        match = self._patterns[pattern_index][1].search(block)
+                        if match:
+                            self._add_candidate(candidates, lowered, match.start(), [pattern_index])
+                    continue
+                
+                position = lowered.find(anchor)
+                while position != -1:
+                    line_end = self._add_candidate(candidates, lowered, position, pattern_indexes)
+                    position = lowered.find(anchor, line_end)
+            
+            # Verify candidate lines in log order, so the first hit wins
+            for line_start in sorted(candidates):
+                line_end, pattern_indexes = candidates[line_start]
+                line = block[line_start:line_end]
+                line_hits = {}
+                
+                for pattern_index in pattern_indexes:
+                    index, compiled, _ = self._patterns[pattern_index]
+                    if index not in remaining:
+                        continue
+                    match = compiled.search(line)
+                    if match and (index not in line_hits or match.start() < line_hits[index]):
+                        line_hits[index] = match.start()
+                
+                for index, position in line_hits.items():
+                    hits[self.categories[index]] = block_offset + line_start + position
+                    remaining.discard(index)
+                if not remaining:
+                    break
+        
+        return hits
+    
+    @staticmethod
+    def _add_candidate(candidates: Dict, lowered: bytes, position: int, 
+                       pattern_indexes: List[int]) -> int:
+        """Queue the line around ``position`` for verification; returns its end."""
+        line_start = lowered.rfind(b'\n', 0, position) + 1
+        line_end = lowered.find(b'\n', position)
+        if line_end == -1:
+            line_end = len(lowered)
+        candidates.setdefault(line_start, (line_end, []))[1].extend(pattern_indexes)
+        return line_end
+
+# Compiled engines, keyed by taxonomy, shared by every classifier in the process
+_PATTERN_ENGINES = {}
+
+# Fingerprint line selection and normalisation (applied in this order)
+FINGERPRINT_KEYWORDS = ('error', 'failed', 'exception', 'fatal', 'critical')
+FINGERPRINT_LINES = 3
+_FINGERPRINT_NORMALIZERS = [
+    (re.compile(r'\d+'), 'N'),                # Replace numbers
+    (re.compile(r'/[^\s]+'), '/PATH'),        # Replace paths
+    (re.compile(r'at \w+:\d+'), 'at LOCATION'),  # Replace locations
+]
 
 class NecromancerErrorClassifier:
     """
@@ -25,8 +215,17 @@ class NecromancerErrorClassifier:
     while providing deterministic, fast classification for PR workflows.
     """
     
-    def __init__(self):
+    # Keyword hits used by the exit-code fallback, reported alongside categories
+    KEYWORD_TEST = "keyword:test"
+    KEYWORD_BUILD = "keyword:build"
+    
+    def __init__(self, engine: str = "compiled"):
         """Initialize the Necromancer with comprehensive error patterns."""
+        # "compiled" scans the log once with SinglePassPatternEngine,
+        # "sequential" keeps the per-category re.search loop (reference path)
+        self.engine = engine
+        self.last_category_hits = {}
+        
         self.error_patterns = {
             'ENVIRONMENT_SETUP': [
                 r'(?i)error.*setting up.*environment',
@@ -142,6 +341,10 @@ class NecromancerErrorClassifier:
         if outcome == "SUCCESS":
             return "SUCCESS"
         
+        if self.engine != "sequential":
+            self.last_category_hits = self._get_pattern_engine().scan(log_content)
+            return self.resolve_error_type(self.last_category_hits, exit_code)
+        
         # Check for Psycho-Noir specific signatures first
         for pn_type, patterns in self.psycho_noir_signatures.items():
             if self._match_patterns(log_content, patterns):
@@ -168,6 +371,52 @@ class NecromancerErrorClassifier:
         
         return "UNKNOWN"
 
+    def classify_error_file(self, log_file_path: str, exit_code: int, outcome: str) -> str:
+        """Classify a log file in one memory-mapped pass without reading it into memory."""
+        if outcome == "SUCCESS":
+            return "SUCCESS"
+        
+        self.last_category_hits = self._get_pattern_engine().scan_file(log_file_path)
+        return self.resolve_error_type(self.last_category_hits, exit_code)
+    
+    def resolve_error_type(self, category_hits: Dict[str, int], exit_code: int) -> str:
+        """Apply the taxonomy priority order to the categories found in a log."""
+        # Psycho-Noir specific signatures first, then standard error patterns
+        for error_type in list(self.psycho_noir_signatures) + list(self.error_patterns):
+            if error_type in category_hits:
+                return error_type
+        
+        # Exit code specific classification
+        if exit_code == 124:
+            return "TIMEOUT"
+        elif exit_code == 130:
+            return "CANCELLED"
+        elif exit_code == 2:
+            return "ENVIRONMENT_SETUP"
+        elif exit_code == 1:
+            # Generic failure - try to infer from context
+            if self.KEYWORD_TEST in category_hits:
+                return "TEST_FAILURE"
+            elif self.KEYWORD_BUILD in category_hits:
+                return "BUILD_FAILURE"
+        
+        return "UNKNOWN"
+    
+    def _get_pattern_engine(self) -> SinglePassPatternEngine:
+        """Return the process-wide compiled engine for the current taxonomy."""
+        categories = [
+            (error_type, list(patterns)) for error_type, patterns in 
+            list(self.psycho_noir_signatures.items()) + list(self.error_patterns.items())
+        ]
+        # The exit-code fallback's keyword checks ride along in the same pass
+        categories += [(self.KEYWORD_TEST, ['test']), (self.KEYWORD_BUILD, ['build'])]
+        
+        cache_key = tuple((name, tuple(patterns)) for name, patterns in categories)
+        engine = _PATTERN_ENGINES.get(cache_key)
+        if engine is None:
+            engine = _PATTERN_ENGINES[cache_key] = SinglePassPatternEngine(categories)
+        return engine
+
     def _match_patterns(self, content: str, patterns: List[str]) -> bool:
         """Check if any pattern matches the content."""
         for pattern in patterns:
@@ -181,25 +430,55 @@ class NecromancerErrorClassifier:
         
         This enables grouping of similar failures in the knowledge base.
         """
-        # Extract key error lines
+        return self._build_fingerprint(io.StringIO(log_content))
+    
+    def extract_error_fingerprint_file(self, log_file_path: str, 
+                                       tail_bytes: Optional[int] = None) -> str:
+        """
+        Stream the fingerprint from a log file without loading it.
+        
+        Reading stops as soon as enough signature lines are found. With
+        ``tail_bytes`` only the last part of the log is read (CI errors cluster
+        at the end), which bounds the work on huge outputs; the fingerprint
+        then reflects the first error lines of that window.
+        """
+        with open(log_file_path, 'rb') as f:
+            if tail_bytes is not None:
+                start = os.fstat(f.fileno()).st_size - tail_bytes
+                if start > 0:
+                    f.seek(start - 1)
+                    # Skip the partial line the window starts in
+                    if f.read(1) != b'\n':
+                        f.readline()
+            
+            # Same decoding and newline handling as reading the log in text mode
+            return self._build_fingerprint(io.TextIOWrapper(f, encoding='utf-8', errors='ignore'))
+    
+    def _build_fingerprint(self, lines: Iterable[str]) -> str:
+        """Join the first normalised error lines; consumes ``lines`` lazily."""
         error_lines = []
-        for line in log_content.split('\n'):
+        for line in lines:
             line = line.strip()
-            if any(keyword in line.lower() for keyword in 
-                   ['error', 'failed', 'exception', 'fatal', 'critical']):
-                # Clean up the line for fingerprinting
-                cleaned = re.sub(r'\d+', 'N', line)  # Replace numbers
-                cleaned = re.sub(r'/[^\s]+', '/PATH', cleaned)  # Replace paths
-                cleaned = re.sub(r'at \w+:\d+', 'at LOCATION', cleaned)  # Replace locations
-                error_lines.append(cleaned)
+            lowered = line.lower()
+            if not any(keyword in lowered for keyword in FINGERPRINT_KEYWORDS):
+                continue
+            
+            # Clean up the line for fingerprinting
+            for pattern, replacement in _FINGERPRINT_NORMALIZERS:
+                line = pattern.sub(replacement, line)
+            error_lines.append(line)
+            
+            # Only the first few significant error lines form the fingerprint
+            if len(error_lines) == FINGERPRINT_LINES:
+                break
         
-        # Return first few significant error lines as fingerprint
-        return ' | '.join(error_lines[:3]) if error_lines else "NO_CLEAR_ERROR_SIGNATURE"
+        return ' | '.join(error_lines) if error_lines else "NO_CLEAR_ERROR_SIGNATURE"
 
     def generate_outcome_data(self, args: argparse.Namespace, error_type: str, 
-                            log_content: str) -> Dict[str, Any]:
+                            log_content: str, fingerprint: str = None) -> Dict[str, Any]:
         """Generate comprehensive outcome data for the Necropolis system."""
-        fingerprint = self.extract_error_fingerprint(log_content)
+        if fingerprint is None:
+            fingerprint = self.extract_error_fingerprint(log_content)
         
         outcome_data = {
             # Core identification
@@ -207,6 +486,7 @@ class NecromancerErrorClassifier:
             "outcome": args.outcome,
             "error_type": error_type,
             "fingerprint": fingerprint,
+            "category_offsets": dict(self.last_category_hits),
             
             # Execution context
             "category": args.category,
@@ -261,25 +541,30 @@ def main():
                        help='Command outcome (SUCCESS|FAILURE)')
     parser.add_argument('--output-dir', required=True,
                        help='Output directory for artifacts')
+    parser.add_argument('--fingerprint-tail-mb', type=float, default=None,
+                       help='Only fingerprint the last N MB of the log')
     
     args = parser.parse_args()
     
     # Initialize classifier
     classifier = NecromancerErrorClassifier()
     
-    # Read log content
-    try:
-        with open(args.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            log_content = f.read()
-    except FileNotFoundError:
+    # Classify error (one memory-mapped pass over the log file) and stream
+    # the fingerprint, so the log is never loaded into memory
+    log_content = ""
+    if os.path.isfile(args.log_file):
+        tail_bytes = None
+        if args.fingerprint_tail_mb is not None:
+            tail_bytes = int(args.fingerprint_tail_mb * 1024 * 1024)
+        error_type = classifier.classify_error_file(args.log_file, args.exit_code, args.outcome)
+        fingerprint = classifier.extract_error_fingerprint_file(args.log_file, tail_bytes)
+    else:
         print(f"❌ Log file not found: {args.log_file}")
-        log_content = ""
-    
-    # Classify error
-    error_type = classifier.classify_error(log_content, args.exit_code, args.outcome)
+        error_type = classifier.classify_error(log_content, args.exit_code, args.outcome)
+        fingerprint = None
     
     # Generate outcome data
-    outcome_data = classifier.generate_outcome_data(args, error_type, log_content)
+    outcome_data = classifier.generate_outcome_data(args, error_type, log_content, fingerprint)
     
     # Ensure output directory exists
     output_dir = Path(args.output_dir)
@@ -21,12 +21,44 @@ class AggressiveFailureHarvester:
     Supercharged failure harvester that treats every error as valuable data
     """
 
+    # Constant statement text, so the connection reuses the prepared statement
+    STORE_FAILURE_SQL = '''
+        INSERT OR REPLACE INTO failures (
+            failure_id, category, severity, error_message, context,
+            timestamp, source_type, runner_info, repurpose_potential,
+            building_block_value, correlation_signature, extraction_metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    # Harvest pipeline bounds: concurrent source fetches, queued batches
+    # awaiting the writer (back-pressure), and rows per DB transaction
+    MAX_CONCURRENT_SOURCES = 4
+    WRITE_QUEUE_SIZE = 8
+    WRITE_BATCH_SIZE = 500
+
     def __init__(self, db_path: str = "data/generert/failure_archaeology.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = self._setup_logging()
         self.harvested_failures = []
         self.repurposable_patterns = {}
+        self.source_metrics = {}
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Shared connection for the harvest, opened once in WAL mode"""
+        if self._conn is None:
+            # The writer task stores batches from executor threads, one at a time
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def close(self):
+        """Close the shared connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def _setup_logging(self) -> logging.Logger:
         """Setup aggressive logging for all harvest operations"""
@@ -44,7 +76,7 @@ class AggressiveFailureHarvester:
 
     def initialize_expanded_database(self):
         """Initialize database with expanded schema for maximum data capture"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connection()
         cursor = conn.cursor()
 
         # Enhanced failures table with repurposing metadata
@@ -92,12 +124,16 @@ class AggressiveFailureHarvester:
         ''')
 
         conn.commit()
-        conn.close()
         self.logger.info("🗃️ Expanded database schema initialized for aggressive harvesting")
 
-    async def harvest_from_multiple_sources(self, aggressive_mode: bool = False):
+    async def harvest_from_multiple_sources(self, aggressive_mode: bool = False,
+                                            max_concurrency: Optional[int] = None):
         """
         Aggressively harvest failure data from all possible sources
+
+        Sources are fetched concurrently (at most `max_concurrency` at once)
+        and hand their failures to a single writer task through a bounded
+        queue; the writer batches inserts and runs them off the event loop.
         """
         self.logger.info("🔥 INITIATING AGGRESSIVE MULTI-SOURCE FAILURE HARVEST")
 
@@ -123,22 +159,73 @@ class AggressiveFailureHarvester:
                 "cross_platform_inconsistencies"
             ])
 
-        harvested_count = 0
+        started = time.perf_counter()
+        self.source_metrics = {}
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENT_SOURCES)
+        queue = asyncio.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+
+        writer = asyncio.create_task(self._batched_writer(queue))
+        await asyncio.gather(*(self._harvest_source_into(source, semaphore, queue) for source in sources))
+        await queue.put(None)
+        harvested_count = await writer
+
+        self.source_metrics["_total"] = {
+            "wall_seconds": round(time.perf_counter() - started, 4),
+            "slowest_source_seconds": max(
+                (metrics["fetch_seconds"] for metrics in self.source_metrics.values()), default=0
+            ),
+            "stored": harvested_count
+        }
 
-        for source in sources:
+        self.logger.info(f"✅ AGGRESSIVE HARVEST COMPLETE: {harvested_count} failures ready for repurposing")
+        return harvested_count
+
+    async def _harvest_source_into(self, source: str, semaphore: asyncio.Semaphore, queue: asyncio.Queue):
+        """
+        Fetch one source under the concurrency bound and queue its failures for the writer
+        """
+        async with semaphore:
+            started = time.perf_counter()
+            failures = []
+            error = None
             try:
                 failures = await self._harvest_from_source(source)
-                for failure in failures:
-                    if self._store_failure_with_repurpose_metadata(failure):
-                        harvested_count += 1
-
                 self.logger.info(f"📡 Harvested {len(failures)} failures from {source}")
 
             except Exception as e:
+                error = str(e)
                 self.logger.error(f"❌ Error harvesting from {source}: {e}")
 
-        self.logger.info(f"✅ AGGRESSIVE HARVEST COMPLETE: {harvested_count} failures ready for repurposing")
-        return harvested_count
+            self.source_metrics[source] = {
+                "failures": len(failures),
+                "fetch_seconds": round(time.perf_counter() - started, 4),
+                "error": error
+            }
+
+        # Waits here (outside the semaphore) while the writer is behind
+        if failures:
+            await queue.put(failures)
+
+    async def _batched_writer(self, queue: asyncio.Queue) -> int:
+        """
+        Single writer: drain queued failures into batched transactions until the None sentinel
+        """
+        stored = 0
+        batch = []
+        done = False
+
+        while not done:
+            failures = await queue.get()
+            done = failures is None
+            if not done:
+                batch.extend(failures)
+
+            # Flush on a full batch, at the end, or when nothing else is waiting
+            if batch and (done or len(batch) >= self.WRITE_BATCH_SIZE or queue.empty()):
+                stored += await asyncio.to_thread(self._store_failures_bulk, batch)
+                batch = []
+
+        return stored
 
     async def _harvest_from_source(self, source: str) -> List[Dict[str, Any]]:
         """
@@ -287,49 +374,81 @@ class AggressiveFailureHarvester:
         """
         Store failure with enhanced repurposing metadata
         """
+        return self._store_failures_bulk([failure]) == 1
+
+    def _store_failures_bulk(self, failures: List[Dict[str, Any]]) -> int:
+        """
+        Store a batch of failures with repurposing metadata in one transaction
+        """
+        rows = []
+        for failure in failures:
+            try:
+                rows.append(self._failure_row(failure))
+            except Exception as e:
+                self.logger.error(f"❌ Error storing failure {failure.get('failure_id', 'unknown')}: {e}")
+
+        if not rows:
+            return 0
+
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Generate correlation signature for pattern matching
-            correlation_sig = self._generate_correlation_signature(failure)
-
-            # Enhanced metadata for repurposing
-            extraction_metadata = json.dumps({
-                "extraction_timestamp": datetime.now().isoformat(),
-                "repurpose_applications": self._identify_repurpose_applications(failure),
-                "transformation_possibilities": self._identify_transformations(failure),
-                "cross_correlation_potential": self._assess_correlation_potential(failure)
-            })
-
-            cursor.execute('''
-                INSERT OR REPLACE INTO failures (
-                    failure_id, category, severity, error_message, context,
-                    timestamp, source_type, runner_info, repurpose_potential,
-                    building_block_value, correlation_signature, extraction_metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                failure["failure_id"],
-                failure["category"],
-                failure["severity"],
-                failure["error_message"],
-                failure["context"],
-                failure.get("timestamp", datetime.now().isoformat()),
-                failure["source_type"],
-                failure.get("runner_info", "unknown"),
-                failure.get("repurpose_potential", 1),
-                failure.get("building_block_value", "general_failure_pattern"),
-                correlation_sig,
-                extraction_metadata
-            ))
-
-            conn.commit()
-            conn.close()
-            return True
-
-        except Exception as e:
-            self.logger.error(f"❌ Error storing failure {failure.get('failure_id', 'unknown')}: {e}")
-            return False
+            conn = self._connection()
+            with conn:
+                conn.executemany(self.STORE_FAILURE_SQL, rows)
+            return len(rows)
+
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️ Batch of {len(rows)} failures rejected ({e}); storing row by row")
+            return self._store_rows_individually(rows)
+
+    def _store_rows_individually(self, rows: List[tuple]) -> int:
+        """
+        Store rows one statement at a time in one transaction; a failing row only loses itself
+        """
+        stored = 0
+        try:
+            conn = self._connection()
+            with conn:
+                for row in rows:
+                    try:
+                        conn.execute(self.STORE_FAILURE_SQL, row)
+                        stored += 1
+                    except sqlite3.Error as e:
+                        self.logger.error(f"❌ Error storing failure {row[0]}: {e}")
+            return stored
+
+        except sqlite3.Error as e:
+            self.logger.error(f"❌ Error storing batch of {len(rows)} failures: {e}")
+            return 0
+
+    def _failure_row(self, failure: Dict[str, Any]) -> tuple:
+        """
+        Build the failures row, including correlation signature and repurposing metadata
+        """
+        # Generate correlation signature for pattern matching
+        correlation_sig = self._generate_correlation_signature(failure)
+
+        # Enhanced metadata for repurposing
+        extraction_metadata = json.dumps({
+            "extraction_timestamp": datetime.now().isoformat(),
+            "repurpose_applications": self._identify_repurpose_applications(failure),
+            "transformation_possibilities": self._identify_transformations(failure),
+            "cross_correlation_potential": self._assess_correlation_potential(failure)
+        })
+
+        return (
+            failure["failure_id"],
+            failure["category"],
+            failure["severity"],
+            failure["error_message"],
+            failure["context"],
+            failure.get("timestamp", datetime.now().isoformat()),
+            failure["source_type"],
+            failure.get("runner_info", "unknown"),
+            failure.get("repurpose_potential", 1),
+            failure.get("building_block_value", "general_failure_pattern"),
+            correlation_sig,
+            extraction_metadata
+        )
 
     def _generate_correlation_signature(self, failure: Dict[str, Any]) -> str:
         """Generate signature for cross-correlation analysis"""
@@ -410,7 +529,7 @@ class AggressiveFailureHarvester:
 
     async def generate_repurposing_report(self) -> Dict[str, Any]:
         """Generate comprehensive report on repurposable failure data"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connection()
         cursor = conn.cursor()
 
         # Get comprehensive statistics
@@ -434,8 +553,6 @@ class AggressiveFailureHarvester:
         """)
         top_building_blocks = cursor.fetchall()
 
-        conn.close()
-
         report = {
             "report_timestamp": datetime.now().isoformat(),
             "total_harvestable_failures": total_failures,
@@ -454,7 +571,8 @@ class AggressiveFailureHarvester:
                 }
                 for block_type, frequency in top_building_blocks
             ],
-            "repurposing_opportunities": self._calculate_repurposing_opportunities(total_failures)
+            "repurposing_opportunities": self._calculate_repurposing_opportunities(total_failures),
+            "harvest_metrics": self.source_metrics
         }
 
         return report
@@ -105,8 +105,8 @@ class FailedRunsHarvester:
         return None
 
     def catalog_failures_from_harvest(self, harvested_data: List[Dict[str, Any]]) -> List[str]:
-        """Katalogiser innhøstede feil i archaeology database"""
-        cataloged_ids = []
+        """Katalogiser innhøstede feil i archaeology database (én transaksjon)"""
+        artifacts = []
 
         for failure_data in harvested_data:
             run_info = failure_data["run_info"]
@@ -142,10 +142,9 @@ class FailedRunsHarvester:
                 learning_extraction="Newly cataloged from GitHub Actions harvest"
             )
 
-            cataloged_id = self.archaeology_db.catalog_failure(artifact)
-            cataloged_ids.append(cataloged_id)
+            artifacts.append(artifact)
 
-        return cataloged_ids
+        return self.archaeology_db.catalog_failures_bulk(artifacts)
 
     def _determine_failure_domain(self, run_info: Dict[str, Any], failure_details: Dict[str, Any]) -> FailureDomain:
         """Bestem hvilket domene feilen tilhører"""
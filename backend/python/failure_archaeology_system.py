@@ -25,8 +25,13 @@ import json
 import sqlite3
 import datetime
 import hashlib
+import struct
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 import re
@@ -62,17 +67,204 @@ class FailureArtifact:
     prevention_strategy: Optional[str] = None  # How to prevent similar failures
     related_failures: List[str] = None  # Links to similar failure_ids
 
+class FailureSignatureLSH:
+    """
+    MinHash + LSH index of failure signatures for finding near-duplicates.
+
+    Signatures are normalised like the necromancer fingerprints (numbers,
+    hex ids) and shingled into character 4-grams, so signatures that differ by
+    one token still share most shingles. Every shingle gets NUM_PERM
+    independent 32-bit hashes from one SHAKE-128 digest and the MinHash is
+    their element-wise minimum. Each MinHash is split into bands;
+    signatures sharing any band bucket are candidates, which are then ranked
+    by their estimated Jaccard similarity. Queries only touch the candidate
+    buckets instead of comparing against the whole corpus.
+    """
+
+    NUM_PERM = 64
+    BANDS = 16            # 4 rows per band: ~50% similarity is the 50/50 point
+    SHINGLE_SIZE = 4
+    SHINGLE_CACHE_SIZE = 1 << 16
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._hash_struct = struct.Struct(f"<{num_perm}I")
+        # Shingles repeat heavily across signatures, so their hashes are cached
+        self._shingle_hashes = lru_cache(maxsize=self.SHINGLE_CACHE_SIZE)(self._hash_shingle)
+        self.signatures = {}   # key -> MinHash tuple
+        self._buckets = [defaultdict(set) for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.signatures
+
+    @staticmethod
+    def normalize(signature: str) -> str:
+        """Strip run-specific details so only the shape of the error remains"""
+        normalized = re.sub(r'[^a-z0-9]+', ' ', signature.lower())
+        normalized = re.sub(r'\b0x[0-9a-f]+\b|[0-9a-f]{12,}', '#', normalized)  # Hex ids and hashes
+        normalized = re.sub(r'\d+', '0', normalized)  # Numbers
+        return normalized.strip()
+
+    def _shingles(self, signature: str) -> set:
+        text = self.normalize(signature)
+        if len(text) <= self.SHINGLE_SIZE:
+            return {text}
+        return {text[i:i + self.SHINGLE_SIZE] for i in range(len(text) - self.SHINGLE_SIZE + 1)}
+
+    def minhash(self, signature: str) -> Tuple[int, ...]:
+        """MinHash of the signature's shingle set"""
+        hashes = [self._shingle_hashes(shingle) for shingle in self._shingles(signature)]
+        return tuple(map(min, zip(*hashes)))
+
+    def _hash_shingle(self, shingle: str) -> Tuple[int, ...]:
+        digest = hashlib.shake_128(shingle.encode('utf-8')).digest(self._hash_struct.size)
+        return self._hash_struct.unpack(digest)
+
+    def pack(self, minhash: Tuple[int, ...]) -> bytes:
+        return self._hash_struct.pack(*minhash)
+
+    def unpack(self, blob: bytes) -> Tuple[int, ...]:
+        return self._hash_struct.unpack(blob)
+
+    def _bands(self, minhash: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, minhash[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: str, minhash: Tuple[int, ...]):
+        """Index `key` (replacing an earlier MinHash for it)"""
+        if key in self.signatures:
+            self.remove(key)
+        self.signatures[key] = minhash
+        for band, band_hash in self._bands(minhash):
+            self._buckets[band][band_hash].add(key)
+
+    def remove(self, key: str):
+        minhash = self.signatures.pop(key, None)
+        if minhash is None:
+            return
+        for band, band_hash in self._bands(minhash):
+            bucket = self._buckets[band][band_hash]
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[band][band_hash]
+
+    def similarity(self, first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two MinHashes"""
+        return sum(1 for x, y in zip(first, second) if x == y) / self.num_perm
+
+    def query(self, signature: str, k: int = 10, min_similarity: float = 0.5,
+              minhash: Tuple[int, ...] = None) -> List[Tuple[str, float]]:
+        """Nearest indexed signatures, most similar first"""
+        minhash = minhash or self.minhash(signature)
+        candidates = set()
+        for band, band_hash in self._bands(minhash):
+            candidates.update(self._buckets[band].get(band_hash, ()))
+
+        scored = [(key, self.similarity(minhash, self.signatures[key])) for key in candidates]
+        scored = [(key, score) for key, score in scored if score >= min_similarity]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:k]
+
+    def clusters(self, min_similarity: float = 0.5) -> List[List[str]]:
+        """
+        Group the whole corpus into near-duplicate clusters.
+
+        Members of a shared bucket are linked to the bucket's first member
+        when their estimated similarity passes `min_similarity` (union-find),
+        so the cost follows bucket sizes rather than all pairs.
+        """
+        parent = {key: key for key in self.signatures}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                members = sorted(members)
+                anchor = members[0]
+                for member in members[1:]:
+                    if find(member) == find(anchor):
+                        continue
+                    if self.similarity(self.signatures[anchor], self.signatures[member]) >= min_similarity:
+                        parent[find(member)] = find(anchor)
+
+        groups = defaultdict(list)
+        for key in self.signatures:
+            groups[find(key)].append(key)
+        return sorted((sorted(members) for members in groups.values()), key=lambda members: members[0])
+
 class FailureArchaeologyDB:
     """Database for storing and analyzing failure patterns"""
 
+    # Ranked similarity search: signature hits weigh more than raw log hits
+    SIMILARITY_WEIGHTS = (10.0, 1.0)
+    DEFAULT_SIMILARITY_LIMIT = 50
+    # The trigram tokenizer cannot match queries shorter than one trigram
+    MIN_TRIGRAM_QUERY = 3
+    # Bound on bound parameters per IN (...) lookup
+    SQL_VARIABLE_CHUNK = 500
+
+    # Statement text is kept constant so the connection's statement cache
+    # reuses the prepared statement across calls
+    INSERT_ARTIFACT_SQL = """
+        INSERT OR REPLACE INTO failure_artifacts VALUES
+        (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str = "data/generert/failure_archaeology.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fts_enabled = False
+        self._conn = None
+        self._lock = threading.RLock()
+        self._signature_index = None
         self._init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection once (WAL, so readers never block the writer)"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Serialized access to the shared connection; commits on success, rolls back on error"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                yield conn
+
+    def close(self):
+        """Close the shared connection (it is reopened on next use)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _init_database(self):
         """Initialize the failure archaeology database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS failure_artifacts (
                     failure_id TEXT PRIMARY KEY,
@@ -100,46 +292,331 @@ class FailureArchaeologyDB:
                 ON failure_artifacts(domain, severity)
             """)
 
+            self.fts_enabled = self._init_similarity_index(conn)
+
+            # MinHash per distinct error signature, with its latest cluster
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS failure_signature_minhash (
+                    error_signature TEXT PRIMARY KEY,
+                    minhash BLOB NOT NULL,
+                    cluster_id INTEGER
+                )
+            """)
+
+    def _init_similarity_index(self, conn: sqlite3.Connection) -> bool:
+        """
+        Trigram FTS5-indeks over error_signature og raw_error_data.
+
+        External-content table kept in sync by triggers. INSERT OR REPLACE only
+        fires delete triggers with recursive_triggers on, so the replaced row is
+        removed from the index in a BEFORE INSERT trigger instead. Returns False
+        (LIKE fallback) when this SQLite build lacks FTS5 or the trigram tokenizer.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'failure_artifacts_fts'"
+        ).fetchone()
+
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS failure_artifacts_fts USING fts5(
+                    error_signature, raw_error_data,
+                    content='failure_artifacts', content_rowid='rowid',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS failure_artifacts_fts_replace
+            BEFORE INSERT ON failure_artifacts BEGIN
+                INSERT INTO failure_artifacts_fts(failure_artifacts_fts, rowid, error_signature, raw_error_data)
+                SELECT 'delete', rowid, error_signature, raw_error_data
+                FROM failure_artifacts WHERE failure_id = new.failure_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS failure_artifacts_fts_insert
+            AFTER INSERT ON failure_artifacts BEGIN
+                INSERT INTO failure_artifacts_fts(rowid, error_signature, raw_error_data)
+                VALUES (new.rowid, new.error_signature, new.raw_error_data);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS failure_artifacts_fts_delete
+            AFTER DELETE ON failure_artifacts BEGIN
+                INSERT INTO failure_artifacts_fts(failure_artifacts_fts, rowid, error_signature, raw_error_data)
+                VALUES ('delete', old.rowid, old.error_signature, old.raw_error_data);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS failure_artifacts_fts_update
+            AFTER UPDATE OF error_signature, raw_error_data ON failure_artifacts BEGIN
+                INSERT INTO failure_artifacts_fts(failure_artifacts_fts, rowid, error_signature, raw_error_data)
+                VALUES ('delete', old.rowid, old.error_signature, old.raw_error_data);
+                INSERT INTO failure_artifacts_fts(rowid, error_signature, raw_error_data)
+                VALUES (new.rowid, new.error_signature, new.raw_error_data);
+            END;
+        """)
+
+        if not exists:
+            # Index failures cataloged before the index existed
+            conn.execute("INSERT INTO failure_artifacts_fts(failure_artifacts_fts) VALUES ('rebuild')")
+
+        return True
+
     def catalog_failure(self, artifact: FailureArtifact) -> str:
         """Katalogiserer en ny feil i systemet"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO failure_artifacts VALUES
-                (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                artifact.failure_id,
-                artifact.timestamp,
-                artifact.domain.value,
-                artifact.severity.value,
-                artifact.error_signature,
-                artifact.raw_error_data,
-                json.dumps(artifact.context_snapshot),
-                json.dumps(artifact.attempted_fixes),
-                artifact.resolution_status,
-                artifact.learning_extraction,
-                artifact.prevention_strategy,
-                json.dumps(artifact.related_failures) if artifact.related_failures else None
-            ))
+        row = self._artifact_to_row(artifact)
+        with self._connection() as conn:
+            replaced = self._replaced_signatures(conn, [row])
+            conn.execute(self.INSERT_ARTIFACT_SQL, row)
+            self._index_signatures(conn, [artifact.error_signature])
+            self._prune_signatures(conn, replaced)
 
         return artifact.failure_id
 
-    def find_similar_failures(self, error_signature: str, domain: FailureDomain = None) -> List[FailureArtifact]:
-        """Finn lignende feil for prediksjon og læring"""
-        query = "SELECT * FROM failure_artifacts WHERE error_signature LIKE ?"
-        params = [f"%{error_signature}%"]
+    def catalog_failures_bulk(self, artifacts: Iterable[FailureArtifact]) -> List[str]:
+        """Catalog many failures in a single transaction"""
+        rows = [self._artifact_to_row(artifact) for artifact in artifacts]
+
+        with self._connection() as conn:
+            replaced = self._replaced_signatures(conn, rows)
+            conn.executemany(self.INSERT_ARTIFACT_SQL, rows)
+            self._index_signatures(conn, {row[4] for row in rows})
+            self._prune_signatures(conn, replaced)
+
+        return [row[0] for row in rows]
+
+    def signature_index(self) -> FailureSignatureLSH:
+        """
+        MinHash/LSH-indeksen over alle feilsignaturer.
+
+        Built on first use from the stored MinHashes; signatures without one
+        yet are hashed and stored. Later catalog calls keep it current.
+        """
+        with self._lock:
+            if self._signature_index is None:
+                index = FailureSignatureLSH()
+                with self._connection() as conn:
+                    # MinHashes left behind by replaced artifacts before pruning existed
+                    conn.execute("""
+                        DELETE FROM failure_signature_minhash
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM failure_artifacts fa
+                            WHERE fa.error_signature = failure_signature_minhash.error_signature
+                        )
+                    """)
+                    for signature, blob in conn.execute(
+                        "SELECT error_signature, minhash FROM failure_signature_minhash"
+                    ):
+                        index.add(signature, index.unpack(blob))
+
+                    missing = [row[0] for row in conn.execute("""
+                        SELECT DISTINCT fa.error_signature
+                        FROM failure_artifacts fa
+                        LEFT JOIN failure_signature_minhash m ON m.error_signature = fa.error_signature
+                        WHERE m.error_signature IS NULL
+                    """)]
+                    self._signature_index = index
+                    self._index_signatures(conn, missing)
+
+            return self._signature_index
+
+    def _index_signatures(self, conn: sqlite3.Connection, signatures: Iterable[str]):
+        """Hash and store signatures not indexed yet (no-op until the index is loaded)"""
+        index = self._signature_index
+        if index is None:
+            return
+
+        rows = []
+        for signature in signatures:
+            if signature not in index:
+                minhash = index.minhash(signature)
+                index.add(signature, minhash)
+                rows.append((signature, index.pack(minhash)))
+
+        conn.executemany("""
+            INSERT OR IGNORE INTO failure_signature_minhash (error_signature, minhash)
+            VALUES (?, ?)
+        """, rows)
+
+    def _replaced_signatures(self, conn: sqlite3.Connection, rows: List[Tuple]) -> set:
+        """Stored signatures that rows with the same failure_id are about to replace"""
+        new_signatures = {row[0]: row[4] for row in rows}
+        failure_ids = list(new_signatures)
+        replaced = set()
+
+        for start in range(0, len(failure_ids), self.SQL_VARIABLE_CHUNK):
+            chunk = failure_ids[start:start + self.SQL_VARIABLE_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            for failure_id, signature in conn.execute(
+                f"SELECT failure_id, error_signature FROM failure_artifacts WHERE failure_id IN ({placeholders})",
+                chunk
+            ):
+                if signature != new_signatures[failure_id]:
+                    replaced.add(signature)
+
+        return replaced
+
+    def _prune_signatures(self, conn: sqlite3.Connection, signatures: Iterable[str]):
+        """Drop MinHashes of signatures no failure artifact references anymore"""
+        orphaned = [
+            signature for signature in signatures
+            if conn.execute(
+                "SELECT 1 FROM failure_artifacts WHERE error_signature = ? LIMIT 1", (signature,)
+            ).fetchone() is None
+        ]
+        if not orphaned:
+            return
+
+        conn.executemany(
+            "DELETE FROM failure_signature_minhash WHERE error_signature = ?",
+            [(signature,) for signature in orphaned]
+        )
+        if self._signature_index is not None:
+            for signature in orphaned:
+                self._signature_index.remove(signature)
+
+    def nearest_signatures(self, error_signature: str, k: int = 10,
+                           min_similarity: float = 0.5) -> List[Tuple[str, float]]:
+        """Nærmeste tidligere feilsignaturer (estimert Jaccard), mest like først"""
+        with self._lock:
+            return self.signature_index().query(error_signature, k, min_similarity)
+
+    def find_nearest_fix_candidates(self, error_signature: str, k: int = 10, min_similarity: float = 0.5,
+                                    limit: int = DEFAULT_SIMILARITY_LIMIT) -> List[Dict[str, Any]]:
+        """Resolved failures whose signatures are near-duplicates of `error_signature`"""
+        nearest = dict(self.nearest_signatures(error_signature, k, min_similarity))
+        if not nearest:
+            return []
+
+        placeholders = ", ".join("?" for _ in nearest)
+        with self._connection() as conn:
+            rows = conn.execute(f"""
+                SELECT error_signature, domain, attempted_fixes, learning_extraction
+                FROM failure_artifacts
+                WHERE error_signature IN ({placeholders})
+                AND resolution_status != 'unresolved'
+            """, list(nearest)).fetchall()
+
+        # Most similar signatures first (SQLite does the filtering, not the ranking)
+        rows.sort(key=lambda row: -nearest[row[0]])
+        return [
+            {
+                "domain": FailureDomain(row[1]),
+                "attempted_fixes": json.loads(row[2]),
+                "learning_extraction": row[3],
+                "similarity": nearest[row[0]]
+            }
+            for row in rows[:limit]
+        ]
+
+    def recluster_signatures(self, min_similarity: float = 0.5) -> Dict[str, int]:
+        """Batch re-clustering of the whole corpus; stores and returns cluster_id per signature"""
+        with self._lock:
+            clusters = self.signature_index().clusters(min_similarity)
+        assignments = {
+            signature: cluster_id
+            for cluster_id, members in enumerate(clusters)
+            for signature in members
+        }
 
-        if domain:
-            query += " AND domain = ?"
-            params.append(domain.value)
+        with self._connection() as conn:
+            conn.executemany(
+                "UPDATE failure_signature_minhash SET cluster_id = ? WHERE error_signature = ?",
+                [(cluster_id, signature) for signature, cluster_id in assignments.items()]
+            )
+
+        return assignments
+
+    def _artifact_to_row(self, artifact: FailureArtifact) -> Tuple:
+        """Convert FailureArtifact to a failure_artifacts row"""
+        return (
+            artifact.failure_id,
+            artifact.timestamp,
+            artifact.domain.value,
+            artifact.severity.value,
+            artifact.error_signature,
+            artifact.raw_error_data,
+            json.dumps(artifact.context_snapshot),
+            json.dumps(artifact.attempted_fixes),
+            artifact.resolution_status,
+            artifact.learning_extraction,
+            artifact.prevention_strategy,
+            json.dumps(artifact.related_failures) if artifact.related_failures else None
+        )
 
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(query, params).fetchall()
+    def find_similar_failures(self, error_signature: str, domain: FailureDomain = None,
+                              limit: int = DEFAULT_SIMILARITY_LIMIT) -> List[FailureArtifact]:
+        """Finn lignende feil for prediksjon og læring (rangert, maks `limit` treff)"""
+        with self._connection() as conn:
+            rows = self._similar_rows(conn, "fa.*", error_signature, domain, limit)
 
         return [self._row_to_artifact(row) for row in rows]
 
+    def find_fix_candidates(self, error_signature: str, domain: FailureDomain = None,
+                            limit: int = DEFAULT_SIMILARITY_LIMIT) -> List[Dict[str, Any]]:
+        """
+        Resolved failures similar to `error_signature`, best match first.
+
+        Only the columns needed for fix recommendations are read, and only
+        attempted_fixes of the returned rows is decoded.
+        """
+        with self._connection() as conn:
+            rows = self._similar_rows(
+                conn, "fa.domain, fa.attempted_fixes, fa.learning_extraction",
+                error_signature, domain, limit, resolved_only=True
+            )
+
+        return [
+            {
+                "domain": FailureDomain(row[0]),
+                "attempted_fixes": json.loads(row[1]),
+                "learning_extraction": row[2]
+            }
+            for row in rows
+        ]
+
+    def _similar_rows(self, conn: sqlite3.Connection, columns: str, error_signature: str,
+                      domain: Optional[FailureDomain], limit: int, resolved_only: bool = False) -> List[Tuple]:
+        """Substring match on signature or raw error data, ranked by bm25 when indexed"""
+        filters = []
+        params = []
+
+        if domain:
+            filters.append("fa.domain = ?")
+            params.append(domain.value)
+        if resolved_only:
+            filters.append("fa.resolution_status != 'unresolved'")
+
+        if self.fts_enabled and len(error_signature) >= self.MIN_TRIGRAM_QUERY:
+            # A quoted trigram phrase matches any substring, case-insensitively
+            phrase = '"' + error_signature.replace('"', '""') + '"'
+            query = f"""
+                SELECT {columns}
+                FROM failure_artifacts_fts
+                JOIN failure_artifacts fa ON fa.rowid = failure_artifacts_fts.rowid
+                WHERE failure_artifacts_fts MATCH ?
+                {''.join(' AND ' + f for f in filters)}
+                ORDER BY bm25(failure_artifacts_fts, ?, ?)
+                LIMIT ?
+            """
+            params = [phrase] + params + list(self.SIMILARITY_WEIGHTS) + [limit]
+        else:
+            query = f"""
+                SELECT {columns}
+                FROM failure_artifacts fa
+                WHERE (fa.error_signature LIKE ? OR fa.raw_error_data LIKE ?)
+                {''.join(' AND ' + f for f in filters)}
+                ORDER BY fa.error_signature LIKE ? DESC, fa.timestamp DESC
+                LIMIT ?
+            """
+            pattern = f"%{error_signature}%"
+            params = [pattern, pattern] + params + [pattern, limit]
+
+        return conn.execute(query, params).fetchall()
+
     def get_failure_patterns(self) -> Dict[str, Any]:
         """Analyser mønstre i feilene for prediktiv intelligens"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             # Domain distribution
             domain_stats = conn.execute("""
                 SELECT domain, COUNT(*) as count
@@ -273,18 +750,19 @@ class BidirectionalLearningLoop:
 
     def generate_fix_recommendations(self, current_failure_signature: str) -> List[Dict[str, str]]:
         """Generate fix recommendations based on similar past failures"""
-        similar_failures = self.db.find_similar_failures(current_failure_signature)
-        resolved_failures = [f for f in similar_failures if f.resolution_status != "unresolved"]
+        # Near-duplicate signatures first; fall back to substring search
+        resolved_failures = (self.db.find_nearest_fix_candidates(current_failure_signature) or
+                             self.db.find_fix_candidates(current_failure_signature))
 
         recommendations = []
         for failure in resolved_failures:
-            for attempt in failure.attempted_fixes:
+            for attempt in failure["attempted_fixes"]:
                 if attempt.get("outcome") == "success":
                     recommendations.append({
                         "approach": attempt.get("description", "Unknown approach"),
                         "success_rate": "Historical success",
-                        "context": failure.learning_extraction,
-                        "domain": failure.domain.value
+                        "context": failure["learning_extraction"],
+                        "domain": failure["domain"].value
                     })
 
         return recommendations
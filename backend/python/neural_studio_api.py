@@ -30,13 +30,15 @@ COMPATIBILITY: Google AI Studio + ChatGPT + Claude
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 import json
-import sqlite3
 import uuid
 import datetime
 import os
 import logging
 from pathlib import Path
 
+from response_cache import ResponseCache, cached_json_response
+from sqlite_pool import get_pool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -53,6 +55,31 @@ DB_PATH = BASE_DIR / "data" / "neural_studio.db"
 SESSION_DIR.mkdir(parents=True, exist_ok=True)
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# Shared per-worker connection pool (WAL, read/write split)
+db = get_pool(DB_PATH)
+
+# Computed universe status (TTL only: no route of this API writes universe_state)
+status_cache = ResponseCache()
+
+SELECT_SESSIONS_SQL = '''
+    SELECT id, title, created, updated, completion_percentage, universe_state
+    FROM sessions ORDER BY updated DESC
+'''
+SELECT_SESSION_DATA_SQL = 'SELECT data FROM sessions WHERE id = ?'
+INSERT_SESSION_SQL = '''
+    INSERT INTO sessions (id, title, data, universe_state)
+    VALUES (?, ?, ?, ?)
+'''
+UPSERT_SESSION_SQL = '''
+    INSERT OR REPLACE INTO sessions (id, title, data, universe_state)
+    VALUES (?, ?, ?, ?)
+'''
+INSERT_NEURAL_PATTERN_SQL = '''
+    INSERT INTO neural_patterns (id, session_id, pattern_type, confidence, description)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SELECT_UNIVERSE_STATE_SQL = 'SELECT * FROM universe_state ORDER BY last_update DESC LIMIT 1'
+
 class NeuralStudioAPI:
     def __init__(self):
         self.init_database()
@@ -60,50 +87,48 @@ class NeuralStudioAPI:
 
     def init_database(self):
         """Initialize SQLite database for neural patterns and analytics"""
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        # Sessions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sessions (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                data TEXT NOT NULL,
-                neural_patterns TEXT DEFAULT '[]',
-                universe_state TEXT DEFAULT 'unknown',
-                completion_percentage INTEGER DEFAULT 0
-            )
-        ''')
-
-        # Neural patterns table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS neural_patterns (
-                id TEXT PRIMARY KEY,
-                session_id TEXT,
-                pattern_type TEXT,
-                confidence REAL,
-                description TEXT,
-                detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (session_id) REFERENCES sessions (id)
-            )
-        ''')
-
-        # Universe state table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS universe_state (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                skyskraper_status TEXT DEFAULT 'unknown',
-                rustbelt_status TEXT DEFAULT 'unknown',
-                usynlige_hand_activity TEXT DEFAULT 'unknown',
-                neural_archaeology_level INTEGER DEFAULT 0,
-                last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        conn.commit()
-        conn.close()
+        with db.write() as conn:
+            cursor = conn.cursor()
+
+            # Sessions table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sessions (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    data TEXT NOT NULL,
+                    neural_patterns TEXT DEFAULT '[]',
+                    universe_state TEXT DEFAULT 'unknown',
+                    completion_percentage INTEGER DEFAULT 0
+                )
+            ''')
+
+            # Neural patterns table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS neural_patterns (
+                    id TEXT PRIMARY KEY,
+                    session_id TEXT,
+                    pattern_type TEXT,
+                    confidence REAL,
+                    description TEXT,
+                    detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (session_id) REFERENCES sessions (id)
+                )
+            ''')
+
+            # Universe state table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS universe_state (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    skyskraper_status TEXT DEFAULT 'unknown',
+                    rustbelt_status TEXT DEFAULT 'unknown',
+                    usynlige_hand_activity TEXT DEFAULT 'unknown',
+                    neural_archaeology_level INTEGER DEFAULT 0,
+                    last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
         logger.info("🧠 Database initialized")
 
 # Initialize API
@@ -139,16 +164,11 @@ def studio_status():
 def get_sessions():
     """Get all sessions"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, title, created, updated, completion_percentage, universe_state
-            FROM sessions ORDER BY updated DESC
-        ''')
+        with db.read() as conn:
+            rows = conn.execute(SELECT_SESSIONS_SQL).fetchall()
 
         sessions = []
-        for row in cursor.fetchall():
+        for row in rows:
             sessions.append({
                 "id": row[0],
                 "title": row[1],
@@ -158,8 +178,6 @@ def get_sessions():
                 "universe_state": row[5]
             })
 
-        conn.close()
-
         return jsonify({
             "success": True,
             "sessions": sessions,
@@ -202,16 +220,8 @@ def create_session():
         }
 
         # Save to database
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO sessions (id, title, data, universe_state)
-            VALUES (?, ?, ?, ?)
-        ''', (session_id, title, json.dumps(session), universe_state))
-
-        conn.commit()
-        conn.close()
+        with db.write() as conn:
+            conn.execute(INSERT_SESSION_SQL, (session_id, title, json.dumps(session), universe_state))
 
         # Save JSON file
         session_file = SESSION_DIR / f"{session_id}.json"
@@ -234,12 +244,8 @@ def create_session():
 def get_session(session_id):
     """Get specific session"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT data FROM sessions WHERE id = ?', (session_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with db.read() as conn:
+            row = conn.execute(SELECT_SESSION_DATA_SQL, (session_id,)).fetchone()
 
         if not row:
             return jsonify({"success": False, "error": "Session not found"}), const_magic_404
@@ -259,12 +265,8 @@ def get_session(session_id):
 def export_session(session_id, format):
     """Export session in various formats"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT data FROM sessions WHERE id = ?', (session_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with db.read() as conn:
+            row = conn.execute(SELECT_SESSION_DATA_SQL, (session_id,)).fetchone()
 
         if not row:
             return jsonify({"success": False, "error": "Session not found"}), const_magic_404
@@ -346,16 +348,8 @@ def import_session():
         universe_state = session_data.get('psycho_noir_context', {}).get('universe_state', 'imported')
 
         # Save to database
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT OR REPLACE INTO sessions (id, title, data, universe_state)
-            VALUES (?, ?, ?, ?)
-        ''', (session_id, title, json.dumps(session_data), universe_state))
-
-        conn.commit()
-        conn.close()
+        with db.write() as conn:
+            conn.execute(UPSERT_SESSION_SQL, (session_id, title, json.dumps(session_data), universe_state))
 
         # Save JSON file
         session_file = SESSION_DIR / f"{session_id}.json"
@@ -378,14 +372,10 @@ def import_session():
 def analyze_session(session_id):
     """Run neural archaeology analysis on session"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT data FROM sessions WHERE id = ?', (session_id,))
-        row = cursor.fetchone()
+        with db.read() as conn:
+            row = conn.execute(SELECT_SESSION_DATA_SQL, (session_id,)).fetchone()
 
         if not row:
-            conn.close()
             return jsonify({"success": False, "error": "Session not found"}), const_magic_404
 
         session_data = json.loads(row[0])
@@ -413,14 +403,11 @@ def analyze_session(session_id):
         ]
 
         # Save patterns to database
-        for pattern in patterns:
-            cursor.execute('''
-                INSERT INTO neural_patterns (id, session_id, pattern_type, confidence, description)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (pattern['id'], session_id, pattern['type'], pattern['confidence'], pattern['description']))
-
-        conn.commit()
-        conn.close()
+        with db.write() as conn:
+            conn.executemany(INSERT_NEURAL_PATTERN_SQL, [
+                (pattern['id'], session_id, pattern['type'], pattern['confidence'], pattern['description'])
+                for pattern in patterns
+            ])
 
         logger.info(f"🧠 Neural analysis completed for session: {session_id}")
 
@@ -442,54 +429,53 @@ def analyze_session(session_id):
 def universe_status():
     """Get current Psycho-Noir universe status"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT * FROM universe_state ORDER BY last_update DESC LIMIT 1')
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            status = {
-                "skyskraper_status": row[1],
-                "rustbelt_status": row[2],
-                "usynlige_hand_activity": row[3],
-                "neural_archaeology_level": row[4],
-                "last_update": row[5]
-            }
-        else:
-            # Default status
-            status = {
-                "skyskraper_status": "operational",
-                "rustbelt_status": "active",
-                "usynlige_hand_activity": "subtle_influence",
-                "neural_archaeology_level": const_ten,
-                "last_update": datetime.datetime.now().isoformat()
-            }
-
-        return jsonify({
-            "success": True,
-            "universe_status": status,
-            "domains": {
-                "skyskraper": {
-                    "astrid_moller": "kausalitets_arkitekt_online",
-                    "syntetiske_synapser": "data_collection_active"
-                },
-                "rustbelt": {
-                    "iron_maiden": "improvisasjon_ready",
-                    "kildekode_kadaver": "corruption_detected"
-                },
-                "neural_layer": {
-                    "usynlige_hand": "influence_nodes_active",
-                    "session_archaeology": "pattern_recognition_active"
-                }
-            }
-        })
+        return cached_json_response(status_cache, "universe_status", _universe_status_payload)
 
     except Exception as e:
         logger.error(f"❌ Failed to get universe status: {e}")
         return jsonify({"success": False, "error": str(e)}), const_magic_500
 
+def _universe_status_payload():
+    with db.read() as conn:
+        row = conn.execute(SELECT_UNIVERSE_STATE_SQL).fetchone()
+
+    if row:
+        status = {
+            "skyskraper_status": row[1],
+            "rustbelt_status": row[2],
+            "usynlige_hand_activity": row[3],
+            "neural_archaeology_level": row[4],
+            "last_update": row[5]
+        }
+    else:
+        # Default status
+        status = {
+            "skyskraper_status": "operational",
+            "rustbelt_status": "active",
+            "usynlige_hand_activity": "subtle_influence",
+            "neural_archaeology_level": const_ten,
+            "last_update": datetime.datetime.now().isoformat()
+        }
+
+    return {
+        "success": True,
+        "universe_status": status,
+        "domains": {
+            "skyskraper": {
+                "astrid_moller": "kausalitets_arkitekt_online",
+                "syntetiske_synapser": "data_collection_active"
+            },
+            "rustbelt": {
+                "iron_maiden": "improvisasjon_ready",
+                "kildekode_kadaver": "corruption_detected"
+            },
+            "neural_layer": {
+                "usynlige_hand": "influence_nodes_active",
+                "session_archaeology": "pattern_recognition_active"
+            }
+        }
+    }
+
 @app.route('/api/deployment/github-pages/prepare', methods=['POST'])
 def prepare_github_pages():
     """Prepare deployment configuration for GitHub Pages"""
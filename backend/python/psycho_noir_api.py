@@ -20,7 +20,6 @@ RELIABILITY_LEVEL: MAXIMUM_STABILITY_GUARANTEED
 
 import logging
 import json
-import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -32,6 +31,8 @@ except ImportError:
 
     exit(1)
 
+from response_cache import ResponseCache, cached_json_response
+
 # Import our core systems (with fallback handling)
 try:
     from psycho_noir_core import PsychoNoirKontrapunkt, create_psycho_noir_system
@@ -51,6 +52,9 @@ CORS(app)  # Enable cross-origin requests for web integration
 # Global system instance (initialized on first request)
 psycho_noir_system = None
 
+# Computed status payloads; invalidated whenever the core system commits a write
+status_cache = ResponseCache()
+
 def get_system():
     """Get or create system instance with robust error handling"""
     global psycho_noir_system
@@ -59,6 +63,7 @@ def get_system():
         try:
             if CORE_AVAILABLE:
                 psycho_noir_system = create_psycho_noir_system("data/psycho_noir_api.db")
+                psycho_noir_system.add_write_listener(status_cache.invalidate)
                 logger.info("✅ Real Psycho-Noir system initialized")
             else:
                 psycho_noir_system = MockPsychoNoirSystem()
@@ -121,15 +126,12 @@ def health_check():
 def get_system_status():
     """Get overall system status"""
     try:
-        system = get_system()
-        status = system.get_system_status()
-
-        return jsonify({
+        return cached_json_response(status_cache, "status", lambda: {
             "success": True,
-            "data": status,
+            "data": get_system().get_system_status(),
             "timestamp": datetime.now().isoformat(),
             "api_endpoint": "/api/status"
-        })
+        }, volatile=("timestamp", "data.system_uptime"))
 
     except Exception as e:
         logger.error(f"Status endpoint error: {e}")
@@ -145,30 +147,9 @@ def get_system_status():
 def get_domains():
     """Get all domain information"""
     try:
-        system = get_system()
-
-        # Robust domain data gathering
-        domains_data = {}
-
-        if hasattr(system, 'skyskraper') and system.skyskraper:
-            try:
-                domains_data["skyskraper"] = system.skyskraper.get_domain_status()
-            except Exception as e:
-                domains_data["skyskraper"] = {"error": str(e), "status": "unavailable"}
-
-        if hasattr(system, 'rustbelt') and system.rustbelt:
-            try:
-                domains_data["rustbelt"] = system.rustbelt.get_domain_status()
-            except Exception as e:
-                domains_data["rustbelt"] = {"error": str(e), "status": "unavailable"}
-
-        # Always return valid response
-        return jsonify({
-            "success": True,
-            "domains": domains_data,
-            "domain_count": len(domains_data),
-            "timestamp": datetime.now().isoformat()
-        })
+        return cached_json_response(status_cache, "domains", _domains_payload, volatile=(
+            "timestamp", "domains.skyskraper.last_update", "domains.rustbelt.last_update"
+        ))
 
     except Exception as e:
         logger.error(f"Domains endpoint error: {e}")
@@ -179,6 +160,32 @@ def get_domains():
             "timestamp": datetime.now().isoformat()
         })
 
+def _domains_payload() -> Dict[str, Any]:
+    system = get_system()
+
+    # Robust domain data gathering
+    domains_data = {}
+
+    if hasattr(system, 'skyskraper') and system.skyskraper:
+        try:
+            domains_data["skyskraper"] = system.skyskraper.get_domain_status()
+        except Exception as e:
+            domains_data["skyskraper"] = {"error": str(e), "status": "unavailable"}
+
+    if hasattr(system, 'rustbelt') and system.rustbelt:
+        try:
+            domains_data["rustbelt"] = system.rustbelt.get_domain_status()
+        except Exception as e:
+            domains_data["rustbelt"] = {"error": str(e), "status": "unavailable"}
+
+    # Always return valid response
+    return {
+        "success": True,
+        "domains": domains_data,
+        "domain_count": len(domains_data),
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.route('/api/domains/<domain_name>', methods=['GET'])
 def get_domain_status(domain_name):
     """Get specific domain status"""
@@ -318,28 +325,8 @@ def scan_anomalies():
 def export_system_status():
     """Export complete system status as JSON"""
     try:
-        system = get_system()
-
-        export_data = {
-            "export_timestamp": datetime.now().isoformat(),
-            "system_status": system.get_system_status(),
-            "api_info": {
-                "version": "1.0.0",
-                "core_available": CORE_AVAILABLE,
-                "endpoints": [
-                    "/health",
-                    "/api/status",
-                    "/api/domains",
-                    "/api/domains/<domain_name>",
-                    "/api/interactions",
-                    "/api/anomalies/scan",
-                    "/api/export/status"
-                ]
-            },
-            "export_signature": "0xROBUST_API_EXPORT"
-        }
-
-        return jsonify(export_data)
+        return cached_json_response(status_cache, "export", _export_payload,
+                                    volatile=("export_timestamp", "system_status.system_uptime"))
 
     except Exception as e:
         logger.error(f"Export error: {e}")
@@ -349,6 +336,26 @@ def export_system_status():
             "timestamp": datetime.now().isoformat()
         })
 
+def _export_payload() -> Dict[str, Any]:
+    return {
+        "export_timestamp": datetime.now().isoformat(),
+        "system_status": get_system().get_system_status(),
+        "api_info": {
+            "version": "1.0.0",
+            "core_available": CORE_AVAILABLE,
+            "endpoints": [
+                "/health",
+                "/api/status",
+                "/api/domains",
+                "/api/domains/<domain_name>",
+                "/api/interactions",
+                "/api/anomalies/scan",
+                "/api/export/status"
+            ]
+        },
+        "export_signature": "0xROBUST_API_EXPORT"
+    }
+
 # Development info endpoint
 @app.route('/api/info', methods=['GET'])
 def api_info():
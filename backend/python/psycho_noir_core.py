@@ -21,13 +21,15 @@ SYSTEM_STATUS: DUAL_DOMAIN_INITIALIZATION_PENDING
 """
 
 import logging
-import sqlite3
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from enum import Enum
 
+from sqlite_pool import BatchedWriter, get_pool
+
 # Konfigurer logging med Psycho-Noir estetikk
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +38,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+INSERT_INTERACTION_SQL = """
+    INSERT INTO cross_domain_interactions
+    (source_domain, target_domain, interaction_type, success, interference_detected, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_USYNLIGE_HAND_EVENT_SQL = """
+    INSERT INTO usynlige_hand_events
+    (domain_affected, manifestation_type, corruption_signature, severity_level, metadata)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 class DomainType(Enum):
     """Domene-typer i Psycho-Noir Kontrapunkt universet"""
     SKYSKRAPER = "skyskraper"
@@ -71,10 +85,16 @@ class PsychoNoirKontrapunkt:
         self.data_path = Path(data_path)
         self.data_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Initialize database connection
-        self.db_connection = sqlite3.connect(str(self.data_path))
+        # Shared per-process connection pool (WAL, read/write split)
+        self.db = get_pool(self.data_path)
+        self._write_listeners: List[Callable[[], None]] = []
         self._setup_database()
 
+        # Interaction/event rows are group-committed by a background writer;
+        # listeners fire once a batch is visible to readers
+        self.writer = BatchedWriter(self.db, on_commit=self._notify_write)
+        self._state_lock = threading.Lock()
+
         # Core domain instances (lazy loading)
         self._skyskraper = None
         self._rustbelt = None
@@ -93,62 +113,132 @@ class PsychoNoirKontrapunkt:
 
     def _setup_database(self):
         """Setup database schema for Psycho-Noir Kontrapunkt"""
-        cursor = self.db_connection.cursor()
+        with self.db.write() as conn:
+            cursor = conn.cursor()
+
+            # Domains table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS domains (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name VARCHAR(const_magic_50) NOT NULL,
+                    type VARCHAR(const_magic_20) NOT NULL,
+                    corruption_level REAL DEFAULT 0.0,
+                    last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    metadata TEXT  -- JSON for domain-specific data
+                )
+            """)
+
+            # Characters table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS characters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name VARCHAR(const_hundred) NOT NULL,
+                    domain_id INTEGER,
+                    consciousness_level REAL DEFAULT 0.5,
+                    status VARCHAR(const_magic_50) DEFAULT 'active',
+                    capabilities TEXT,  -- JSON array of capabilities
+                    FOREIGN KEY (domain_id) REFERENCES domains(id)
+                )
+            """)
+
+            # Den Usynlige Hånd events table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS usynlige_hand_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    domain_affected VARCHAR(const_magic_50),
+                    manifestation_type VARCHAR(const_hundred),
+                    corruption_signature VARCHAR(const_magic_255),
+                    severity_level REAL,
+                    metadata TEXT  -- JSON for event-specific data
+                )
+            """)
+
+            # Cross-domain interactions table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS cross_domain_interactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    source_domain VARCHAR(const_magic_50),
+                    target_domain VARCHAR(const_magic_50),
+                    interaction_type VARCHAR(const_hundred),
+                    success BOOLEAN,
+                    interference_detected BOOLEAN DEFAULT FALSE,
+                    metadata TEXT
+                )
+            """)
+
+            # Per-minute activity rollups (kept in sync by the insert triggers below)
+            rollups_exist = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'activity_rollups'"
+            ).fetchone()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS activity_rollups (
+                    bucket TEXT PRIMARY KEY,  -- UTC minute, 'YYYY-MM-DD HH:MM'
+                    interactions INTEGER NOT NULL DEFAULT 0,
+                    successful INTEGER NOT NULL DEFAULT 0,
+                    interfered INTEGER NOT NULL DEFAULT 0,
+                    corruption_events INTEGER NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+            """)
+            # Re-created on every start so databases keep the current trigger body
+            cursor.execute("DROP TRIGGER IF EXISTS trg_interactions_rollup")
+            cursor.execute("""
+                CREATE TRIGGER trg_interactions_rollup
+                AFTER INSERT ON cross_domain_interactions
+                BEGIN
+                    INSERT INTO activity_rollups (bucket, interactions, successful, interfered)
+                    VALUES (strftime('%Y-%m-%d %H:%M', COALESCE(NEW.timestamp, CURRENT_TIMESTAMP)), 1,
+                            COALESCE(NEW.success = 1, 0), COALESCE(NEW.interference_detected = 1, 0))
+                    ON CONFLICT (bucket) DO UPDATE SET
+                        interactions = interactions + 1,
+                        successful = successful + excluded.successful,
+                        interfered = interfered + excluded.interfered;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_usynlige_hand_events_rollup
+                AFTER INSERT ON usynlige_hand_events
+                BEGIN
+                    INSERT INTO activity_rollups (bucket, corruption_events)
+                    VALUES (strftime('%Y-%m-%d %H:%M', COALESCE(NEW.timestamp, CURRENT_TIMESTAMP)), 1)
+                    ON CONFLICT (bucket) DO UPDATE SET
+                        corruption_events = corruption_events + 1;
+                END
+            """)
+            if not rollups_exist:
+                self._backfill_rollups(cursor)
 
-        # Domains table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS domains (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name VARCHAR(const_magic_50) NOT NULL,
-                type VARCHAR(const_magic_20) NOT NULL,
-                corruption_level REAL DEFAULT 0.0,
-                last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                metadata TEXT  -- JSON for domain-specific data
-            )
-        """)
-
-        # Characters table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS characters (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name VARCHAR(const_hundred) NOT NULL,
-                domain_id INTEGER,
-                consciousness_level REAL DEFAULT 0.5,
-                status VARCHAR(const_magic_50) DEFAULT 'active',
-                capabilities TEXT,  -- JSON array of capabilities
-                FOREIGN KEY (domain_id) REFERENCES domains(id)
-            )
-        """)
+        logger.info("📊 Database schema initialized")
 
-        # Den Usynlige Hånd events table
+    def _backfill_rollups(self, cursor):
+        """Aggregate interactions/events recorded before activity_rollups existed"""
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS usynlige_hand_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                domain_affected VARCHAR(const_magic_50),
-                manifestation_type VARCHAR(const_hundred),
-                corruption_signature VARCHAR(const_magic_255),
-                severity_level REAL,
-                metadata TEXT  -- JSON for event-specific data
+            INSERT INTO activity_rollups (bucket, interactions, successful, interfered, corruption_events)
+            SELECT bucket, SUM(interactions), SUM(successful), SUM(interfered), SUM(corruption_events)
+            FROM (
+                SELECT strftime('%Y-%m-%d %H:%M', timestamp) AS bucket, COUNT(*) AS interactions,
+                       IFNULL(SUM(success = 1), 0) AS successful,
+                       IFNULL(SUM(interference_detected = 1), 0) AS interfered,
+                       0 AS corruption_events
+                FROM cross_domain_interactions GROUP BY bucket
+                UNION ALL
+                SELECT strftime('%Y-%m-%d %H:%M', timestamp), 0, 0, 0, COUNT(*)
+                FROM usynlige_hand_events GROUP BY 1
             )
+            WHERE bucket IS NOT NULL
+            GROUP BY bucket
         """)
+        if cursor.rowcount > 0:
+            logger.info(f"📈 Backfilled {cursor.rowcount} activity rollup buckets")
 
-        # Cross-domain interactions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS cross_domain_interactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                source_domain VARCHAR(const_magic_50),
-                target_domain VARCHAR(const_magic_50),
-                interaction_type VARCHAR(const_hundred),
-                success BOOLEAN,
-                interference_detected BOOLEAN DEFAULT FALSE,
-                metadata TEXT
-            )
-        """)
+    def add_write_listener(self, listener: Callable[[], None]):
+        """Call `listener` after every committed write (e.g. to invalidate cached status)"""
+        self._write_listeners.append(listener)
 
-        self.db_connection.commit()
-        logger.info("📊 Database schema initialized")
+    def _notify_write(self):
+        for listener in self._write_listeners:
+            listener()
 
     @property
     def skyskraper(self):
@@ -191,12 +281,12 @@ class PsychoNoirKontrapunkt:
     def _register_domain(self, name: str, domain_type: DomainType,
                         corruption_level: float = 0.0):
         """Registrer et domene i database"""
-        cursor = self.db_connection.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO domains (name, type, corruption_level, metadata)
-            VALUES (?, ?, ?, ?)
-        """, (name, domain_type.value, corruption_level, json.dumps({})))
-        self.db_connection.commit()
+        with self.db.write() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO domains (name, type, corruption_level, metadata)
+                VALUES (?, ?, ?, ?)
+            """, (name, domain_type.value, corruption_level, json.dumps({})))
+        self._notify_write()
 
         self.system_state["active_domains"].append(name)
         logger.info(f"🏗️ Domain registered: {name} ({domain_type.value})")
@@ -215,8 +305,9 @@ class PsychoNoirKontrapunkt:
         Returns:
             Dict med resultatet av interaksjonen
         """
-        interaction_id = self.system_state["cross_domain_interactions"] + 1
-        self.system_state["cross_domain_interactions"] = interaction_id
+        with self._state_lock:
+            interaction_id = self.system_state["cross_domain_interactions"] + 1
+            self.system_state["cross_domain_interactions"] = interaction_id
 
         logger.info(f"🌐 Cross-domain interaction #{interaction_id}: {source_domain} → {target_domain}")
         logger.info(f"📋 Type: {interaction_type}")
@@ -235,15 +326,11 @@ class PsychoNoirKontrapunkt:
             result_data = self.usynlige_hand.apply_interference(result_data)
             success = False
 
-        # Log interaction to database
-        cursor = self.db_connection.cursor()
-        cursor.execute("""
-            INSERT INTO cross_domain_interactions
-            (source_domain, target_domain, interaction_type, success, interference_detected, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (source_domain, target_domain, interaction_type, success,
-              interference_detected, json.dumps(result_data)))
-        self.db_connection.commit()
+        # Log interaction to database (committed with the next batch)
+        self.writer.submit(INSERT_INTERACTION_SQL, (
+            source_domain, target_domain, interaction_type, success,
+            interference_detected, json.dumps(result_data)
+        ))
 
         return {
             "interaction_id": interaction_id,
@@ -253,31 +340,49 @@ class PsychoNoirKontrapunkt:
             "timestamp": datetime.now().isoformat()
         }
 
-    def get_system_status(self) -> Dict[str, Any]:
-        """Hent komplett system-status"""
-        cursor = self.db_connection.cursor()
+    def record_usynlige_hand_event(self, domain_affected: str, manifestation_type: str,
+                                   corruption_signature: str, severity_level: float,
+                                   metadata: Optional[Dict[str, Any]] = None):
+        """Logg en manifestasjon av Den Usynlige Hånd (committed with the next batch)"""
+        self.writer.submit(INSERT_USYNLIGE_HAND_EVENT_SQL, (
+            domain_affected, manifestation_type, corruption_signature,
+            severity_level, json.dumps(metadata or {})
+        ))
 
-        # Count domains
-        cursor.execute("SELECT type, COUNT(*) FROM domains GROUP BY type")
-        domain_counts = dict(cursor.fetchall())
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued interaction/event row is committed
 
-        # Recent corruption events
-        cursor.execute("""
-            SELECT COUNT(*) FROM usynlige_hand_events
-            WHERE timestamp > datetime('now', '-1 hour')
-        """)
-        recent_corruption_events = cursor.fetchone()[0]
+        Raises sqlite_pool.BatchWriteError if rows could not be stored.
+        """
+        return self.writer.flush(timeout)
 
-        # Cross-domain interaction stats
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
-                SUM(CASE WHEN interference_detected = 1 THEN 1 ELSE 0 END) as interfered
-            FROM cross_domain_interactions
-            WHERE timestamp > datetime('now', '-const_magic_24 hours')
-        """)
-        interaction_stats = cursor.fetchone()
+    def get_system_status(self) -> Dict[str, Any]:
+        """Hent komplett system-status"""
+        with self.db.read() as conn:
+            cursor = conn.cursor()
+
+            # Count domains
+            cursor.execute("SELECT type, COUNT(*) FROM domains GROUP BY type")
+            domain_counts = dict(cursor.fetchall())
+
+            # Recent corruption events (last 60 minute buckets)
+            cursor.execute("""
+                SELECT SUM(corruption_events) FROM activity_rollups
+                WHERE bucket >= strftime('%Y-%m-%d %H:%M', 'now', '-1 hour')
+            """)
+            recent_corruption_events = cursor.fetchone()[0] or 0
+
+            # Cross-domain interaction stats (last 24 hours of minute buckets)
+            cursor.execute("""
+                SELECT
+                    SUM(interactions) as total,
+                    SUM(successful) as successful,
+                    SUM(interfered) as interfered
+                FROM activity_rollups
+                WHERE bucket >= strftime('%Y-%m-%d %H:%M', 'now', '-24 hours')
+            """)
+            interaction_stats = cursor.fetchone()
 
         return {
             "system_uptime": str(datetime.now() - self.system_state["initialization_time"]),
@@ -292,29 +397,42 @@ class PsychoNoirKontrapunkt:
             "corruption_signature": "0xDEADBEEF_SYSTEM_OPERATIONAL"
         }
 
+    def get_activity_history(self, minutes: int = 60) -> List[Dict[str, Any]]:
+        """Per-minute activity buckets for the last `minutes` minutes (for charts)"""
+        with self.db.read() as conn:
+            rows = conn.execute("""
+                SELECT bucket, interactions, successful, interfered, corruption_events
+                FROM activity_rollups
+                WHERE bucket >= strftime('%Y-%m-%d %H:%M', 'now', ?)
+                ORDER BY bucket
+            """, (f"-{int(minutes)} minutes",)).fetchall()
+
+        return [
+            {
+                "bucket": bucket,
+                "interactions": interactions,
+                "successful": successful,
+                "interfered": interfered,
+                "corruption_events": corruption_events
+            }
+            for bucket, interactions, successful, interfered, corruption_events in rows
+        ]
+
     def emergency_shutdown(self, reason: str = "Manual shutdown"):
         """Emergency shutdown med logging"""
         logger.warning(f"🚨 EMERGENCY SHUTDOWN INITIATED: {reason}")
 
-        # Log shutdown event
-        cursor = self.db_connection.cursor()
-        cursor.execute("""
-            INSERT INTO usynlige_hand_events
-            (domain_affected, manifestation_type, corruption_signature, severity_level, metadata)
-            VALUES (?, ?, ?, ?, ?)
-        """, ("SYSTEM", "EMERGENCY_SHUTDOWN", "0xSHUTDOWN", 1.0,
-              json.dumps({"reason": reason, "timestamp": datetime.now().isoformat()})))
+        # Log shutdown event; closing the writer commits it with anything still queued
+        self.record_usynlige_hand_event(
+            "SYSTEM", "EMERGENCY_SHUTDOWN", "0xSHUTDOWN", 1.0,
+            {"reason": reason, "timestamp": datetime.now().isoformat()}
+        )
+        self.writer.close()
 
-        self.db_connection.commit()
-        self.db_connection.close()
+        self.db.close()
 
         logger.info("🎭 PSYCHO-NOIR KONTRAPUNKT CORE SHUTDOWN COMPLETE")
 
-    def __del__(self):
-        """Cleanup ved garbage collection"""
-        if hasattr(self, 'db_connection'):
-            self.db_connection.close()
-
 # Factory function for easy instantiation
 def create_psycho_noir_system(data_path: str = "data/psycho_noir.db") -> PsychoNoirKontrapunkt:
     """
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+⚡ RESPONSE CACHE FOR READ-HEAVY STATUS ENDPOINTS
+================================================
+
+Per-process cache for computed JSON payloads (system status, domain
+status, universe status) shared by the Flask APIs.
+
+- Entries live for a TTL and are dropped as soon as a write invalidates
+  the cache (invalidate-on-write)
+- Every payload carries a content ETag; conditional GETs with a matching
+  If-None-Match get a 304 without touching the database
+- Fields that change on every recompute (timestamps, uptime) are named as
+  volatile and left out of the ETag, so an unchanged status still earns a
+  304 after the entry expired or was invalidated
+- Each gunicorn worker has its own cache: writes seen by one worker
+  invalidate it immediately, the others catch up within the TTL
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, NamedTuple
+
+from flask import Response, jsonify, request
+
+DEFAULT_TTL_SECONDS = float(os.environ.get("STATUS_CACHE_TTL_SECONDS", "5"))
+
+class CacheEntry(NamedTuple):
+    payload: Any
+    etag: str
+    generation: int
+    expires_at: float
+
+class ResponseCache:
+    """TTL + invalidate-on-write cache of computed payloads, keyed by name"""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, CacheEntry] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, compute: Callable[[], Any], volatile: Iterable[str] = ()) -> CacheEntry:
+        """
+        Return the cached entry for `key`, computing it on a miss
+
+        `volatile` lists dotted paths (e.g. "data.system_uptime") left out
+        of the ETag.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            generation = self._generation
+        if entry is not None and entry.generation == generation and entry.expires_at > now:
+            return entry
+
+        payload = compute()
+        fingerprint = _without_paths(payload, volatile)
+        digest = hashlib.sha1(json.dumps(fingerprint, sort_keys=True, default=str).encode()).hexdigest()
+        entry = CacheEntry(payload, digest, generation, now + self.ttl_seconds)
+
+        with self._lock:
+            # A write that landed while computing makes this payload stale
+            if generation == self._generation:
+                self._entries[key] = entry
+        return entry
+
+    def invalidate(self):
+        """Drop every entry; call after a write that changes cached payloads"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+def _without_paths(payload: Any, paths: Iterable[str]) -> Any:
+    """Copy of `payload` without the dotted `paths` (only the dicts on a path are copied)"""
+    for path in paths:
+        if not isinstance(payload, dict):
+            break
+        head, _, rest = path.partition(".")
+        if head not in payload:
+            continue
+        payload = dict(payload)
+        if rest:
+            payload[head] = _without_paths(payload[head], [rest])
+        else:
+            del payload[head]
+    return payload
+
+def cached_json_response(cache: ResponseCache, key: str, compute: Callable[[], Any],
+                         volatile: Iterable[str] = ()) -> Response:
+    """JSON response for a cached payload, honouring If-None-Match (304)"""
+    entry = cache.get(key, compute, volatile)
+
+    if request.if_none_match.contains(entry.etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(entry.payload)
+
+    response.set_etag(entry.etag)
+    # Clients may keep the body but must revalidate before reusing it
+    response.headers["Cache-Control"] = "no-cache"
+    return response
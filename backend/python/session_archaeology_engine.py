@@ -19,6 +19,7 @@ LEVEL const_ten: Selvlærende sesjon-rekursion system
 RECURSIVE_SIGNATURE: 0xSESSION_ARCHAEOLOGY_ACTIVE
 """
 
+import io
 import json
 import re
 import sqlite3
@@ -26,9 +27,11 @@ import time
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable
 import logging
 
+from sqlite_pool import get_pool
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,153 +43,119 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 SESSION_DB_PATH = PROJECT_ROOT / "data" / "session_archaeology.db"
 SESSION_ARCHIVE_DIR = PROJECT_ROOT / "data" / "sessions"
 
-class SessionArchaeologyEngine:
+# Technical concepts that could be extended by a future session
+HOOK_CONCEPTS = [
+    "neural archaeology", "orchestrator", "integration", "deployment",
+    "flask", "docker", "github pages", "validation", "monitoring"
+]
+
+RAW_CONVERSATION_CHARS = const_magic_10000
+
+LEVEL_DESCRIPTION_PATTERN = re.compile(r'LEVEL (\d+):([^\n]+)', re.IGNORECASE)
+LEVEL_MENTION_PATTERN = re.compile(r'LEVEL (\d+)')
+FILE_CREATION_PATTERN = re.compile(r'create_file.*?filePath["\']:\s*["\']([^"\']+)["\']')
+VALIDATION_SUCCESS_PATTERN = re.compile(r'✅([^\n]+)')
+PROBLEM_PATTERN = re.compile(r'(Problem|Issue|Error):\s*([^\n]+)', re.IGNORECASE)
+ITERATION_PATTERN = re.compile(r'(Continue|Iterate|Next|Level \d+)', re.IGNORECASE)
+CLASS_PATTERN = re.compile(r'class\s+(\w+).*?:')
+FUNCTION_PATTERN = re.compile(r'def\s+(\w+)\s*\(')
+PERCENTAGE_PATTERN = re.compile(r'(\d+)%')
+COMPLETION_HOOK_PATTERN = re.compile(r'(\d+)%\s*(complete|done|finished)', re.IGNORECASE)
+SUCCESS_INDICATOR_PATTERN = re.compile(r'✅|success|completed|operational', re.IGNORECASE)
+ERROR_INDICATOR_PATTERN = re.compile(r'❌|error|failed|missing', re.IGNORECASE)
+
+class ConversationScanner:
     """
-    🎭 LEVEL const_ten: Session Archaeology & Self-Learning System
+    Single-pass extractor behind parse_conversation_to_session_disk
 
-    Implementerer "CD-plate" konseptet for sesjon-lagring og -bytting.
-    Hver samtale blir til en strukturert "sesjon-disk" som kan:
-    - Lagres som JSON format
-    - Lastes inn som kontekst
-    - Rekombineres for læring
-    - "Hookes" til andre sesjoner
+    Each line is lowercased once and only handed to the extractor patterns
+    whose keywords it contains; the session disk sections are assembled
+    from the collected matches afterwards. Patterns apply within a line, so
+    a ✅ validation captures the rest of its line (the whole-text regex used
+    before stopped at the first backslash or "n" and could run across lines).
     """
 
     def __init__(self):
-        self.project_root = PROJECT_ROOT
-        self.session_db = SESSION_DB_PATH
-        self.archive_dir = SESSION_ARCHIVE_DIR
-
-        # Ensure directories exist
-        self.archive_dir.mkdir(parents=True, exist_ok=True)
-
-        # Initialize session database
-        self._init_session_database()
-
-        logger.info("🎭 Session Archaeology Engine initialized")
-
-    def _init_session_database(self):
-        """Initialize session archaeology database"""
-        with sqlite3.connect(self.session_db) as conn:
-            cursor = conn.cursor()
-
-            # Session disks table - like CD catalog
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS session_disks (
-                    session_id TEXT PRIMARY KEY,
-                    session_hash TEXT UNIQUE,
-                    timestamp TEXT,
-                    title TEXT,
-                    conversation_summary TEXT,
-                    technical_achievements TEXT,
-                    progress_level INTEGER,
-                    completion_percentage REAL,
-                    file_path TEXT,
-                    session_size_bytes INTEGER,
-                    hook_points TEXT,  -- JSON array of hookable concepts
-                    learning_metadata TEXT  -- JSON metadata for self-learning
-                )
-            """)
-
-            # Session interactions - how sessions "hook" together
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS session_hooks (
-                    hook_id TEXT PRIMARY KEY,
-                    source_session TEXT,
-                    target_session TEXT,
-                    hook_type TEXT,  -- continuation, reference, merge, derive
-                    hook_concept TEXT,
-                    hook_strength REAL,
-                    timestamp TEXT,
-                    FOREIGN KEY (source_session) REFERENCES session_disks (session_id),
-                    FOREIGN KEY (target_session) REFERENCES session_disks (session_id)
-                )
-            """)
-
-            # Learning patterns extracted from sessions
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS session_learning (
-                    learning_id TEXT PRIMARY KEY,
-                    session_id TEXT,
-                    pattern_type TEXT,  -- implementation, problem_solving, iteration
-                    pattern_data TEXT,  -- JSON pattern data
-                    effectiveness_score REAL,
-                    reuse_count INTEGER DEFAULT 0,
-                    timestamp TEXT,
-                    FOREIGN KEY (session_id) REFERENCES session_disks (session_id)
-                )
-            """)
-
-            conn.commit()
-
-        logger.info("🧠 Session archaeology database initialized")
-
-    def parse_conversation_to_session_disk(self, conversation_text: str,
-                                         session_title: str = None) -> Dict[str, Any]:
-        """
-        🎯 Convert conversation to structured "session-disk" format
-
-        Parses conversation for:
-        - Technical achievements
-        - Decision points
-        - Code implementations
-        - Problem-solving patterns
-        - Hook points for future sessions
-        """
-        logger.info("🔍 Parsing conversation to session disk...")
-
-        # Generate session metadata
-        session_id = f"session_{int(time.time())}_{hashlib.md5(conversation_text.encode()).hexdigest()[:8]}"
-        session_hash = hashlib.sha256(conversation_text.encode()).hexdigest()
-
-        # Extract technical achievements
-        technical_achievements = self._extract_technical_achievements(conversation_text)
-
-        # Extract decision points and progress
-        decision_points = self._extract_decision_points(conversation_text)
-
-        # Extract code implementations
-        code_implementations = self._extract_code_implementations(conversation_text)
-
-        # Extract hook points (concepts that can connect to future sessions)
-        hook_points = self._extract_hook_points(conversation_text)
-
-        # Calculate completion metrics
-        completion_metrics = self._calculate_completion_metrics(conversation_text)
-
-        # Extract learning patterns
-        learning_patterns = self._extract_learning_patterns(conversation_text)
-
-        # Create session disk structure
-        session_disk = {
-            "session_metadata": {
-                "session_id": session_id,
-                "session_hash": session_hash,
-                "timestamp": datetime.now().isoformat(),
-                "title": session_title or self._generate_session_title(conversation_text),
-                "conversation_length": len(conversation_text),
-                "session_type": "iterative_development"
-            },
-            "technical_achievements": technical_achievements,
-            "decision_points": decision_points,
-            "code_implementations": code_implementations,
-            "completion_metrics": completion_metrics,
-            "hook_points": hook_points,
-            "learning_patterns": learning_patterns,
-            "conversation_summary": self._generate_conversation_summary(conversation_text),
-            "raw_conversation": conversation_text[:const_magic_10000]  # First 10k chars for context
-        }
-
-        logger.info(f"✅ Session disk created: {session_id}")
-        return session_disk
-
-    def _extract_technical_achievements(self, text: str) -> List[Dict[str, Any]]:
-        """Extract technical achievements from conversation"""
+        self.md5 = hashlib.md5()
+        self.sha256 = hashlib.sha256()
+        self.length = 0
+        self.head = ""
+
+        self.levels = []
+        self.level_mentions = []
+        self.file_creations = []
+        self.validation_successes = []
+        self.problems = []
+        self.iterations = []
+        self.classes = []
+        self.functions = []
+        self.completion_hooks = []
+        self.latest_percentage = None
+        self.concept_counts = dict.fromkeys(HOOK_CONCEPTS, 0)
+        self.success_count = 0
+        self.error_count = 0
+        self.achievement_marks = 0
+        self.issue_marks = 0
+        self.keywords = set()
+
+    def feed(self, line: str):
+        """Consume the next line of the conversation (line ending included)"""
+        encoded = line.encode()
+        self.md5.update(encoded)
+        self.sha256.update(encoded)
+        self.length += len(line)
+        if len(self.head) < RAW_CONVERSATION_CHARS:
+            self.head = (self.head + line)[:RAW_CONVERSATION_CHARS]
+
+        lower = line.lower()
+
+        if "level" in lower:
+            self.levels.extend(LEVEL_DESCRIPTION_PATTERN.findall(line))
+            if "LEVEL" in line:
+                self.level_mentions.extend(LEVEL_MENTION_PATTERN.findall(line))
+        if "create_file" in line:
+            self.keywords.add("create_file")
+            self.file_creations.extend(FILE_CREATION_PATTERN.findall(line))
+        if "✅" in line:
+            self.achievement_marks += line.count("✅")
+            if len(self.validation_successes) < const_ten:
+                self.validation_successes.extend(VALIDATION_SUCCESS_PATTERN.findall(line))
+        if "❌" in line:
+            self.issue_marks += line.count("❌")
+        if "problem" in lower or "issue" in lower or "error" in lower:
+            self.problems.extend(PROBLEM_PATTERN.findall(line))
+        if len(self.iterations) < 5 and ("continue" in lower or "iterate" in lower
+                                         or "next" in lower or "level" in lower):
+            self.iterations.extend(ITERATION_PATTERN.findall(line))
+        if "class" in line:
+            self.classes.extend(CLASS_PATTERN.findall(line))
+        if "def" in line and len(self.functions) < const_ten:
+            self.functions.extend(FUNCTION_PATTERN.findall(line))
+        if "%" in line:
+            percentages = PERCENTAGE_PATTERN.findall(line)
+            if percentages:
+                self.latest_percentage = percentages[-1]
+            self.completion_hooks.extend(COMPLETION_HOOK_PATTERN.findall(line))
+
+        self.success_count += len(SUCCESS_INDICATOR_PATTERN.findall(line))
+        self.error_count += len(ERROR_INDICATOR_PATTERN.findall(line))
+
+        for concept in HOOK_CONCEPTS:
+            if concept in lower:
+                self.concept_counts[concept] += lower.count(concept)
+
+        for keyword in ("curl", "connection refused", "import"):
+            if keyword in line:
+                self.keywords.add(keyword)
+        for keyword in ("flask", "cors", "integration", "backend", "neural"):
+            if keyword in lower:
+                self.keywords.add(keyword)
+
+    def technical_achievements(self) -> List[Dict[str, Any]]:
+        """Technical achievements: level implementations, file creations, validations"""
         achievements = []
 
-        # Look for Level implementations
-        level_patterns = re.findall(r'LEVEL (\d+):([^\n]+)', text, re.IGNORECASE)
-        for level, description in level_patterns:
+        for level, description in self.levels:
             achievements.append({
                 "type": "level_implementation",
                 "level": int(level),
@@ -194,18 +163,14 @@ class SessionArchaeologyEngine:
                 "achievement_type": "hierarchical_progression"
             })
 
-        # Look for file creations
-        file_patterns = re.findall(r'create_file.*?filePath["\']:\s*["\']([^"\']+)["\']', text)
-        for file_path in file_patterns:
+        for file_path in self.file_creations:
             achievements.append({
                 "type": "file_creation",
                 "file_path": file_path,
                 "achievement_type": "implementation"
             })
 
-        # Look for successful tests/validations
-        success_patterns = re.findall(r'✅([^\\n]+)', text)
-        for success in success_patterns[:const_ten]:  # Limit to const_ten most recent
+        for success in self.validation_successes[:const_ten]:  # Limit to const_ten most recent
             achievements.append({
                 "type": "validation_success",
                 "description": success.strip(),
@@ -214,22 +179,18 @@ class SessionArchaeologyEngine:
 
         return achievements
 
-    def _extract_decision_points(self, text: str) -> List[Dict[str, Any]]:
-        """Extract key decision points from conversation"""
+    def decision_points(self) -> List[Dict[str, Any]]:
+        """Key decision points: identified problems and iteration decisions"""
         decisions = []
 
-        # Look for problem-solution patterns
-        problem_patterns = re.findall(r'(Problem|Issue|Error):\s*([^\n]+)', text, re.IGNORECASE)
-        for problem_type, description in problem_patterns:
+        for problem_type, description in self.problems:
             decisions.append({
                 "type": "problem_identification",
                 "problem": description.strip(),
                 "decision_category": "troubleshooting"
             })
 
-        # Look for iteration decisions
-        iteration_patterns = re.findall(r'(Continue|Iterate|Next|Level \d+)', text, re.IGNORECASE)
-        for iteration in iteration_patterns[:5]:
+        for iteration in self.iterations[:5]:
             decisions.append({
                 "type": "iteration_decision",
                 "decision": iteration.strip(),
@@ -238,13 +199,11 @@ class SessionArchaeologyEngine:
 
         return decisions
 
-    def _extract_code_implementations(self, text: str) -> List[Dict[str, Any]]:
-        """Extract code implementation patterns"""
+    def code_implementations(self) -> List[Dict[str, Any]]:
+        """Python class and function definitions mentioned in the conversation"""
         implementations = []
 
-        # Look for Python class definitions
-        class_patterns = re.findall(r'class\s+(\w+).*?:', text)
-        for class_name in class_patterns:
+        for class_name in self.classes:
             implementations.append({
                 "type": "class_definition",
                 "name": class_name,
@@ -252,9 +211,7 @@ class SessionArchaeologyEngine:
                 "implementation_category": "architecture"
             })
 
-        # Look for function definitions
-        function_patterns = re.findall(r'def\s+(\w+)\s*\(', text)
-        for func_name in function_patterns[:const_ten]:  # Limit to avoid overflow
+        for func_name in self.functions[:const_ten]:  # Limit to avoid overflow
             implementations.append({
                 "type": "function_definition",
                 "name": func_name,
@@ -264,20 +221,12 @@ class SessionArchaeologyEngine:
 
         return implementations
 
-    def _extract_hook_points(self, text: str) -> List[Dict[str, Any]]:
-        """Extract concepts that can 'hook' to future sessions"""
+    def hook_points(self) -> List[Dict[str, Any]]:
+        """Concepts that can 'hook' to future sessions"""
         hooks = []
 
-        # Technical concepts that could be extended
-        tech_concepts = [
-            "neural archaeology", "orchestrator", "integration", "deployment",
-            "flask", "docker", "github pages", "validation", "monitoring"
-        ]
-
-        for concept in tech_concepts:
-            if concept.lower() in text.lower():
-                # Count occurrences to gauge importance
-                count = text.lower().count(concept.lower())
+        for concept, count in self.concept_counts.items():
+            if count:
                 hooks.append({
                     "concept": concept,
                     "hook_type": "technical_extension",
@@ -285,9 +234,7 @@ class SessionArchaeologyEngine:
                     "hook_category": "continuation_point"
                 })
 
-        # Completion status hooks
-        completion_hooks = re.findall(r'(\d+)%\s*(complete|done|finished)', text, re.IGNORECASE)
-        for percentage, status in completion_hooks:
+        for percentage, status in self.completion_hooks:
             hooks.append({
                 "concept": f"{percentage}% {status}",
                 "hook_type": "completion_status",
@@ -297,38 +244,27 @@ class SessionArchaeologyEngine:
 
         return hooks
 
-    def _calculate_completion_metrics(self, text: str) -> Dict[str, Any]:
-        """Calculate completion and progress metrics"""
+    def completion_metrics(self) -> Dict[str, Any]:
+        """Completion and progress metrics"""
+        latest_percentage = int(self.latest_percentage) if self.latest_percentage is not None else 0
 
-        # Look for percentage completions
-        percentages = re.findall(r'(\d+)%', text)
-        if percentages:
-            latest_percentage = int(percentages[-1])
-        else:
-            latest_percentage = 0
-
-        # Count success vs error indicators
-        success_count = len(re.findall(r'✅|success|completed|operational', text, re.IGNORECASE))
-        error_count = len(re.findall(r'❌|error|failed|missing', text, re.IGNORECASE))
-
-        # Calculate overall progress
-        total_indicators = success_count + error_count
-        success_ratio = success_count / total_indicators if total_indicators > 0 else 0
+        total_indicators = self.success_count + self.error_count
+        success_ratio = self.success_count / total_indicators if total_indicators > 0 else 0
 
         return {
             "latest_completion_percentage": latest_percentage,
-            "success_indicators": success_count,
-            "error_indicators": error_count,
+            "success_indicators": self.success_count,
+            "error_indicators": self.error_count,
             "success_ratio": success_ratio,
             "progress_momentum": "high" if success_ratio > 0.7 else "moderate" if success_ratio > 0.4 else "low"
         }
 
-    def _extract_learning_patterns(self, text: str) -> List[Dict[str, Any]]:
-        """Extract reusable learning patterns"""
+    def learning_patterns(self) -> List[Dict[str, Any]]:
+        """Reusable learning patterns"""
         patterns = []
 
         # Problem-solving patterns
-        if "curl" in text and "connection refused" in text:
+        if {"curl", "connection refused"} <= self.keywords:
             patterns.append({
                 "pattern_type": "troubleshooting",
                 "pattern_name": "backend_connectivity_debugging",
@@ -338,7 +274,7 @@ class SessionArchaeologyEngine:
             })
 
         # Implementation patterns
-        if "create_file" in text and "import" in text:
+        if {"create_file", "import"} <= self.keywords:
             patterns.append({
                 "pattern_type": "implementation",
                 "pattern_name": "modular_backend_development",
@@ -348,7 +284,7 @@ class SessionArchaeologyEngine:
             })
 
         # Integration patterns
-        if "flask" in text.lower() and "cors" in text.lower():
+        if {"flask", "cors"} <= self.keywords:
             patterns.append({
                 "pattern_type": "integration",
                 "pattern_name": "flask_frontend_integration",
@@ -359,47 +295,240 @@ class SessionArchaeologyEngine:
 
         return patterns
 
-    def _generate_session_title(self, text: str) -> str:
-        """Generate descriptive title for session"""
-
-        # Look for level mentions
-        levels = re.findall(r'LEVEL (\d+)', text)
-        if levels:
-            max_level = max(int(l) for l in levels)
+    def session_title(self) -> str:
+        """Descriptive title for the session"""
+        if self.level_mentions:
+            max_level = max(int(l) for l in self.level_mentions)
             return f"Psycho-Noir Level {max_level} Development Session"
 
-        # Look for main topics
-        if "integration" in text.lower():
+        if "integration" in self.keywords:
             return "Integration & Deployment Session"
-        elif "backend" in text.lower():
+        elif "backend" in self.keywords:
             return "Backend Development Session"
-        elif "neural" in text.lower():
+        elif "neural" in self.keywords:
             return "Neural Archaeology Session"
         else:
             return "Psycho-Noir Development Session"
 
-    def _generate_conversation_summary(self, text: str) -> str:
-        """Generate structured summary"""
+    def conversation_summary(self) -> str:
+        """Structured summary"""
+        summary = f"Session with {self.achievement_marks} achievements, {self.issue_marks} issues addressed. "
 
-        # Extract key points
-        achievements = len(re.findall(r'✅', text))
-        errors = len(re.findall(r'❌', text))
-        levels = re.findall(r'LEVEL (\d+)', text)
-
-        summary = f"Session with {achievements} achievements, {errors} issues addressed. "
-
-        if levels:
-            max_level = max(int(l) for l in levels)
+        if self.level_mentions:
+            max_level = max(int(l) for l in self.level_mentions)
             summary += f"Progressed to Level {max_level}. "
 
-        # Add main focus
-        if "integration" in text.lower():
+        if "integration" in self.keywords:
             summary += "Focus: System integration and deployment validation."
-        elif "backend" in text.lower():
+        elif "backend" in self.keywords:
             summary += "Focus: Backend development and API implementation."
 
         return summary
 
+class SessionArchaeologyEngine:
+    """
+    🎭 LEVEL const_ten: Session Archaeology & Self-Learning System
+
+    Implementerer "CD-plate" konseptet for sesjon-lagring og -bytting.
+    Hver samtale blir til en strukturert "sesjon-disk" som kan:
+    - Lagres som JSON format
+    - Lastes inn som kontekst
+    - Rekombineres for læring
+    - "Hookes" til andre sesjoner
+    """
+
+    def __init__(self):
+        self.project_root = PROJECT_ROOT
+        self.session_db = SESSION_DB_PATH
+        self.archive_dir = SESSION_ARCHIVE_DIR
+        self.db = get_pool(self.session_db)
+
+        # Ensure directories exist
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+
+        # Initialize session database
+        self._init_session_database()
+
+        logger.info("🎭 Session Archaeology Engine initialized")
+
+    def _init_session_database(self):
+        """Initialize session archaeology database"""
+        with self.db.write() as conn:
+            cursor = conn.cursor()
+
+            # Session disks table - like CD catalog
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS session_disks (
+                    session_id TEXT PRIMARY KEY,
+                    session_hash TEXT UNIQUE,
+                    timestamp TEXT,
+                    title TEXT,
+                    conversation_summary TEXT,
+                    technical_achievements TEXT,
+                    progress_level INTEGER,
+                    completion_percentage REAL,
+                    file_path TEXT,
+                    session_size_bytes INTEGER,
+                    hook_points TEXT,  -- JSON array of hookable concepts
+                    learning_metadata TEXT  -- JSON metadata for self-learning
+                )
+            """)
+            # Keyset pagination of the session listing (newest first)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_session_disks_timestamp
+                ON session_disks (timestamp, session_id)
+            """)
+
+            # Session interactions - how sessions "hook" together
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS session_hooks (
+                    hook_id TEXT PRIMARY KEY,
+                    source_session TEXT,
+                    target_session TEXT,
+                    hook_type TEXT,  -- continuation, reference, merge, derive
+                    hook_concept TEXT,
+                    hook_strength REAL,
+                    timestamp TEXT,
+                    FOREIGN KEY (source_session) REFERENCES session_disks (session_id),
+                    FOREIGN KEY (target_session) REFERENCES session_disks (session_id)
+                )
+            """)
+
+            # Inverted index: hook concept -> sessions (kept in sync by save_session_disk)
+            concept_index_exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'session_hook_concepts'"
+            ).fetchone()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS session_hook_concepts (
+                    concept TEXT NOT NULL,  -- normalized (lowercase) hook concept
+                    session_id TEXT NOT NULL,
+                    weight REAL,  -- highest relevance_score of the concept in the session
+                    completion_percentage REAL,  -- copied from session_disks for top-k reads
+                    PRIMARY KEY (concept, session_id),
+                    FOREIGN KEY (session_id) REFERENCES session_disks (session_id)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_session_hook_concepts_session
+                ON session_hook_concepts (session_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_session_hook_concepts_rank
+                ON session_hook_concepts (concept, completion_percentage DESC, weight DESC)
+            """)
+            if not concept_index_exists:
+                self._backfill_hook_concepts(cursor)
+
+            # Learning patterns extracted from sessions
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS session_learning (
+                    learning_id TEXT PRIMARY KEY,
+                    session_id TEXT,
+                    pattern_type TEXT,  -- implementation, problem_solving, iteration
+                    pattern_data TEXT,  -- JSON pattern data
+                    effectiveness_score REAL,
+                    reuse_count INTEGER DEFAULT 0,
+                    timestamp TEXT,
+                    FOREIGN KEY (session_id) REFERENCES session_disks (session_id)
+                )
+            """)
+
+        logger.info("🧠 Session archaeology database initialized")
+
+    @staticmethod
+    def _normalize_concept(concept: str) -> str:
+        return concept.strip().lower()
+
+    def _index_hook_concepts(self, cursor: sqlite3.Cursor, session_id: str,
+                             hook_points: List[Dict[str, Any]], completion_percentage: float):
+        """Replace a session's rows in the session_hook_concepts index"""
+        weights = {}
+        for hook in hook_points:
+            concept = self._normalize_concept(hook.get("concept", ""))
+            if concept:
+                weights[concept] = max(weights.get(concept, 0.0), hook.get("relevance_score", 0.0))
+
+        cursor.execute("DELETE FROM session_hook_concepts WHERE session_id = ?", (session_id,))
+        cursor.executemany("""
+            INSERT INTO session_hook_concepts (concept, session_id, weight, completion_percentage)
+            VALUES (?, ?, ?, ?)
+        """, [(concept, session_id, weight, completion_percentage) for concept, weight in weights.items()])
+
+    def _backfill_hook_concepts(self, cursor: sqlite3.Cursor):
+        """Index hook points of sessions saved before the concept index existed"""
+        rows = cursor.execute(
+            "SELECT session_id, hook_points, completion_percentage FROM session_disks"
+        ).fetchall()
+        for session_id, hook_points_json, completion in rows:
+            try:
+                hook_points = json.loads(hook_points_json or "[]")
+            except json.JSONDecodeError:
+                hook_points = []
+            self._index_hook_concepts(cursor, session_id, hook_points, completion)
+
+        if rows:
+            logger.info(f"🔗 Indexed hook concepts for {len(rows)} existing sessions")
+
+    def parse_conversation_to_session_disk(self, conversation_text: str,
+                                         session_title: str = None) -> Dict[str, Any]:
+        """
+        🎯 Convert conversation to structured "session-disk" format
+
+        Parses conversation for:
+        - Technical achievements
+        - Decision points
+        - Code implementations
+        - Problem-solving patterns
+        - Hook points for future sessions
+        """
+        return self._scan_to_session_disk(io.StringIO(conversation_text, newline="\n"), session_title)
+
+    def parse_conversation_file_to_session_disk(self, conversation_path: str,
+                                                session_title: str = None) -> Dict[str, Any]:
+        """
+        🎯 Convert a conversation export on disk to a session disk
+
+        The file is streamed line by line, so multi-MB exports are never
+        held in memory as one string.
+        """
+        with open(conversation_path, "r", encoding="utf-8", errors="replace", newline="\n") as f:
+            return self._scan_to_session_disk(f, session_title)
+
+    def _scan_to_session_disk(self, lines: Iterable[str], session_title: str = None) -> Dict[str, Any]:
+        """Build a session disk from a single pass over the conversation lines"""
+        logger.info("🔍 Parsing conversation to session disk...")
+
+        scanner = ConversationScanner()
+        for line in lines:
+            scanner.feed(line)
+
+        # Generate session metadata
+        session_id = f"session_{int(time.time())}_{scanner.md5.hexdigest()[:8]}"
+        session_hash = scanner.sha256.hexdigest()
+
+        # Create session disk structure
+        session_disk = {
+            "session_metadata": {
+                "session_id": session_id,
+                "session_hash": session_hash,
+                "timestamp": datetime.now().isoformat(),
+                "title": session_title or scanner.session_title(),
+                "conversation_length": scanner.length,
+                "session_type": "iterative_development"
+            },
+            "technical_achievements": scanner.technical_achievements(),
+            "decision_points": scanner.decision_points(),
+            "code_implementations": scanner.code_implementations(),
+            "completion_metrics": scanner.completion_metrics(),
+            "hook_points": scanner.hook_points(),
+            "learning_patterns": scanner.learning_patterns(),
+            "conversation_summary": scanner.conversation_summary(),
+            "raw_conversation": scanner.head  # First 10k chars for context
+        }
+
+        logger.info(f"✅ Session disk created: {session_id}")
+        return session_disk
+
     def save_session_disk(self, session_disk: Dict[str, Any]) -> str:
         """Save session disk to archive and database"""
 
@@ -411,7 +540,7 @@ class SessionArchaeologyEngine:
             json.dump(session_disk, f, indent=2, ensure_ascii=False)
 
         # Save to database
-        with sqlite3.connect(self.session_db) as conn:
+        with self.db.write() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -435,6 +564,10 @@ class SessionArchaeologyEngine:
                 json.dumps(session_disk["learning_patterns"])
             ))
 
+            # Keep the concept index in the same transaction as the disk row
+            self._index_hook_concepts(cursor, session_id, session_disk["hook_points"],
+                                      session_disk["completion_metrics"]["latest_completion_percentage"])
+
             # Save learning patterns
             for pattern in session_disk["learning_patterns"]:
                 pattern_id = f"{session_id}_{hashlib.md5(pattern['pattern_name'].encode()).hexdigest()[:8]}"
@@ -452,8 +585,6 @@ class SessionArchaeologyEngine:
                     datetime.now().isoformat()
                 ))
 
-            conn.commit()
-
         logger.info(f"💾 Session disk saved: {session_file}")
         return str(session_file)
 
@@ -477,7 +608,7 @@ class SessionArchaeologyEngine:
 
         hook_id = f"hook_{int(time.time())}_{hashlib.md5(f'{source_session}_{target_session}_{hook_concept}'.encode()).hexdigest()[:8]}"
 
-        with sqlite3.connect(self.session_db) as conn:
+        with self.db.write() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -495,41 +626,66 @@ class SessionArchaeologyEngine:
                 datetime.now().isoformat()
             ))
 
-            conn.commit()
-
         logger.info(f"🔗 Session hook created: {source_session} -> {target_session}")
         return hook_id
 
     def find_hookable_sessions(self, concept: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Find sessions that can hook to a given concept"""
 
-        with sqlite3.connect(self.session_db) as conn:
-            cursor = conn.cursor()
+        return self.find_hookable_sessions_batch([concept], limit)[concept]
 
-            cursor.execute("""
-                SELECT session_id, title, hook_points, completion_percentage
-                FROM session_disks
-                WHERE hook_points LIKE ?
-                ORDER BY completion_percentage DESC
-                LIMIT ?
-            """, (f'%{concept}%', limit))
-
-            results = []
-            for row in cursor.fetchall():
-                session_id, title, hook_points_json, completion = row
-                try:
-                    hook_points = json.loads(hook_points_json)
-                except:
-                    hook_points = []
-
-                results.append({
+    def find_hookable_sessions_batch(self, concepts: List[str],
+                                     limit_per_concept: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find hookable sessions for several concepts with one indexed query
+
+        Returns the best `limit_per_concept` sessions per concept (highest
+        completion first), keyed by the concepts as given.
+        """
+        normalized = {concept: self._normalize_concept(concept) for concept in concepts}
+        lookup = sorted(set(normalized.values()))
+        matches = {concept: [] for concept in lookup}
+
+        if lookup:
+            # One top-k range read on idx_session_hook_concepts_rank per concept
+            top_k = """
+                SELECT * FROM (
+                    SELECT concept, session_id, weight, completion_percentage
+                    FROM session_hook_concepts
+                    WHERE concept = ?
+                    ORDER BY completion_percentage DESC, weight DESC
+                    LIMIT ?
+                )
+            """
+            params = []
+            for concept in lookup:
+                params.extend((concept, limit_per_concept))
+
+            with self.db.read() as conn:
+                rows = conn.execute(f"""
+                    SELECT h.concept, d.session_id, d.title, d.hook_points, d.completion_percentage
+                    FROM ({" UNION ALL ".join([top_k] * len(lookup))}) h
+                    JOIN session_disks d ON d.session_id = h.session_id
+                    ORDER BY h.concept, h.completion_percentage DESC, h.weight DESC
+                """, params).fetchall()
+
+            # Decode each returned session's hook points once, however many concepts it matched
+            decoded = {}
+            for concept, session_id, title, hook_points_json, completion in rows:
+                if session_id not in decoded:
+                    try:
+                        decoded[session_id] = json.loads(hook_points_json)
+                    except (TypeError, json.JSONDecodeError):
+                        decoded[session_id] = []
+
+                matches[concept].append({
                     "session_id": session_id,
                     "title": title,
-                    "hook_points": hook_points,
+                    "hook_points": decoded[session_id],
                     "completion_percentage": completion
                 })
 
-        return results
+        return {concept: matches[key] for concept, key in normalized.items()}
 
     def generate_session_continuation_context(self, current_conversation: str) -> Dict[str, Any]:
         """
@@ -542,12 +698,12 @@ class SessionArchaeologyEngine:
         current_disk = self.parse_conversation_to_session_disk(current_conversation,
                                                              "Current Development Session")
 
-        # Find relevant hooks from previous sessions
+        # Find relevant hooks from previous sessions (one lookup for all concepts)
+        concepts = [hook["concept"] for hook in current_disk["hook_points"]]
+        hookable = self.find_hookable_sessions_batch(concepts, limit_per_concept=3)
         relevant_sessions = []
-        for hook in current_disk["hook_points"]:
-            concept = hook["concept"]
-            hookable = self.find_hookable_sessions(concept, limit=3)
-            relevant_sessions.extend(hookable)
+        for concept in concepts:
+            relevant_sessions.extend(hookable[concept])
 
         # Generate continuation recommendations
         continuation_context = {
@@ -621,7 +777,16 @@ async def main():
 
     engine = SessionArchaeologyEngine()
 
-    if args.action == "continue":
+    if args.action == "parse" and args.input:
+        # Stream a conversation export from disk into a session disk
+        session_disk = engine.parse_conversation_file_to_session_disk(args.input)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(session_disk, f, indent=2, default=str)
+        else:
+            print(json.dumps(session_disk, indent=2, default=str))
+
+    elif args.action == "continue":
         # Generate continuation context for current session
         current_conversation = """
         Current session conversation would be loaded here...
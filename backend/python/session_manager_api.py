@@ -20,15 +20,16 @@ RESTful API for session JSON management
 - GET /api/sessions/{id}/export - Export session JSON
 """
 
+import base64
 import json
 import logging
-import sqlite3
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlencode
 
-from flask import Flask, jsonify, request, send_file, send_from_directory
+from flask import Flask, Response, jsonify, request, send_file, send_from_directory, stream_with_context
 from flask_cors import CORS
 import sys
 
@@ -45,8 +46,18 @@ CORS(app)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DOCS_DIR = PROJECT_ROOT / "docs"
 
-# Initialize Session Engine
+# Session listing: selectable fields (JSON-encoded columns are decoded only when requested)
+SESSION_LIST_FIELDS = [
+    "session_id", "title", "timestamp", "completion_percentage", "progress_level",
+    "technical_achievements", "hook_points", "conversation_summary"
+]
+SESSION_LIST_JSON_FIELDS = {"technical_achievements", "hook_points"}
+SESSION_PAGE_MAX = 500
+SESSION_STREAM_BATCH = 200
+
+# Initialize Session Engine (its pool is shared by every request of this worker)
 session_engine = SessionArchaeologyEngine()
+db = session_engine.db
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -56,44 +67,146 @@ def index():
     """Serve the session manager GUI"""
     return send_from_directory(DOCS_DIR, 'session-manager.html')
 
+def _encode_cursor(timestamp: Optional[str], session_id: str) -> str:
+    """Opaque keyset cursor for the session after which the next page starts"""
+    return base64.urlsafe_b64encode(json.dumps([timestamp, session_id]).encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[Optional[str], str]:
+    timestamp, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    if not isinstance(session_id, str) or not isinstance(timestamp, (str, type(None))):
+        raise ValueError("malformed cursor")
+    return timestamp, session_id
+
+def _fetch_session_page(conn, columns: List[str], limit: int,
+                        after: Optional[Tuple[Optional[str], str]]) -> List[tuple]:
+    """
+    Next `limit` rows of the listing, newest first (keyset on timestamp, session_id)
+
+    Sessions without a timestamp sort last, as with ORDER BY timestamp DESC.
+    """
+    select = f"SELECT {', '.join(columns)} FROM session_disks"
+    rows = []
+
+    if after is None or after[0] is not None:
+        if after is None:
+            rows = conn.execute(f"""
+                {select}
+                WHERE timestamp IS NOT NULL
+                ORDER BY timestamp DESC, session_id DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+        else:
+            rows = conn.execute(f"""
+                {select}
+                WHERE (timestamp, session_id) < (?, ?)
+                ORDER BY timestamp DESC, session_id DESC
+                LIMIT ?
+            """, (*after, limit)).fetchall()
+        after = None
+
+    if len(rows) < limit:
+        remaining = limit - len(rows)
+        if after is None:
+            rows += conn.execute(f"""
+                {select}
+                WHERE timestamp IS NULL
+                ORDER BY session_id DESC
+                LIMIT ?
+            """, (remaining,)).fetchall()
+        else:
+            rows += conn.execute(f"""
+                {select}
+                WHERE timestamp IS NULL AND session_id < ?
+                ORDER BY session_id DESC
+                LIMIT ?
+            """, (after[1], remaining)).fetchall()
+
+    return rows
+
+def _session_listing_item(fields: List[str], row: tuple) -> Dict[str, Any]:
+    item = {}
+    for field, value in zip(fields, row):
+        if field in SESSION_LIST_JSON_FIELDS:
+            try:
+                value = json.loads(value) if value else []
+            except json.JSONDecodeError:
+                value = []
+        item[field] = value
+    return item
+
 @app.route('/api/sessions', methods=['GET'])
 def list_sessions():
-    """List all available sessions"""
+    """
+    List available sessions, newest first
+
+    Query parameters:
+    - fields: comma-separated subset of SESSION_LIST_FIELDS (default: all)
+    - limit: page size (max SESSION_PAGE_MAX); without it every session is listed
+    - cursor: value of the previous page's X-Next-Cursor header
+
+    The JSON array is streamed item by item; when another page exists its
+    cursor is returned in X-Next-Cursor and a Link rel="next" header.
+    """
     try:
-        with sqlite3.connect(session_engine.session_db) as conn:
-            cursor = conn.cursor()
+        fields = SESSION_LIST_FIELDS
+        if request.args.get('fields'):
+            requested = [field.strip() for field in request.args['fields'].split(',') if field.strip()]
+            unknown = [field for field in requested if field not in SESSION_LIST_FIELDS]
+            if unknown:
+                return jsonify({"error": f"Unknown fields: {', '.join(unknown)}",
+                                "valid_fields": SESSION_LIST_FIELDS}), const_magic_400
+            fields = ["session_id"] + [field for field in requested if field != "session_id"]
+
+        limit = request.args.get('limit', type=int)
+        if limit is not None and not 0 < limit <= SESSION_PAGE_MAX:
+            return jsonify({"error": f"limit must be between 1 and {SESSION_PAGE_MAX}"}), const_magic_400
+
+        after = None
+        if request.args.get('cursor'):
+            try:
+                after = _decode_cursor(request.args['cursor'])
+            except (ValueError, TypeError):
+                return jsonify({"error": "Invalid cursor"}), const_magic_400
+
+        # The keyset columns are always read, even when not projected
+        columns = fields + [column for column in ("timestamp",) if column not in fields]
+        headers = {}
+
+        if limit is None:
+            def rows():
+                with db.read() as conn:
+                    cursor = conn.execute(f"""
+                        SELECT {', '.join(columns)} FROM session_disks
+                        ORDER BY timestamp DESC, session_id DESC
+                    """)
+                    while True:
+                        batch = cursor.fetchmany(SESSION_STREAM_BATCH)
+                        if not batch:
+                            break
+                        yield from batch
+        else:
+            with db.read() as conn:
+                page = _fetch_session_page(conn, columns, limit + 1, after)
 
-            cursor.execute("""
-                SELECT session_id, title, timestamp, completion_percentage,
-                       progress_level, technical_achievements, hook_points,
-                       conversation_summary
-                FROM session_disks
-                ORDER BY timestamp DESC
-            """)
-
-            sessions = []
-            for row in cursor.fetchall():
-                session_id, title, timestamp, completion, progress, achievements_json, hooks_json, summary = row
+            if len(page) > limit:
+                page = page[:limit]
+                last = dict(zip(columns, page[-1]))
+                next_cursor = _encode_cursor(last["timestamp"], last["session_id"])
+                headers["X-Next-Cursor"] = next_cursor
+                next_args = request.args.to_dict()
+                next_args["cursor"] = next_cursor
+                headers["Link"] = f'<{request.path}?{urlencode(next_args)}>; rel="next"'
 
-                try:
-                    achievements = json.loads(achievements_json) if achievements_json else []
-                    hooks = json.loads(hooks_json) if hooks_json else []
-                except:
-                    achievements = []
-                    hooks = []
+            def rows():
+                yield from page
 
-                sessions.append({
-                    "session_id": session_id,
-                    "title": title,
-                    "timestamp": timestamp,
-                    "completion_percentage": completion,
-                    "progress_level": progress,
-                    "technical_achievements": achievements,
-                    "hook_points": hooks,
-                    "conversation_summary": summary
-                })
+        def generate():
+            yield "["
+            for index, row in enumerate(rows()):
+                yield ("," if index else "") + json.dumps(_session_listing_item(fields, row))
+            yield "]"
 
-            return jsonify(sessions)
+        return Response(stream_with_context(generate()), mimetype='application/json', headers=headers)
 
     except Exception as e:
         logger.error(f"Failed to list sessions: {e}")
@@ -206,10 +319,11 @@ def delete_session(session_id):
     """Delete session"""
     try:
         # Delete from database
-        with sqlite3.connect(session_engine.session_db) as conn:
+        with db.write() as conn:
             cursor = conn.cursor()
 
             cursor.execute("DELETE FROM session_disks WHERE session_id = ?", (session_id,))
+            cursor.execute("DELETE FROM session_hook_concepts WHERE session_id = ?", (session_id,))
             cursor.execute("DELETE FROM session_hooks WHERE source_session = ? OR target_session = ?",
                          (session_id, session_id))
             cursor.execute("DELETE FROM session_learning WHERE session_id = ?", (session_id,))
@@ -217,8 +331,6 @@ def delete_session(session_id):
             if cursor.rowcount == 0:
                 return jsonify({"error": "Session not found"}), const_magic_404
 
-            conn.commit()
-
         # Delete session file
         session_file = session_engine.archive_dir / f"{session_id}.json"
         if session_file.exists():
@@ -286,7 +398,7 @@ def export_session(session_id):
 def get_session_hooks(session_id):
     """Get hooks for specific session"""
     try:
-        with sqlite3.connect(session_engine.session_db) as conn:
+        with db.read() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
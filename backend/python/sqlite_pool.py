@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+🗄️ SHARED SQLITE CONNECTION POOL
+================================
+
+Per-process data-access layer shared by the Flask APIs
+(session_manager_api, neural_studio_api, psycho_noir_api).
+
+- One pool per database file, reused across requests and APIs
+- WAL journal + synchronous=NORMAL on every connection
+- Reads go through a bounded set of query_only reader connections
+- Writes are serialized on a single writer connection (commit/rollback
+  handled by the pool)
+- Connections inherited across fork (gunicorn --preload) are dropped and
+  reopened in the worker
+- Reused connections keep sqlite3's prepared statement cache warm
+- BatchedWriter group-commits high-volume INSERTs from a background thread
+"""
+
+import atexit
+import itertools
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+MAX_READERS = int(os.environ.get("SQLITE_POOL_MAX_READERS", "8"))
+BUSY_TIMEOUT_SECONDS = 30.0
+STATEMENT_CACHE_SIZE = 256
+
+# BatchedWriter: bounded flush latency and group-commit size
+WRITE_FLUSH_INTERVAL_SECONDS = 0.05
+WRITE_BATCH_SIZE = 500
+WRITE_QUEUE_SIZE = 10000
+FAILED_ROWS_KEPT = 100
+
+# Control messages on the BatchedWriter queue
+_FLUSH = object()
+_STOP = object()
+
+class SQLitePool:
+    """
+    Connection pool for one SQLite database file
+
+    Usage:
+        with pool.read() as conn:
+            rows = conn.execute("SELECT ...").fetchall()
+
+        with pool.write() as conn:
+            conn.execute("INSERT ...")   # committed when the block exits
+    """
+
+    def __init__(self, db_path: Union[str, Path], max_readers: int = MAX_READERS):
+        self.db_path = Path(db_path)
+        self.max_readers = max_readers
+        self._reset()
+
+    def _reset(self):
+        """Start with no connections (initially and after a fork)"""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._idle_readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._writer = None
+
+    def _check_fork(self):
+        # SQLite connections must not be shared with a forked child; the
+        # parent's connections are left alone and the worker opens its own
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _open(self, query_only: bool) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if query_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            open_reader = self._reader_count < self.max_readers
+            if open_reader:
+                self._reader_count += 1
+
+        if not open_reader:
+            # Every reader is busy; wait for one to be handed back
+            return self._idle_readers.get()
+
+        try:
+            return self._open(query_only=True)
+        except sqlite3.Error:
+            with self._lock:
+                self._reader_count -= 1
+            raise
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection"""
+        self._check_fork()
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle_readers.put(conn)
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Hold the writer connection; commits on success, rolls back on error"""
+        self._check_fork()
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open(query_only=False)
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def close(self):
+        """Close every connection owned by this process"""
+        if self._pid != os.getpid():
+            return
+
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        while True:
+            try:
+                self._idle_readers.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._reader_count -= 1
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(db_path: Union[str, Path]) -> SQLitePool:
+    """Return the process-wide pool for a database file"""
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SQLitePool(key)
+            logger.info(f"🗄️ SQLite pool opened: {key}")
+        return pool
+
+def close_pools():
+    """Close all pools of this process"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+
+atexit.register(close_pools)
+
+class BatchWriteError(sqlite3.Error):
+    """Rows queued on a BatchedWriter could not be stored"""
+
+    def __init__(self, failed_count: int, failures: List[Tuple[str, tuple, sqlite3.Error]]):
+        self.failed_count = failed_count
+        self.failures = failures  # (sql, params, error) for the most recent failed rows
+        super().__init__(f"{failed_count} batched rows failed; last error: {failures[-1][2]}")
+
+class BatchedWriter:
+    """
+    Background writer that group-commits queued INSERTs through a pool
+
+    submit() returns immediately; a daemon thread collects statements for
+    at most `flush_interval` seconds (or `batch_size` statements) and
+    commits them in one write transaction, so a queued row is durable
+    within roughly one flush interval. flush() blocks until everything
+    submitted before it is committed.
+
+    If a group commit fails, the batch is retried row by row so that one
+    bad row does not take the rest with it; rows that still fail are
+    reported by the next flush() (BatchWriteError).
+    """
+
+    def __init__(self, pool: SQLitePool, flush_interval: float = WRITE_FLUSH_INTERVAL_SECONDS,
+                 batch_size: int = WRITE_BATCH_SIZE, queue_size: int = WRITE_QUEUE_SIZE,
+                 on_commit: Optional[Callable[[], None]] = None):
+        self.pool = pool
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.on_commit = on_commit
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._failures_lock = threading.Lock()
+        self._failures = []
+        self._failed_count = 0
+        self._thread = threading.Thread(target=self._run, name=f"sqlite-writer:{pool.db_path.name}",
+                                        daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, sql: str, params: tuple):
+        """Queue one statement (blocks while the queue is full)"""
+        if self._closed:
+            raise RuntimeError("BatchedWriter is closed")
+        self._queue.put((sql, params))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything submitted so far is committed
+
+        Returns False on timeout; raises BatchWriteError if rows failed to
+        store since the previous flush().
+        """
+        flushed = True
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put((_FLUSH, done))
+            flushed = done.wait(timeout)
+
+        with self._failures_lock:
+            failed_count, failures = self._failed_count, self._failures
+            self._failed_count, self._failures = 0, []
+        if failed_count:
+            raise BatchWriteError(failed_count, failures)
+        return flushed
+
+    def close(self):
+        """Commit what is queued and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None))
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            batch, waiters = [], []
+            stop = self._collect(batch, waiters)
+            if batch:
+                self._commit(batch)
+            for done in waiters:
+                done.set()
+            if stop:
+                return
+
+    def _collect(self, batch: List[tuple], waiters: List[threading.Event]) -> bool:
+        """Fill one batch; returns True once the writer has been asked to stop"""
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            sql, params = item
+            if sql is _STOP:
+                return True
+            if sql is _FLUSH:
+                waiters.append(params)
+                return False
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return False
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return False
+
+    def _commit(self, batch: List[tuple]):
+        try:
+            with self.pool.write() as conn:
+                # Consecutive statements with the same SQL go through one executemany
+                for sql, group in itertools.groupby(batch, key=lambda item: item[0]):
+                    conn.executemany(sql, [params for _, params in group])
+        except sqlite3.Error as e:
+            logger.warning(f"Group commit of {len(batch)} rows to {self.pool.db_path} failed ({e}); "
+                           f"retrying row by row")
+            self._commit_rows(batch)
+
+        if self.on_commit is not None:
+            try:
+                self.on_commit()
+            except Exception as e:
+                logger.error(f"Batched writer commit callback failed: {e}")
+
+    def _commit_rows(self, batch: List[tuple]):
+        """Store each row on its own; a failing statement only rolls back itself"""
+        failures = []
+        try:
+            with self.pool.write() as conn:
+                for sql, params in batch:
+                    try:
+                        conn.execute(sql, params)
+                    except sqlite3.Error as e:
+                        failures.append((sql, params, e))
+        except sqlite3.Error as e:
+            failures = [(sql, params, e) for sql, params in batch]
+
+        if failures:
+            logger.error(f"❌ {len(failures)} of {len(batch)} batched rows to {self.pool.db_path} "
+                         f"failed: {failures[-1][2]}")
+            with self._failures_lock:
+                self._failed_count += len(failures)
+                self._failures = (self._failures + failures)[-FAILED_ROWS_KEPT:]
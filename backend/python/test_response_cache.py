@@ -0,0 +1,92 @@
+"""
+Tests for the status response cache (TTL, invalidate-on-write, ETags)
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from flask import Flask
+    from response_cache import ResponseCache, cached_json_response
+    CACHE_AVAILABLE = True
+except ImportError as e:
+    CACHE_AVAILABLE = False
+    IMPORT_ERROR = str(e)
+
+
+class TestResponseCache(unittest.TestCase):
+    """Cached payloads are reused until they expire or a write invalidates them."""
+
+    def setUp(self):
+        if not CACHE_AVAILABLE:
+            self.skipTest(f"Flask not available: {IMPORT_ERROR}")
+        self.computed = 0
+        self.value = "steady"
+
+    def compute(self):
+        self.computed += 1
+        return {
+            "value": self.value,
+            "data": {"system_uptime": str(self.computed)},
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def test_entry_is_reused_until_invalidated(self):
+        cache = ResponseCache(ttl_seconds=60)
+        first = cache.get("status", self.compute)
+        self.assertIs(cache.get("status", self.compute), first)
+        self.assertEqual(self.computed, 1)
+
+        cache.invalidate()
+        cache.get("status", self.compute)
+        self.assertEqual(self.computed, 2)
+
+    def test_entry_expires_after_ttl(self):
+        cache = ResponseCache(ttl_seconds=0)
+        cache.get("status", self.compute)
+        cache.get("status", self.compute)
+        self.assertEqual(self.computed, 2)
+
+    def test_volatile_fields_do_not_change_etag(self):
+        cache = ResponseCache(ttl_seconds=60)
+        volatile = ("timestamp", "data.system_uptime")
+        etag = cache.get("status", self.compute, volatile).etag
+
+        cache.invalidate()
+        self.assertEqual(cache.get("status", self.compute, volatile).etag, etag)
+
+        self.value = "changed"
+        cache.invalidate()
+        self.assertNotEqual(cache.get("status", self.compute, volatile).etag, etag)
+
+    def test_conditional_get_returns_304(self):
+        app = Flask(__name__)
+        cache = ResponseCache(ttl_seconds=60)
+
+        @app.route("/status")
+        def status():
+            return cached_json_response(cache, "status", self.compute,
+                                        volatile=("timestamp", "data.system_uptime"))
+
+        client = app.test_client()
+        first = client.get("/status")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["Cache-Control"], "no-cache")
+
+        cache.invalidate()
+        revalidated = client.get("/status", headers={"If-None-Match": first.headers["ETag"]})
+        self.assertEqual(revalidated.status_code, 304)
+
+        self.value = "changed"
+        cache.invalidate()
+        changed = client.get("/status", headers={"If-None-Match": first.headers["ETag"]})
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.get_json()["value"], "changed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for keyset pagination of the /api/sessions listing
+"""
+
+import os
+import sqlite3
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from session_manager_api import _decode_cursor, _encode_cursor, _fetch_session_page
+    API_AVAILABLE = True
+except Exception as e:  # needs Flask and the API module's generated constants resolved
+    API_AVAILABLE = False
+    IMPORT_ERROR = str(e)
+
+COLUMNS = ["session_id", "timestamp"]
+
+
+class TestSessionPagination(unittest.TestCase):
+    """Paging through the listing returns every session exactly once, in listing order."""
+
+    def setUp(self):
+        if not API_AVAILABLE:
+            self.skipTest(f"session_manager_api not available: {IMPORT_ERROR}")
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE session_disks (session_id TEXT PRIMARY KEY, timestamp TEXT)")
+        # Every eighth session has no timestamp; several share a timestamp
+        self.conn.executemany("INSERT INTO session_disks VALUES (?, ?)", [
+            (f"s{i:05d}", None if i % 8 == 0 else f"2026-01-{1 + i % 28:02d}T00:00:00")
+            for i in range(57)
+        ])
+
+    def tearDown(self):
+        self.conn.close()
+
+    def listing(self):
+        return self.conn.execute(
+            "SELECT session_id, timestamp FROM session_disks ORDER BY timestamp DESC, session_id DESC"
+        ).fetchall()
+
+    def paginate(self, limit: int):
+        pages, after = [], None
+        while True:
+            page = _fetch_session_page(self.conn, COLUMNS, limit + 1, after)
+            pages.append(page[:limit])
+            if len(page) <= limit:
+                return pages
+            after = _decode_cursor(_encode_cursor(page[limit - 1][1], page[limit - 1][0]))
+
+    def test_pages_cover_listing_exactly_once(self):
+        for limit in (100, 57, 56, 10, 1):
+            with self.subTest(limit=limit):
+                pages = self.paginate(limit)
+                self.assertEqual([row for page in pages for row in page], self.listing())
+                self.assertTrue(all(0 < len(page) <= limit for page in pages))
+
+    def test_cursor_rejects_malformed_values(self):
+        with self.assertRaises(ValueError):
+            _decode_cursor(_encode_cursor(None, 42))
+
+
+if __name__ == '__main__':
+    unittest.main()
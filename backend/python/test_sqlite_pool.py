@@ -0,0 +1,130 @@
+"""
+Tests for the shared SQLite connection pool
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import sqlite_pool
+from sqlite_pool import BatchedWriter, BatchWriteError, SQLitePool, get_pool
+
+
+class TestSQLitePool(unittest.TestCase):
+    """Pooled readers, the serialized writer and per-file pool sharing."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "pool.db")
+        self.pool = SQLitePool(self.db_path, max_readers=2)
+        with self.pool.write() as conn:
+            conn.execute("CREATE TABLE items (name TEXT NOT NULL)")
+
+    def tearDown(self):
+        self.pool.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def count_items(self) -> int:
+        with self.pool.read() as conn:
+            return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def test_write_commits_and_rolls_back(self):
+        with self.pool.write() as conn:
+            conn.execute("INSERT INTO items VALUES ('kept')")
+
+        with self.assertRaises(RuntimeError):
+            with self.pool.write() as conn:
+                conn.execute("INSERT INTO items VALUES ('dropped')")
+                raise RuntimeError("abort")
+
+        self.assertEqual(self.count_items(), 1)
+
+    def test_readers_are_query_only(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            with self.pool.read() as conn:
+                conn.execute("INSERT INTO items VALUES ('nope')")
+
+    def test_readers_are_bounded_and_reused(self):
+        borrowed = []
+        with self.pool.read() as first, self.pool.read() as second:
+            borrowed = [first, second]
+            waiter = threading.Thread(target=self.count_items)
+            waiter.start()
+            waiter.join(0.2)
+            # Both readers are out, so a third read waits instead of opening one
+            self.assertTrue(waiter.is_alive())
+        waiter.join(5)
+
+        self.assertFalse(waiter.is_alive())
+        with self.pool.read() as conn:
+            self.assertIn(conn, borrowed)
+
+    def test_get_pool_shares_one_pool_per_file(self):
+        pool = get_pool(self.db_path)
+        self.assertIs(get_pool(os.path.join(self.tmpdir, ".", "pool.db")), pool)
+        with sqlite_pool._pools_lock:
+            sqlite_pool._pools.pop(str(os.path.realpath(self.db_path)), None)
+        pool.close()
+
+
+class TestBatchedWriter(unittest.TestCase):
+    """Group commits keep valid rows and report the ones that failed."""
+
+    INSERT = "INSERT INTO items VALUES (?)"
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.pool = SQLitePool(os.path.join(self.tmpdir, "writer.db"))
+        with self.pool.write() as conn:
+            conn.execute("CREATE TABLE items (name TEXT NOT NULL)")
+        self.commits = 0
+        self.writer = BatchedWriter(self.pool, on_commit=self.count_commit)
+
+    def tearDown(self):
+        self.writer.close()
+        self.pool.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def count_commit(self):
+        self.commits += 1
+
+    def stored_names(self):
+        with self.pool.read() as conn:
+            return [name for name, in conn.execute("SELECT name FROM items ORDER BY rowid")]
+
+    def test_flush_commits_everything_submitted(self):
+        for i in range(50):
+            self.writer.submit(self.INSERT, (f"row {i}",))
+
+        self.assertTrue(self.writer.flush())
+        self.assertEqual(self.stored_names(), [f"row {i}" for i in range(50)])
+        self.assertGreaterEqual(self.commits, 1)
+
+    def test_failing_row_does_not_discard_batch(self):
+        for i in range(20):
+            self.writer.submit(self.INSERT, (f"row {i}",))
+        self.writer.submit(self.INSERT, (None,))
+
+        with self.assertRaises(BatchWriteError) as raised:
+            self.writer.flush()
+
+        self.assertEqual(raised.exception.failed_count, 1)
+        self.assertEqual(raised.exception.failures[0][1], (None,))
+        self.assertEqual(self.stored_names(), [f"row {i}" for i in range(20)])
+        # Failures are reported once
+        self.assertTrue(self.writer.flush())
+
+    def test_close_commits_queued_rows(self):
+        self.writer.submit(self.INSERT, ("last",))
+        self.writer.close()
+        self.assertEqual(self.stored_names(), ["last"])
+
+
+if __name__ == '__main__':
+    unittest.main()